@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Compares assembling chord sequences in one preallocated buffer with
+# growing output by repeated concatenation.
+#
+# Run from the project directory:
+#     python3 -m benchmarks.chords_benchmark
+# or directly:
+#     python3 benchmarks/chords_benchmark.py
+
+import os
+import random
+import sys
+import timeit
+
+import numpy as np
+
+# Make project modules importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notes.chord_generator import ChordGenerator
+from synthesis.synthesizer import Synthesizer
+
+SAMPLING_FREQUENCY = 44100
+VOICE_LENGTH = 50
+CHORD_SIZE = 5
+REPEATS = 5
+
+
+def concatenate_chords_up(synthesizer:Synthesizer, chords:list) -> np.array:
+    """
+    Previous implementation of Synthesizer.generate_chords_up.
+    """
+    output = np.zeros(0)
+    for chord in chords:
+        for i in range(chord.get_size()):
+            output = np.concatenate([
+                output,
+                synthesizer.generate_pitch(chord.get_pitch(i), 0.4)
+            ])
+    return output
+
+
+def concatenate_chords_together(synthesizer:Synthesizer, chords:list) -> np.array:
+    """
+    Previous implementation of Synthesizer.generate_chords_together.
+    """
+    output = np.zeros(0)
+    for chord in chords:
+        chord_signal = np.zeros(int(
+            SAMPLING_FREQUENCY*0.4*chord.get_size()
+        ))
+        for i in range(chord.get_size()):
+            chord_signal += synthesizer.generate_pitch(
+                chord.get_pitch(i),
+                0.4*chord.get_size()
+            )
+        output = np.concatenate([output, chord_signal])
+    return output
+
+
+def measure(method) -> float:
+    return min(timeit.repeat(method, number=1, repeat=REPEATS))
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    chord_generator = ChordGenerator(chord_size=CHORD_SIZE)
+    chords = [chord_generator.generate_chord() for i in range(VOICE_LENGTH)]
+    synthesizer = Synthesizer(SAMPLING_FREQUENCY)
+
+    # Render all notes once, so that mostly assembly is measured
+    synthesizer.generate_chords_up(chords)
+    synthesizer.generate_chords_together(chords)
+
+    print('voice_length=' + str(VOICE_LENGTH) + ', chord_size=' + str(CHORD_SIZE))
+    for name, preallocated, concatenated in [
+        (
+            'generate_chords_up',
+            lambda: synthesizer.generate_chords_up(chords),
+            lambda: concatenate_chords_up(synthesizer, chords)
+        ),
+        (
+            'generate_chords_together',
+            lambda: synthesizer.generate_chords_together(chords),
+            lambda: concatenate_chords_together(synthesizer, chords)
+        )
+    ]:
+        preallocated_time = measure(preallocated)
+        concatenated_time = measure(concatenated)
+        print(
+            name + ': '\
+            + 'preallocated ' + '%.1f' % (1000*preallocated_time) + ' ms, '\
+            + 'concatenated ' + '%.1f' % (1000*concatenated_time) + ' ms, '\
+            + 'speedup ' + '%.1f' % (concatenated_time/preallocated_time) + 'x'
+        )
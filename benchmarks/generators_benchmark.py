@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Compares generating examples one by one with generating them
+# in batches as arrays of cents.
+#
+# Run from the project directory:
+#     python3 -m benchmarks.generators_benchmark
+# or directly:
+#     python3 benchmarks/generators_benchmark.py
+
+import os
+import sys
+import timeit
+
+# Make project modules importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notes.chord_generator import ChordGenerator
+from notes.interval import Interval
+from notes.interval_generator import IntervalGenerator
+from notes.microtonal_interval_generator import MicrotonalIntervalGenerator
+from notes.pitch import Pitch
+from notes.scale import Scale
+
+LOOP_NUMBER = 2000
+BATCH_NUMBER = 10**6
+REPEATS = 3
+
+# Scales of few pitches and of thousands of pitches in range
+SCALE_TYPES = ('31-TET (A=440Hz)', '1200-EDO (A=440Hz)')
+
+
+def measure(method) -> float:
+    return min(timeit.repeat(method, number=1, repeat=REPEATS))
+
+
+if __name__ == "__main__":
+    cases = list()
+    for scale_type in SCALE_TYPES:
+        interval_generator = IntervalGenerator(
+            scale=Scale.get_shared(scale_type),
+            lowest_pitch=Pitch.from_name('C2'),
+            highest_pitch=Pitch.from_name('C6'),
+            smallest_interval=Interval.from_name('unison'),
+            largest_interval=Interval.from_name('octave')
+        )
+        chord_generator = ChordGenerator(
+            scale=Scale.get_shared(scale_type),
+            chord_size=4
+        )
+        cases += [
+            (
+                'IntervalGenerator (' + scale_type + ')',
+                lambda generator=interval_generator: [
+                    generator.generate_interval()
+                    for i in range(LOOP_NUMBER)
+                ],
+                lambda generator=interval_generator:
+                    generator.generate_intervals(BATCH_NUMBER)
+            ),
+            (
+                'ChordGenerator (' + scale_type + ')',
+                lambda generator=chord_generator: [
+                    generator.generate_chord()
+                    for i in range(LOOP_NUMBER)
+                ],
+                lambda generator=chord_generator:
+                    generator.generate_chords(BATCH_NUMBER)
+            )
+        ]
+    microtonal_interval_generator = MicrotonalIntervalGenerator()
+    cases.append((
+        'MicrotonalIntervalGenerator',
+        lambda: [
+            microtonal_interval_generator.generate_interval()
+            for i in range(LOOP_NUMBER)
+        ],
+        lambda: microtonal_interval_generator.generate_intervals(BATCH_NUMBER)
+    ))
+    for name, loop_method, batch_method in cases:
+        loop_rate = LOOP_NUMBER/measure(loop_method)
+        batch_rate = BATCH_NUMBER/measure(batch_method)
+        print(
+            name + ': one by one ' + '%.0f' % loop_rate + ' examples/s, '\
+            + 'batch ' + '%.0f' % batch_rate + ' examples/s '\
+            + '(' + '%.1f' % (batch_rate/loop_rate) + 'x)'
+        )
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Compares converting pitches with Pitch objects one by one
+# with converting them at once with PitchArray.
+#
+# Run from the project directory:
+#     python3 -m benchmarks.pitch_array_benchmark
+# or directly:
+#     python3 benchmarks/pitch_array_benchmark.py
+
+import os
+import sys
+import timeit
+
+# Make project modules importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notes.chord_generator import ChordGenerator
+from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
+from notes.scale import Scale
+
+CHORD_NUMBER = 10**5
+REPEATS = 3
+
+
+def measure(method) -> float:
+    return min(timeit.repeat(method, number=1, repeat=REPEATS))
+
+
+if __name__ == "__main__":
+    chords = ChordGenerator(
+        scale=Scale.get_shared('31-TET (A=440Hz)'),
+        chord_size=4
+    ).generate_chords(CHORD_NUMBER)
+    pitches = chords.get_pitches()
+    names = [
+        name + str(octave)
+        for octave in range(8)
+        for name in Pitch.NAME_OFFSETS
+    ]*100
+    for name, loop_method, array_method in [
+        (
+            'frequencies',
+            lambda: [pitch.get_frequency() for pitch in pitches],
+            lambda: chords.get_frequencies()
+        ),
+        (
+            'midi pitches',
+            lambda: [pitch.get_midi_pitch() for pitch in pitches],
+            lambda: chords.get_midi_pitches()
+        ),
+        (
+            'names',
+            lambda: [Pitch.from_name(name) for name in names],
+            lambda: PitchArray.from_names(names)
+        )
+    ]:
+        loop_time = measure(loop_method)
+        array_time = measure(array_method)
+        print(
+            name + ': Pitch ' + '%.4f' % loop_time + ' s, '\
+            + 'PitchArray ' + '%.4f' % array_time + ' s '\
+            + '(' + '%.1f' % (loop_time/array_time) + 'x)'
+        )
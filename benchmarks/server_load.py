@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Simulates many users of exercise server and reports latency percentiles
+# of every endpoint. Every user creates a session and repeatedly generates
+# an example, downloads its audio and answers it.
+#
+# Run from the project directory:
+#     python3 -m benchmarks.server_load --users 20 --examples 10
+# or directly:
+#     python3 benchmarks/server_load.py --users 20 --examples 10
+# Server is started in this process if --url is not given.
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import urllib.parse
+
+import numpy as np
+
+# Make project modules importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.exercise_server import ExerciseServer
+
+
+class Connection:
+    def __init__(self, host:str, port:int):
+        """
+        Keep-alive HTTP connection with the server.
+
+        :host: Server address.
+        :port: Server port.
+        """
+        self._host = host
+        self._port = port
+        self._reader = None
+        self._writer = None
+
+    async def request(self, method:str, path:str, data=None) -> (int, bytes):
+        """
+        Send request and read whole response.
+
+        :method: HTTP method.
+        :path: Request path.
+        :data: Object sent as JSON body or None.
+
+        :returns: Status code, Response body.
+        """
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self._host,
+                self._port
+            )
+        body = json.dumps(data).encode('utf-8') if data is not None else b''
+        self._writer.write((
+            method + ' ' + path + ' HTTP/1.1\r\n'\
+            + 'Host: ' + self._host + '\r\n'\
+            + 'Content-Length: ' + str(len(body)) + '\r\n\r\n'
+        ).encode('latin-1') + body)
+        await self._writer.drain()
+
+        # Read headers
+        status = int((await self._reader.readline()).split()[1])
+        headers = dict()
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        # Read body
+        if headers.get('transfer-encoding') == 'chunked':
+            chunks = list()
+            while True:
+                size = int((await self._reader.readline()).strip(), 16)
+                chunk = await self._reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                chunks.append(chunk[:-2])
+            return status, b''.join(chunks)
+        length = int(headers.get('content-length', 0))
+        return status, await self._reader.readexactly(length)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+async def run_user(
+    host:str,
+    port:int,
+    exercise:str,
+    examples:int,
+    latencies:dict
+):
+    """
+    Simulate one user of the server.
+
+    :host: Server address.
+    :port: Server port.
+    :exercise: Name of the exercise.
+    :examples: Number of answered examples.
+    :latencies: Dictionary of latency lists of every endpoint, filled in place.
+    """
+    connection = Connection(host, port)
+
+    async def request(name:str, method:str, path:str, data=None) -> bytes:
+        start = time.perf_counter()
+        status, body = await connection.request(method, path, data)
+        latencies[name].append(time.perf_counter() - start)
+        if status >= 300:
+            raise RuntimeError(name + ' failed with status ' + str(status) + ': '\
+                + body.decode('utf-8', 'replace'))
+        return body
+
+    try:
+        response = json.loads(await request(
+            'create session',
+            'POST',
+            '/sessions',
+            {'exercise': exercise}
+        ))
+        session = response['session']
+
+        # Voices exercise is answered by pitches of every chord
+        answer = 0.0
+        if exercise == 'voices':
+            answer = [
+                [0.0]
+                for chord in range(int(response['settings']['voice_length']))
+            ]
+        for index in range(examples):
+            await request('new example', 'POST', '/sessions/' + session + '/examples')
+            await request('audio', 'GET', '/sessions/' + session + '/audio')
+            await request(
+                'answer',
+                'POST',
+                '/sessions/' + session + '/answers',
+                {'answer': answer}
+            )
+        await request('delete session', 'DELETE', '/sessions/' + session)
+    finally:
+        connection.close()
+
+
+async def run(args):
+    server = None
+    if args.url is None:
+        server = ExerciseServer(port=0, workers=args.workers)
+        await server.start()
+        host, port = '127.0.0.1', server.get_port()
+    else:
+        url = urllib.parse.urlparse(args.url)
+        host, port = url.hostname, url.port or 80
+    latencies = {
+        name: list()
+        for name in ['create session', 'new example', 'audio', 'answer', 'delete session']
+    }
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*[
+            run_user(host, port, args.exercise, args.examples, latencies)
+            for user in range(args.users)
+        ])
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.stop()
+
+    print(
+        'users=' + str(args.users)\
+        + ', examples=' + str(args.examples)\
+        + ', exercise=' + args.exercise\
+        + ', time=' + '%.2f' % elapsed + ' s'
+    )
+    print('{:<16}{:>8}{:>10}{:>10}{:>10}{:>10}'.format(
+        'endpoint', 'count', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms'
+    ))
+    for name, values in latencies.items():
+        if len(values) == 0:
+            continue
+        p50, p90, p99 = 1000*np.percentile(values, [50, 90, 99])
+        print('{:<16}{:>8}{:>10.1f}{:>10.1f}{:>10.1f}{:>10.1f}'.format(
+            name, len(values), p50, p90, p99, 1000*max(values)
+        ))
+    print('Answered ' + '%.1f' % (args.users*args.examples/elapsed) + ' examples/s.')
+    if server is not None:
+        render_cache = server.get_render_cache()
+        print(
+            'Render cache: ' + str(render_cache.get_hits()) + ' hits, '\
+            + str(render_cache.get_misses()) + ' misses.'
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='Measure latency of exercise server under load.'
+    )
+    parser.add_argument(
+        '--url',
+        default=None,
+        help='Address of running server, e.g. "http://127.0.0.1:8080". '\
+            + 'Server is started in this process if not given.'
+    )
+    parser.add_argument(
+        '-u', '--users',
+        type=int,
+        default=10,
+        help='Number of simultaneous users.'
+    )
+    parser.add_argument(
+        '-n', '--examples',
+        type=int,
+        default=5,
+        help='Number of examples answered by every user.'
+    )
+    parser.add_argument(
+        '-e', '--exercise',
+        choices=['intervals', 'microtones', 'detuning', 'ten_o_pitches', 'voices'],
+        default='intervals',
+        help='Exercise used by users.'
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=None,
+        help='Number of worker threads of started server.'
+    )
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(run(parser.parse_args()))
+    finally:
+        loop.close()
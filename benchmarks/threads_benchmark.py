@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Compares generating long notes by one thread with generating
+# their sample range chunks by several threads.
+#
+# Run from the project directory:
+#     python3 -m benchmarks.threads_benchmark
+# or directly:
+#     python3 benchmarks/threads_benchmark.py
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+# Make project modules importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthesis.saw_synthesizer import SawSynthesizer
+from synthesis.sine_synthesizer import SineSynthesizer
+from synthesis.triangle_synthesizer import TriangleSynthesizer
+
+SAMPLING_FREQUENCY = 192000
+TIME = 10
+FREQUENCY = 440.0
+CHORD_FREQUENCIES = np.array([110.0, 220.0, 330.0, 440.0, 550.0])
+REPEATS = 5
+THREADS = sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+def measure(method) -> float:
+    return min(timeit.repeat(method, number=1, repeat=REPEATS))
+
+
+if __name__ == "__main__":
+    print(
+        'sampling_frequency=' + str(SAMPLING_FREQUENCY)\
+        + ', time=' + str(TIME)\
+        + ', cpu_count=' + str(os.cpu_count())
+    )
+    for synthesizer_class in [SineSynthesizer, TriangleSynthesizer, SawSynthesizer]:
+        synthesizer = synthesizer_class(SAMPLING_FREQUENCY, np.float32)
+        for name, method in [
+            (
+                'generate_frequency',
+                lambda: synthesizer.generate_frequency(FREQUENCY, TIME)
+            ),
+            (
+                'generate_frequencies',
+                lambda: synthesizer.generate_frequencies(CHORD_FREQUENCIES, TIME)
+            )
+        ]:
+            times = list()
+            for threads in THREADS:
+                synthesizer.threads = threads
+                times.append(measure(method))
+            print(
+                synthesizer_class.__name__ + '.' + name + ': ' + ', '.join(
+                    str(threads) + ' threads ' + '%.1f' % (1000*time) + ' ms '\
+                    + '(' + '%.1f' % (times[0]/time) + 'x)'
+                    for threads, time in zip(THREADS, times)
+                )
+            )
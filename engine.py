@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+
+import numpy as np
+
+from exercises.exercise_engine import ExerciseEngine
+from exercises.exercise_settings import ExerciseSettings
+
+def generate(engine:ExerciseEngine, number:int, render:bool):
+    """
+    Write correct answers of new examples to standard output as JSON lines.
+
+    :engine: Exercise engine.
+    :number: Number of examples.
+    :render: If signals of the examples should be rendered.
+    """
+    # Anything else printed while generating goes to standard error,
+    # so that standard output has only JSON lines
+    output = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        _generate(engine, number, render, output)
+
+
+def _generate(engine:ExerciseEngine, number:int, render:bool, output):
+    start = time.perf_counter()
+    for index in range(number):
+        line = {
+            'index': index,
+            'answer': engine.generate_example(),
+            'id': engine.get_example_id()
+        }
+        if render:
+            signal = engine.render_example()
+            line['length'] = len(signal)
+            line['peak'] = float(np.max(np.abs(signal))) if len(signal) > 0 else 0.0
+        print(json.dumps(line), file=output)
+    elapsed = time.perf_counter() - start
+    print(
+        'Generated ' + str(number) + ' examples in ' + '%.3f' % elapsed + ' s ('\
+        + '%.0f' % (number/max(elapsed, 1e-9)) + ' examples/s).',
+        file=sys.stderr
+    )
+
+
+def grade(engine:ExerciseEngine):
+    """
+    Grade answers read from standard input as JSON lines
+    with 'example' (correct answer of the example) and 'answer' fields.
+    Results are written to standard output as JSON lines.
+
+    :engine: Exercise engine.
+    """
+    output = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        for line in sys.stdin:
+            if line.strip():
+                task = json.loads(line)
+                print(
+                    json.dumps(engine.grade(task['answer'], task['example'])),
+                    file=output
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate examples and grade answers without GUI and audio device.'
+    )
+    parser.add_argument(
+        'command',
+        choices=['generate', 'grade'],
+        help='"generate" writes answers of new examples as JSON lines, '\
+            + '"grade" grades JSON lines with "example" and "answer" fields.'
+    )
+    parser.add_argument(
+        'exercise',
+        choices=sorted(ExerciseSettings.EXERCISES),
+        help='Exercise to use.'
+    )
+    parser.add_argument(
+        '-n', '--number',
+        type=int,
+        default=10,
+        help='Number of generated examples.'
+    )
+    parser.add_argument(
+        '-s', '--setting',
+        action='append',
+        default=list(),
+        metavar='NAME=VALUE',
+        help='Exercise setting as shown in settings window, '\
+            + 'e.g. "play_type=Upwards with hold". Can be repeated.'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed of random generators. Random if not given.'
+    )
+    parser.add_argument(
+        '--render',
+        action='store_true',
+        help='Render signals of generated examples.'
+    )
+    args = parser.parse_args()
+
+    try:
+        settings = dict(
+            ExerciseSettings.parse_setting(setting)
+            for setting in args.setting
+        )
+        engine = ExerciseEngine(args.exercise, settings, args.seed)
+    except (ValueError, RuntimeError) as error:
+        parser.error(str(error))
+
+    if args.command == 'generate':
+        generate(engine, args.number, args.render)
+    else:
+        grade(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import numpy as np
 import random
 
+import numpy as np
+
+from exercises.exercise import Exercise
 from notes.chord import Chord
 from notes.chord_generator import ChordGenerator
 from notes.pitch import Pitch
 from notes.interval import Interval
 from notes.scale import Scale
-from synthesis.player import Player
-from synthesis.synthesizer import Synthesizer
+from synthesis.timeline import Timeline
 
 class DetuningExample:
     def __init__(self, detuning:float):
@@ -41,11 +42,12 @@ class DetuningExample:
         return self.detuning
 
 
-class DetuningExercise:
+class DetuningExercise(Exercise):
+    NAME = 'detuning'
+
     def __init__(self, sampling_frequency:int):
-        # exercise settings
-        self._sampling_frequency = sampling_frequency
-        self._volume = None
+        super().__init__(sampling_frequency)
+
         self._play_type = None
         self._scale = None
         self._max_detuning = None
@@ -53,24 +55,9 @@ class DetuningExercise:
         self._highest_pitch = None
         self._smallest_interval = None
         self._largest_interval = None
-        self._synthesizer = Synthesizer(sampling_frequency)
-        self._possible_error = None
         self._chord_size = None
         self._voice_length = None
 
-        # other variables
-        self._actual_example = None
-        self._player = Player(sampling_frequency)
-
-    def set_sampling_frequency(self, sampling_frequency:int):
-        self._sampling_frequency = sampling_frequency
-        self._synthesizer.set_sampling_frequency(sampling_frequency)
-        self._player.set_sampling_frequency(sampling_frequency)
-
-    def set_volume(self, volume:float):
-        self._volume = volume
-        self._synthesizer.set_volume(volume)
-
     def set_play_type(self, play_type:str):
         self._play_type = play_type
 
@@ -92,18 +79,6 @@ class DetuningExercise:
     def set_largest_interval(self, largest_interval:Interval):
         self._largest_interval = largest_interval
 
-    def set_synthesizer(self, synthesizer:type):
-        self._synthesizer = Synthesizer(
-            self._sampling_frequency,
-            synthesizer
-        )
-
-    def get_possible_error(self) -> float:
-        return self._possible_error
-
-    def set_possible_error(self, possible_error:float):
-        self._possible_error = possible_error
-
     def get_chord_size(self) -> int:
         return self._chord_size
 
@@ -116,13 +91,26 @@ class DetuningExercise:
     def set_voice_length(self, voice_length:int):
         self._voice_length = voice_length
 
-    def generate_new_example(self):
+    def _get_example_settings(self) -> list:
+        return [
+            self._play_type,
+            self._scale,
+            self._max_detuning,
+            self._lowest_pitch,
+            self._highest_pitch,
+            self._smallest_interval,
+            self._largest_interval,
+            self._chord_size,
+            self._voice_length
+        ]
+
+    def _generate_example(self, rng:random.Random) -> DetuningExample:
         # Choose detuning
-        actual_detuning = random.uniform(
+        actual_detuning = rng.uniform(
             0,
             min(
                 self._max_detuning,
-                1200/2/len(self._scale._pitches)
+                self._scale.get_period()/2/self._scale.get_size()
             )
         )
 
@@ -134,7 +122,8 @@ class DetuningExercise:
             possible_detune=0,
             smallest_interval=self._smallest_interval,
             largest_interval=self._largest_interval,
-            chord_size=self._chord_size
+            chord_size=self._chord_size,
+            rng=rng
         )
         tuned_chords = list()
         for i in range(self._voice_length):
@@ -151,11 +140,10 @@ class DetuningExercise:
             )
         number_of_lowered_sounds = int(np.ceil(number_of_sounds/3))
         
-        lowered_or_unchanged_indices = np.random.choice(
-            np.arange(number_of_sounds),
-            2*number_of_lowered_sounds,
-            replace=False
-        )
+        lowered_or_unchanged_indices = np.array(rng.sample(
+            range(number_of_sounds),
+            2*number_of_lowered_sounds
+        ))
         lowered_indices = lowered_or_unchanged_indices[:number_of_lowered_sounds]
         unchanged_indices = lowered_or_unchanged_indices[number_of_lowered_sounds:]
         highened_indices = np.setdiff1d(
@@ -170,82 +158,79 @@ class DetuningExercise:
 
         # Detune chords
         for i in range(len(tuned_chords)):
-            for j in range(tuned_chords[i].get_size()):
-                if i*tuned_chords[i].get_size() + j in lowered_indices:
-                    tuned_chords[i]._pitches[j] = tuned_chords[i]._pitches[j].copy(
-                        detune=-actual_detuning
-                    )
-                elif i*tuned_chords[i].get_size() + j in highened_indices:
-                    tuned_chords[i]._pitches[j] = tuned_chords[i]._pitches[j].copy(
-                        detune=actual_detuning
-                    )
+            pitches = list(tuned_chords[i].get_pitches())
+            for j in range(len(pitches)):
+                if i*len(pitches) + j in lowered_indices:
+                    pitches[j] = pitches[j].copy(detune=-actual_detuning)
+                elif i*len(pitches) + j in highened_indices:
+                    pitches[j] = pitches[j].copy(detune=actual_detuning)
+            tuned_chords[i] = Chord(pitches)
 
         # Add chords to example
-        self._actual_example = DetuningExample(actual_detuning)
+        example = DetuningExample(actual_detuning)
         for i in range(len(tuned_chords)):
-            self._actual_example.add_chord(tuned_chords[i])
+            example.add_chord(tuned_chords[i])
+
+        return example
 
-    def play_example(self):
-        # Check exercise state
+    def get_example_answer(self) -> dict:
+        """
+        Get correct answer of actual example.
+        Pitches are given in cents away from A4 and intervals in cents.
+
+        :returns: Dictionary of correct values.
+        """
         if self._actual_example is None:
             raise RuntimeError(
-                '[VoicesExercise::play_example()] No example to play!'
+                '[DetuningExercise::get_example_answer()] No example generated!'
             )
+        return {
+            'detuning': self._actual_example.detuning,
+            'pitches': [
+                [
+                    chord.get_pitch(i).get_cents_from_a()
+                    for i in range(chord.get_size())
+                ]
+                for chord in self._actual_example.chords
+            ]
+        }
+
+    def _create_example(self, answer:dict):
+        example = DetuningExample(answer['detuning'])
+        for pitches in answer['pitches']:
+            example.add_chord(Chord(
+                [Pitch.from_cents_from_a(pitch) for pitch in pitches]
+            ))
+        return example
+
+    def _get_timeline(self, example:DetuningExample) -> Timeline:
         if self._play_type is None:
             raise RuntimeError(
-                '[VoicesExercise::play_example()] No play type chosen!'
+                '[DetuningExercise::get_example_timeline()] No play type chosen!'
             )
-
-        # Play
-        signal = np.zeros(0)
         if self._play_type == 'Upwards':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_up(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_up(
+                example.chords
             )
         elif self._play_type == 'Downwards':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_down(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_down(
+                example.chords
             )
         elif self._play_type == 'Upwards with hold':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_up_hold(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_up_hold(
+                example.chords
             )
         elif self._play_type == 'Downwards with hold':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_down_hold(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_down_hold(
+                example.chords
             )
         elif self._play_type == 'Together':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_together(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_together(
+                example.chords
             )
         else:
             raise RuntimeError(
-                '[VoicesExercise::play_example()] Unknown play type!'
+                '[DetuningExercise::get_example_timeline()] Unknown play type!'
             )
 
     def answer_example(self, answer:float) -> (bool, float):
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import random
+
+import numpy as np
+
+from notes.interval import Interval
+from notes.interval_scale import IntervalScale
+from notes.pitch import Pitch
+from notes.scale import Scale
+from synthesis.synthesizer import Synthesizer
+
+class ExampleBank:
+    # Version of bank files format
+    FORMAT_VERSION = 1
+
+    def __init__(self, path:str):
+        """
+        Pre-rendered examples of an exercise stored in one memory-mapped file.
+        Index file holds position, length and answer of every example.
+        Signals are read straight from the file, without copying them to memory.
+
+        :path: Path of bank files without extension ('.bin' for signals,
+            '.json' for index).
+        """
+        with open(path + '.json', 'r') as index_file:
+            index = json.load(index_file)
+        if index['version'] != self.FORMAT_VERSION:
+            raise ValueError(
+                '[ExampleBank::__init__(' + path + ')] '\
+                + 'Unsupported bank version ' + str(index['version']) + '!'
+            )
+        self._key = index['key']
+        self._sampling_frequency = index['sampling_frequency']
+        self._sample_format = index['sample_format']
+        self._offsets = np.array(index['offsets'], dtype=np.int64)
+        self._lengths = np.array(index['lengths'], dtype=np.int64)
+        self._answers = index['answers']
+        self._ids = index.get('ids', [None]*len(self._answers))
+        self._indices = {
+            example_id: i
+            for i, example_id in enumerate(self._ids)
+            if example_id is not None
+        }
+        if np.sum(self._lengths) > 0:
+            self._signals = np.memmap(
+                path + '.bin',
+                dtype=self._sample_format,
+                mode='r'
+            )
+        else:
+            self._signals = np.zeros(0, dtype=self._sample_format)
+
+    @staticmethod
+    def find(directory:str, key:str) -> 'ExampleBank':
+        """
+        Open bank of given key.
+
+        :directory: Directory with bank files.
+        :key: Key of exercise settings.
+
+        :returns: Bank or None if there is no bank for the key.
+        """
+        path = os.path.join(directory, key)
+        if not os.path.isfile(path + '.json'):
+            return None
+        return ExampleBank(path)
+
+    @staticmethod
+    def get_settings_key(exercise_name:str, *settings) -> str:
+        """
+        Get key of exercise settings. Examples generated with the same
+        settings are interchangeable, so they are stored in the same bank.
+
+        :exercise_name: Name of the exercise.
+        :settings: Settings the examples depend on.
+
+        :returns: Key of the settings.
+        """
+        description = json.dumps(
+            [ExampleBank._describe(setting) for setting in settings]
+        )
+        return exercise_name + '_' + hashlib.sha1(
+            description.encode('utf-8')
+        ).hexdigest()[:16]
+
+    @staticmethod
+    def get_example_id(key:str, seed:int, index:int) -> str:
+        """
+        Get identifier of example. Example of given settings, seed and index
+        is always generated the same, in any thread or process.
+
+        :key: Key of exercise settings.
+        :seed: Seed of examples.
+        :index: Index of the example.
+
+        :returns: Identifier of the example.
+        """
+        return key + '_' + hashlib.sha1(
+            (str(seed) + '_' + str(index)).encode('utf-8')
+        ).hexdigest()[:16]
+
+    @staticmethod
+    def get_example_rng(example_id:str) -> random.Random:
+        """
+        Get random generator the example is generated with.
+
+        :example_id: Identifier of the example.
+
+        :returns: Generator seeded with the identifier.
+        """
+        return random.Random(example_id)
+
+    @staticmethod
+    def _describe(setting):
+        if isinstance(setting, Pitch):
+            return setting.get_cents_from_a()
+        elif isinstance(setting, Interval):
+            return setting.get_cents()
+        elif isinstance(setting, Scale):
+            description = [
+                pitch.get_cents_from_a() for pitch in setting.get_base_pitches()
+            ] + [setting.get_detune()]
+
+            # Octave scales keep keys they had before periods were added
+            if setting.get_period() != 1200:
+                description.append(setting.get_period())
+            return description
+        elif isinstance(setting, IntervalScale):
+            return [interval.get_cents() for interval in setting.get_intervals()]\
+                + [setting.get_detune()]
+        elif isinstance(setting, Synthesizer):
+            return [
+                setting.get_base_synthesizer().__name__,
+                setting.get_sampling_frequency(),
+                setting.get_volume(),
+                setting.get_sample_format()
+            ]
+        elif isinstance(setting, np.generic):
+            return setting.item()
+        return setting
+
+    def get_key(self) -> str:
+        return self._key
+
+    def get_size(self) -> int:
+        return len(self._answers)
+
+    def get_sampling_frequency(self) -> int:
+        return self._sampling_frequency
+
+    def get_sample_format(self) -> str:
+        return self._sample_format
+
+    def get_example(self, index:int) -> (np.array, dict):
+        """
+        Get example of given index.
+
+        :index: Index of the example.
+
+        :returns: Read-only signal of the example, Answer of the example.
+        """
+        start = self._offsets[index]
+        return (
+            self._signals[start:start + self._lengths[index]],
+            self._answers[index]
+        )
+
+    def get_random_example(self, rng=random) -> (np.array, dict):
+        """
+        Get randomly chosen example.
+
+        :rng: Random generator choosing the example.
+
+        :returns: Read-only signal of the example, Answer of the example.
+        """
+        if self.get_size() == 0:
+            raise RuntimeError(
+                '[ExampleBank::get_random_example()] Bank is empty!'
+            )
+        return self.get_example(rng.randrange(self.get_size()))
+
+    def choose_example(self, example_id:str) -> (str, np.array, dict):
+        """
+        Get example of given identifier. If the bank does not store it,
+        example chosen by generator of the identifier is returned instead.
+
+        :example_id: Identifier of the example.
+
+        :returns: Identifier of returned example, Read-only signal of the example,
+            Answer of the example.
+        """
+        if example_id in self._indices:
+            index = self._indices[example_id]
+        else:
+            if self.get_size() == 0:
+                raise RuntimeError(
+                    '[ExampleBank::choose_example()] Bank is empty!'
+                )
+            index = ExampleBank.get_example_rng(example_id).randrange(
+                self.get_size()
+            )
+        signal, answer = self.get_example(index)
+        if self._ids[index] is not None:
+            example_id = self._ids[index]
+        return example_id, signal, answer
+
+
+class ExampleBankWriter:
+    def __init__(
+        self,
+        directory:str,
+        key:str,
+        sampling_frequency:int,
+        sample_format:str
+    ):
+        """
+        Writer of example bank. Examples are appended to temporary signals
+        file one by one. Index is written on close and both files replace
+        the previous bank at once, so banks are never installed half written
+        and banks already memory-mapped by exercises are not changed.
+
+        :directory: Directory of bank files.
+        :key: Key of exercise settings.
+        :sampling_frequency: Sampling rate of examples in hertz.
+        :sample_format: Format of stored samples.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._path = os.path.join(directory, key)
+        self._index = {
+            'version': ExampleBank.FORMAT_VERSION,
+            'key': key,
+            'sampling_frequency': sampling_frequency,
+            'sample_format': sample_format,
+            'offsets': list(),
+            'lengths': list(),
+            'answers': list(),
+            'ids': list()
+        }
+        self._dtype = np.dtype(sample_format)
+        self._offset = 0
+        self._temporary_path = self._path + '.' + str(os.getpid()) + '.tmp'
+        self._file = open(self._temporary_path + '.bin', 'wb')
+
+    def add_example(self, signal:np.array, answer:dict, example_id=None):
+        """
+        Append example to the bank.
+
+        :signal: Signal of the example.
+        :answer: Answer of the example.
+        :example_id: Identifier of the example or None if it is unknown.
+        """
+        signal = np.ascontiguousarray(signal, dtype=self._dtype)
+        self._file.write(signal.tobytes())
+        self._index['offsets'].append(self._offset)
+        self._index['lengths'].append(len(signal))
+        self._index['answers'].append(answer)
+        self._index['ids'].append(example_id)
+        self._offset += len(signal)
+
+    def close(self):
+        """
+        Write index and install the bank.
+        """
+        self._file.close()
+        try:
+            with open(self._temporary_path + '.json', 'w') as index_file:
+                json.dump(self._index, index_file)
+            os.replace(self._temporary_path + '.bin', self._path + '.bin')
+            os.replace(self._temporary_path + '.json', self._path + '.json')
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self):
+        """
+        Remove written examples and keep the previous bank.
+        """
+        self._file.close()
+        for extension in ('.bin', '.json'):
+            try:
+                os.remove(self._temporary_path + extension)
+            except OSError:
+                pass
+
+    def __enter__(self) -> 'ExampleBankWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
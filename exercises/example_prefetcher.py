@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import concurrent.futures
+import threading
+
+import numpy as np
+
+class PreparedExample:
+    def __init__(
+        self,
+        key:str,
+        example,
+        signal=None,
+        memory_flush=False,
+        example_id=None
+    ):
+        """
+        Example generated ahead of being set as actual one.
+
+        :key: Key of settings the example was generated with.
+        :example: Example object of the exercise.
+        :signal: Rendered signal of the example or None if it was not rendered.
+        :memory_flush: If signal starts with memory flush.
+        :example_id: Identifier the example can be generated again with.
+        """
+        self._key = key
+        self._example_id = example_id
+        self._example = example
+        self._signal = signal
+        self._memory_flush = memory_flush
+
+    def get_key(self) -> str:
+        return self._key
+
+    def get_example_id(self) -> str:
+        return self._example_id
+
+    def get_example(self):
+        return self._example
+
+    def get_signal(self) -> np.array:
+        return self._signal
+
+    def has_memory_flush(self) -> bool:
+        return self._memory_flush
+
+
+class ExamplePrefetcher:
+    def __init__(self, exercise, **prepare_arguments):
+        """
+        Prepares next example of the exercise in background thread,
+        while the actual one is being answered.
+        Prepared example is discarded if settings changed in the meantime.
+        Next example can be taken in any thread.
+
+        :exercise: Exercise object.
+        :prepare_arguments: Arguments passed to exercise.prepare_example().
+        """
+        self._exercise = exercise
+        self._prepare_arguments = prepare_arguments
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._future = None
+        self._lock = threading.Lock()
+
+    def prefetch(self):
+        """
+        Start preparing next example, if it is not being prepared already.
+        """
+        with self._lock:
+            if self._future is None:
+                self._future = self._executor.submit(
+                    self._exercise.prepare_example,
+                    **self._prepare_arguments
+                )
+
+    def discard(self):
+        """
+        Drop prepared example.
+        """
+        with self._lock:
+            if self._future is not None:
+                self._future.cancel()
+                self._future = None
+
+    def get_next_example(self) -> PreparedExample:
+        """
+        Take prepared example, waiting for it if needed.
+        Example is prepared in place if there is no valid prepared one.
+
+        :returns: Prepared example.
+        """
+        with self._lock:
+            future = self._future
+            self._future = None
+        prepared_example = None
+        if future is not None and not future.cancelled():
+            try:
+                prepared_example = future.result()
+            except Exception:
+                # Settings changed during preparation, prepare again
+                prepared_example = None
+        if prepared_example is None\
+                or prepared_example.get_key() != self._exercise.get_example_key():
+            prepared_example = self._exercise.prepare_example(
+                **self._prepare_arguments
+            )
+        return prepared_example
+
+    def generate_new_example(self):
+        """
+        Set next example as actual one in the exercise and start
+        preparing the following one.
+        """
+        self._exercise.set_prepared_example(self.get_next_example())
+        self.prefetch()
+
+    def shutdown(self):
+        """
+        Drop prepared example and stop background thread.
+        """
+        self.discard()
+        self._executor.shutdown(wait=False)
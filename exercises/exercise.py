@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import abc
+import random
+import threading
+
+from exercises.example_bank import ExampleBank
+from exercises.example_prefetcher import PreparedExample
+from synthesis.player import Player
+from synthesis.synthesizer import Synthesizer
+from synthesis.timeline import Timeline
+
+class Exercise(abc.ABC):
+    # Name of the exercise in example bank keys
+    NAME = None
+
+    def __init__(self, sampling_frequency:int):
+        """
+        Base of exercises: synthesis, playback, seeded example identifiers
+        and example banks. Exercises define how examples are generated,
+        recreated from their answers and played.
+
+        :sampling_frequency: Sampling rate in hertz.
+        """
+        # exercise settings
+        self._sampling_frequency = sampling_frequency
+        self._volume = None
+        self._synthesizer = Synthesizer(sampling_frequency)
+        self._possible_error = None
+
+        self._streaming = False
+
+        # other variables
+        self._actual_example = None
+        self._example_signal = None
+        self._example_memory_flush = False
+        self._example_bank_directory = None
+        self._example_bank = None
+        self._seed = random.randrange(2**32)
+        self._example_index = 0
+        self._actual_example_id = None
+        self._player = Player(sampling_frequency)
+
+        # Settings are changed in GUI thread while examples are prepared
+        # and played in worker threads. Every rendering uses its own copy
+        # of the synthesizer taken under the lock and player is used
+        # only by playback, which applies player settings first.
+        self._lock = threading.Lock()
+        self._player_lock = threading.Lock()
+
+    def set_sampling_frequency(self, sampling_frequency:int):
+        with self._lock:
+            self._sampling_frequency = sampling_frequency
+            self._synthesizer.set_sampling_frequency(sampling_frequency)
+
+    def set_volume(self, volume:float):
+        with self._lock:
+            self._volume = volume
+            self._synthesizer.set_volume(volume)
+
+    def set_streaming(self, streaming:bool):
+        """
+        Set if examples should be rendered block by block while being played
+        instead of being rendered before playback.
+
+        :streaming: If persistent output stream should be used.
+        """
+        self._streaming = streaming
+
+    def is_streaming(self) -> bool:
+        return self._streaming
+
+    def set_synthesizer(self, synthesizer:type):
+        with self._lock:
+            self._synthesizer = Synthesizer(
+                self._sampling_frequency,
+                synthesizer
+            )
+
+    def get_synthesizer(self) -> Synthesizer:
+        return self._synthesizer
+
+    def get_possible_error(self) -> float:
+        return self._possible_error
+
+    def set_possible_error(self, possible_error:float):
+        self._possible_error = possible_error
+
+    def set_example_bank_directory(self, directory:str):
+        """
+        Set directory of example banks. Examples are drawn from the bank
+        of actual settings, if there is one, instead of being generated.
+
+        :directory: Directory with bank files or None to always generate examples.
+        """
+        with self._lock:
+            self._example_bank_directory = directory
+            self._example_bank = None
+
+    def get_example_key(self) -> str:
+        """
+        Get key of settings examples depend on.
+
+        :returns: Key of example bank for actual settings.
+        """
+        return ExampleBank.get_settings_key(
+            self.NAME,
+            self._synthesizer,
+            *self._get_example_settings()
+        )
+
+    def set_seed(self, seed:int):
+        """
+        Set seed of examples. Following examples are numbered from 0
+        and example of given seed and index is always generated the same.
+
+        :seed: Seed of examples.
+        """
+        with self._lock:
+            self._seed = seed
+            self._example_index = 0
+
+    def get_seed(self) -> int:
+        return self._seed
+
+    def get_example_id(self) -> str:
+        """
+        Get identifier of actual example.
+
+        :returns: Identifier or None if example was set from its answer.
+        """
+        return self._actual_example_id
+
+    def _take_example_id(self, key:str, index=None) -> str:
+        with self._lock:
+            if index is None:
+                index = self._example_index
+                self._example_index += 1
+            return ExampleBank.get_example_id(key, self._seed, index)
+
+    def generate_new_example(self):
+        self.set_prepared_example(self.prepare_example(render=False))
+
+    def prepare_example(
+        self,
+        render=True,
+        memory_flush=False,
+        index=None
+    ) -> PreparedExample:
+        """
+        Generate new example without changing actual one.
+        Can be called from worker thread.
+
+        :render: If signal of the example should be rendered.
+        :memory_flush: If rendered signal should start with memory flush.
+        :index: Index of the example for actual seed. Next index is used if None.
+
+        :returns: Prepared example.
+        """
+        with self._lock:
+            key = self.get_example_key()
+            synthesizer = self._synthesizer.copy()
+            bank = self._get_example_bank(key)
+        example_id = self._take_example_id(key, index)
+        rng = ExampleBank.get_example_rng(example_id)
+        if bank is not None:
+            example_id, signal, answer = bank.choose_example(example_id)
+            example = self._create_example(answer)
+            if not (render and memory_flush):
+                return PreparedExample(key, example, signal, example_id=example_id)
+        else:
+            example = self._generate_example(rng)
+
+        signal = None
+        if render:
+            signal = synthesizer.generate_timeline(
+                self.get_example_timeline(example, memory_flush, rng)
+            )
+        return PreparedExample(key, example, signal, memory_flush, example_id)
+
+    def set_prepared_example(self, prepared_example:PreparedExample):
+        self._actual_example = prepared_example.get_example()
+        self._example_signal = prepared_example.get_signal()
+        self._actual_example_id = prepared_example.get_example_id()
+        self._example_memory_flush = prepared_example.has_memory_flush()
+
+    def _get_example_bank(self, key:str) -> ExampleBank:
+        """
+        Get bank of the key. Must be called with the lock acquired.
+        """
+        if self._example_bank_directory is None:
+            return None
+        if self._example_bank is None or self._example_bank.get_key() != key:
+            self._example_bank = ExampleBank.find(
+                self._example_bank_directory,
+                key
+            )
+        if self._example_bank is None or self._example_bank.get_size() == 0:
+            return None
+        return self._example_bank
+
+    def set_example_answer(self, answer:dict):
+        """
+        Set actual example to the one of given correct answer.
+
+        :answer: Dictionary of correct values as returned by get_example_answer().
+        """
+        self._actual_example = self._create_example(answer)
+        self._example_signal = None
+        self._actual_example_id = None
+
+    def get_example_timeline(
+        self,
+        example=None,
+        memory_flush=False,
+        rng=random
+    ) -> Timeline:
+        """
+        Get timeline of the example.
+
+        :example: Example object or None for actual example.
+        :memory_flush: If random sounds should be played before the example.
+        :rng: Random generator of memory flush sounds.
+
+        :returns: Timeline of notes.
+        """
+        if example is None:
+            example = self._actual_example
+        if example is None:
+            raise RuntimeError(
+                '[' + self.__class__.__name__ + '::get_example_timeline()] '\
+                + 'No example to play!'
+            )
+        if not memory_flush:
+            return self._get_timeline(example)
+
+        # Add memory flush followed by a second of silence
+        timeline = Timeline()
+        flush = Timeline.memory_flush(
+            lowest_pitch=self._lowest_pitch,
+            highest_pitch=self._highest_pitch,
+            rng=rng
+        )
+        timeline.add_timeline(flush, 0)
+        timeline.add_timeline(self._get_timeline(example), flush.get_duration() + 1)
+        return timeline
+
+    def play_example(self, memory_flush=False):
+        """
+        Play actual example. Prepared signal is played if it matches.
+
+        :memory_flush: If random sounds should be played before the example.
+        """
+        with self._lock:
+            synthesizer = self._synthesizer.copy()
+            sampling_frequency = self._sampling_frequency
+            streaming = self._streaming
+        with self._player_lock:
+            if self._player.get_sampling_frequency() != sampling_frequency:
+                self._player.set_sampling_frequency(sampling_frequency)
+            self._player.set_streaming(streaming)
+            if self._example_signal is not None\
+                    and memory_flush == self._example_memory_flush:
+                self._player.play(self._example_signal)
+                return
+            timeline = self.get_example_timeline(memory_flush=memory_flush)
+            if streaming:
+                self._player.play_blocks(
+                    synthesizer.generate_timeline_blocks(timeline)
+                )
+            else:
+                self._player.play(synthesizer.generate_timeline(timeline))
+
+    @abc.abstractmethod
+    def _get_example_settings(self) -> list:
+        """
+        Get settings examples depend on, apart from synthesizer.
+
+        :returns: List of settings.
+        """
+
+    @abc.abstractmethod
+    def _generate_example(self, rng:random.Random):
+        """
+        Generate new example object.
+
+        :rng: Random generator of the example.
+
+        :returns: Example object.
+        """
+
+    @abc.abstractmethod
+    def _create_example(self, answer:dict):
+        """
+        Create example object of given correct answer.
+
+        :answer: Dictionary of correct values as returned by get_example_answer().
+
+        :returns: Example object.
+        """
+
+    @abc.abstractmethod
+    def _get_timeline(self, example) -> Timeline:
+        """
+        Get timeline of the example without memory flush.
+
+        :example: Example object.
+
+        :returns: Timeline of notes.
+        """
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+
+import numpy as np
+
+from exercises.exercise_settings import ExerciseSettings
+from exercises.voices_exercise import VoicesExercise
+
+class ExerciseEngine:
+    def __init__(self, exercise_name:str, settings=None, seed=None):
+        """
+        Exercise driven without GUI and audio device.
+        Generates examples, renders their signals and grades answers.
+
+        :exercise_name: Name of the exercise: 'intervals', 'voices', 'detuning',
+            'microtones' or 'ten_o_pitches'.
+        :settings: Dictionary of setting values as shown in settings windows.
+            Default values are used for missing settings or if None.
+        :seed: Seed of examples and synthesis. Examples of the same seed and index
+            are always the same. Random seed is used if None.
+        """
+        self._exercise_name = exercise_name
+        self._settings = ExerciseSettings.get_settings(exercise_name, settings)
+        self._exercise = ExerciseSettings.create_exercise(
+            exercise_name,
+            self._settings
+        )
+        if seed is not None:
+            self._exercise.set_seed(seed)
+
+            # Noise synthesizers use global generators
+            random.seed(seed)
+            np.random.seed(seed % 2**32)
+
+    def get_exercise_name(self) -> str:
+        return self._exercise_name
+
+    def get_settings(self) -> dict:
+        return dict(self._settings)
+
+    def get_exercise(self):
+        return self._exercise
+
+    def generate_example(self, index=None) -> dict:
+        """
+        Generate new example.
+
+        :index: Index of the example for exercise seed. Next index is used if None.
+
+        :returns: Correct answer of the example.
+        """
+        self._exercise.set_prepared_example(
+            self._exercise.prepare_example(render=False, index=index)
+        )
+        return self._exercise.get_example_answer()
+
+    def get_example_id(self) -> str:
+        """
+        Get identifier of actual example.
+
+        :returns: Identifier or None if example was set from its answer.
+        """
+        return self._exercise.get_example_id()
+
+    def generate_examples(self, number:int) -> list:
+        """
+        Generate several examples. The last one stays actual.
+
+        :number: Number of examples.
+
+        :returns: List of correct answers of the examples.
+        """
+        return [self.generate_example() for i in range(number)]
+
+    def set_example(self, example:dict):
+        """
+        Set actual example.
+
+        :example: Correct answer of the example as returned by generate_example().
+        """
+        self._exercise.set_example_answer(example)
+
+    def render_example(self) -> np.array:
+        """
+        Render signal of actual example.
+
+        :returns: Signal of the example.
+        """
+        return self._exercise.get_synthesizer().generate_timeline(
+            self._exercise.get_example_timeline()
+        )
+
+    def grade(self, answer, example=None) -> dict:
+        """
+        Grade answer to the example.
+
+        :answer: Answer in cents. List of answered pitches in cents
+            for every chord in voices exercise.
+        :example: Correct answer of the example. Actual example is graded if None.
+
+        :returns: Dictionary with 'correct' flag and correct 'value'.
+            Voices exercise also returns 'voices' flags for every pitch.
+        """
+        if example is not None:
+            self.set_example(example)
+        if isinstance(self._exercise, VoicesExercise):
+            # Exercise adds first note to the given lists
+            result = self._exercise.answer_example(
+                [[float(pitch) for pitch in chord] for chord in answer]
+            )
+            return {
+                'correct': all(all(chord) for chord in result.answers),
+                'voices': result.answers,
+                'value': self._exercise.get_example_answer()['pitches']
+            }
+        correct, value = self._exercise.answer_example(float(answer))
+        return {
+            'correct': bool(correct),
+            'value': value
+        }
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+
+from exercises.detuning_exercise import DetuningExercise
+from exercises.intervals_exercise import IntervalsExercise
+from exercises.microtones_exercise import MicrotonesExercise
+from exercises.ten_o_pitches_exercise import TenOPitchesExercise
+from exercises.voices_exercise import VoicesExercise
+from notes.interval import Interval
+from notes.interval_scale import IntervalScale
+from notes.pitch import Pitch
+from notes.scala_library import ScalaLibrary
+from notes.scale import Scale
+from notes.tuning_generator import TuningGenerator
+from synthesis.noise_synthesizer import NoiseSynthesizer
+from synthesis.saw_synthesizer import SawSynthesizer
+from synthesis.sine_synthesizer import SineSynthesizer
+from synthesis.square_synthesizer import SquareSynthesizer
+from synthesis.triangle_synthesizer import TriangleSynthesizer
+
+class ExerciseSettings:
+    # Exercise classes by name
+    EXERCISES = {
+        'intervals': IntervalsExercise,
+        'voices': VoicesExercise,
+        'detuning': DetuningExercise,
+        'microtones': MicrotonesExercise,
+        'ten_o_pitches': TenOPitchesExercise
+    }
+
+    # Synthesizer classes by setting value
+    SYNTHESIZERS = {
+        'Sine': SineSynthesizer,
+        'Saw': SawSynthesizer,
+        'Triangle': TriangleSynthesizer,
+        'Square': SquareSynthesizer,
+        'Noise': NoiseSynthesizer
+    }
+
+    # Directory of the application, so that data is found from any working directory
+    APPLICATION_DIRECTORY = os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))
+    )
+
+    # Directory of Scala scale files offered besides built-in scales
+    SCALA_DIRECTORY = os.path.join(APPLICATION_DIRECTORY, 'scales')
+
+    # Directory of example banks built by export.py
+    EXAMPLE_BANK_DIRECTORY = os.path.join(APPLICATION_DIRECTORY, 'banks')
+
+    # Settings of playback on audio device. They do not change examples,
+    # so they are left out of settings stored with examples.
+    PLAYBACK_SETTINGS = ['streaming']
+
+    # Default settings of every exercise, the same as in settings windows
+    DEFAULTS = {
+        'intervals': {
+            'volume': '1.0',
+            'synthesizer_type': 'Triangle',
+            'sampling_frequency': '44100',
+            'streaming': 'No',
+            'play_type': 'Upwards',
+            'scale': '12-TET (A=440Hz)',
+            'lowest_pitch': 'C0',
+            'highest_pitch': 'C5',
+            'smallest_interval': '0',
+            'largest_interval': '1200',
+            'possible_detune': '1',
+            'possible_error': '20'
+        },
+        'voices': {
+            'volume': '1.0',
+            'synthesizer_type': 'Triangle',
+            'sampling_frequency': '44100',
+            'streaming': 'No',
+            'play_type': 'Together',
+            'chord_size': '2',
+            'voice_length': '2',
+            'scale': '12-TET (A=440Hz)',
+            'lowest_pitch': 'C2',
+            'highest_pitch': 'C6',
+            'smallest_interval': '20',
+            'largest_interval': '4800',
+            'possible_detune': '1',
+            'possible_error': '20',
+            'if_first_note_provided': 'Yes'
+        },
+        'detuning': {
+            'volume': '1.0',
+            'synthesizer_type': 'Triangle',
+            'sampling_frequency': '44100',
+            'streaming': 'No',
+            'play_type': 'Together',
+            'chord_size': '2',
+            'voice_length': '4',
+            'scale': '12-TET (A=440Hz)',
+            'lowest_pitch': 'C2',
+            'highest_pitch': 'C6',
+            'smallest_interval': '20',
+            'largest_interval': '4800',
+            'max_detuning': '50',
+            'possible_error': '10'
+        },
+        'microtones': {
+            'volume': '1.0',
+            'synthesizer_type': 'Triangle',
+            'sampling_frequency': '44100',
+            'streaming': 'No',
+            'play_type': 'Upwards',
+            'interval_scale': 'Whole Tone Fractions',
+            'lowest_pitch': 'C3',
+            'highest_pitch': 'C4',
+            'possible_detune': '0.5',
+            'possible_error': '3'
+        },
+        'ten_o_pitches': {
+            'volume': '1.0',
+            'synthesizer_type': 'Triangle',
+            'sampling_frequency': '44100',
+            'streaming': 'No',
+            'scale': '12-TET (A=440Hz)',
+            'lowest_pitch': 'C0',
+            'highest_pitch': 'C8',
+            'possible_detune': '1',
+            'possible_error': '500'
+        }
+    }
+
+    @staticmethod
+    def create_exercise(exercise_name:str, settings=None):
+        """
+        Create exercise configured like in settings windows.
+
+        :exercise_name: Name of the exercise: 'intervals', 'voices', 'detuning',
+            'microtones' or 'ten_o_pitches'.
+        :settings: Dictionary of setting values as shown in settings windows.
+            Default values are used for missing settings or if None.
+
+        :returns: Exercise object.
+        """
+        settings = ExerciseSettings.get_settings(
+            exercise_name,
+            settings,
+            playback=True
+        )
+        exercise = ExerciseSettings.EXERCISES[exercise_name](
+            int(settings['sampling_frequency'])
+        )
+
+        # Synthesizer is set first, because changing it resets volume
+        ExerciseSettings.apply_setting(
+            exercise,
+            'synthesizer_type',
+            settings['synthesizer_type']
+        )
+        for name, value in settings.items():
+            if name != 'synthesizer_type':
+                ExerciseSettings.apply_setting(exercise, name, value)
+        return exercise
+
+    @staticmethod
+    def get_settings(exercise_name:str, settings=None, playback=False) -> dict:
+        """
+        Complete settings of the exercise with default values.
+
+        :exercise_name: Name of the exercise.
+        :settings: Dictionary of setting values as shown in settings windows.
+            Default values are used if None.
+        :playback: If playback settings should be included. They are left out
+            by default, so that settings can be stored with examples.
+
+        :returns: Dictionary of all setting values.
+        """
+        if exercise_name not in ExerciseSettings.EXERCISES:
+            raise ValueError(
+                '[ExerciseSettings::get_settings()] Unknown exercise "'\
+                + str(exercise_name)\
+                + '"!'
+            )
+        if settings is None:
+            settings = dict()
+        result = dict(ExerciseSettings.DEFAULTS[exercise_name])
+        for name, value in settings.items():
+            if name not in result:
+                raise ValueError(
+                    '[ExerciseSettings::get_settings()] Unknown setting "'\
+                    + str(name)\
+                    + '" of exercise "'\
+                    + exercise_name\
+                    + '"!'
+                )
+            result[name] = str(value)
+        if not playback:
+            for name in ExerciseSettings.PLAYBACK_SETTINGS:
+                del result[name]
+        return result
+
+    @staticmethod
+    def get_scala_library() -> ScalaLibrary:
+        """
+        Get library of SCALA_DIRECTORY. It is created on first use
+        and shared, so SCALA_DIRECTORY can be changed before.
+
+        :returns: ScalaLibrary object.
+        """
+        return ScalaLibrary.get_shared(ExerciseSettings.SCALA_DIRECTORY)
+
+    @staticmethod
+    def get_scale_types() -> list:
+        """
+        Get values of scale setting: built-in scales, generated scales
+        and scales of Scala library.
+
+        :returns: List of scale types.
+        """
+        return list(Scale.SCALE_TYPES)\
+            + list(TuningGenerator.get_scale_types())\
+            + ExerciseSettings.get_scala_library().get_scale_types()
+
+    @staticmethod
+    def get_scale(scale_type:str) -> Scale:
+        """
+        Get shared scale of given type.
+
+        :scale_type: Value of scale setting.
+
+        :returns: Frozen Scale object.
+        """
+        if scale_type.startswith(ScalaLibrary.SCALE_TYPE_PREFIX):
+            return ExerciseSettings.get_scala_library().get_scale_by_type(
+                scale_type
+            )
+        return Scale.get_shared(scale_type)
+
+    @staticmethod
+    def parse_setting(text:str) -> (str, str):
+        """
+        Split setting given as text.
+
+        :text: Setting in NAME=VALUE form.
+
+        :returns: Name of the setting, Value of the setting.
+        """
+        if '=' not in text:
+            raise ValueError(
+                '[ExerciseSettings::parse_setting()] Setting "'\
+                + text\
+                + '" must have NAME=VALUE form!'
+            )
+        name, value = text.split('=', 1)
+        return name.strip(), value.strip()
+
+    @staticmethod
+    def apply_setting(exercise, name:str, value:str):
+        """
+        Change exercise setting like settings window does.
+
+        :exercise: Exercise object.
+        :name: Name of the setting.
+        :value: Setting value as shown in settings window.
+        """
+        if name == 'volume':
+            exercise.set_volume(float(value))
+        elif name == 'synthesizer_type':
+            if value not in ExerciseSettings.SYNTHESIZERS:
+                raise ValueError(
+                    '[ExerciseSettings::apply_setting()] Unknown synthesizer "'\
+                    + value\
+                    + '"!'
+                )
+            exercise.set_synthesizer(ExerciseSettings.SYNTHESIZERS[value])
+        elif name == 'sampling_frequency':
+            exercise.set_sampling_frequency(int(value))
+        elif name == 'streaming':
+            exercise.set_streaming(value == 'Yes')
+        elif name == 'play_type':
+            exercise.set_play_type(value)
+        elif name == 'scale':
+            exercise.set_scale(ExerciseSettings.get_scale(value))
+        elif name == 'interval_scale':
+            exercise.set_interval_scale(IntervalScale(value))
+        elif name == 'lowest_pitch':
+            exercise.set_lowest_pitch(Pitch.from_name(value))
+        elif name == 'highest_pitch':
+            exercise.set_highest_pitch(Pitch.from_name(value))
+        elif name == 'smallest_interval':
+            exercise.set_smallest_interval(Interval.from_cents(int(value)))
+        elif name == 'largest_interval':
+            exercise.set_largest_interval(Interval.from_cents(int(value)))
+        elif name == 'possible_detune':
+            exercise.set_possible_detune(float(value))
+        elif name == 'max_detuning':
+            exercise.set_max_detuning(float(value))
+        elif name == 'possible_error':
+            exercise.set_possible_error(int(value))
+        elif name == 'chord_size':
+            exercise.set_chord_size(int(value))
+        elif name == 'voice_length':
+            exercise.set_voice_length(int(value))
+        elif name == 'if_first_note_provided':
+            exercise.set_if_first_note_provided(value == 'Yes')
+        else:
+            raise ValueError(
+                '[ExerciseSettings::apply_setting()] Unknown setting "'\
+                + str(name)\
+                + '"!'
+            )
+
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import random
+
+from exercises.exercise import Exercise
 from notes.pitch import Pitch
 from notes.interval import Interval
 from notes.interval_generator import IntervalGenerator
-from synthesis.player import Player
 from notes.scale import Scale
-from synthesis.synthesizer import Synthesizer
+from synthesis.timeline import Timeline
 
 class IntervalExample:
     def __init__(self, generator_output:(Interval, Pitch, Pitch)):
@@ -15,11 +17,12 @@ class IntervalExample:
         self.higher_pitch = generator_output[2]
 
 
-class IntervalsExercise:
+class IntervalsExercise(Exercise):
+    NAME = 'intervals'
+
     def __init__(self, sampling_frequency:int):
-        # exercise settings
-        self._sampling_frequency = sampling_frequency
-        self._volume = None
+        super().__init__(sampling_frequency)
+
         self._play_type = None
         self._scale = None
         self._lowest_pitch = None
@@ -27,21 +30,6 @@ class IntervalsExercise:
         self._smallest_interval = None
         self._largest_interval = None
         self._possible_detune = None
-        self._synthesizer = Synthesizer(sampling_frequency)
-        self._possible_error = None
-
-        # other variables
-        self._actual_example = None
-        self._player = Player(sampling_frequency)
-
-    def set_sampling_frequency(self, sampling_frequency:int):
-        self._sampling_frequency = sampling_frequency
-        self._synthesizer.set_sampling_frequency(sampling_frequency)
-        self._player.set_sampling_frequency(sampling_frequency)
-
-    def set_volume(self, volume:float):
-        self._volume = volume
-        self._synthesizer.set_volume(volume)
 
     def set_play_type(self, play_type:str):
         self._play_type = play_type
@@ -64,78 +52,91 @@ class IntervalsExercise:
     def set_possible_detune(self, possible_detune:float):
         self._possible_detune = possible_detune
 
-    def set_synthesizer(self, synthesizer:type):
-        self._synthesizer = Synthesizer(
-            self._sampling_frequency,
-            synthesizer
-        )
-
-    def get_possible_error(self):
-        return self._possible_error
-
-    def set_possible_error(self, possible_error:float):
-        self._possible_error = possible_error
-
-    def generate_new_example(self):
+    def _get_example_settings(self) -> list:
+        return [
+            self._play_type,
+            self._scale,
+            self._lowest_pitch,
+            self._highest_pitch,
+            self._smallest_interval,
+            self._largest_interval,
+            self._possible_detune
+        ]
+
+    def _generate_example(self, rng:random.Random) -> IntervalExample:
         interval_generator = IntervalGenerator(
             scale=self._scale,
             lowest_pitch=self._lowest_pitch,
             highest_pitch=self._highest_pitch,
             possible_detune=self._possible_detune,
             smallest_interval=self._smallest_interval,
-            largest_interval=self._largest_interval
+            largest_interval=self._largest_interval,
+            rng=rng
         )
-        self._actual_example = IntervalExample(
+        example = IntervalExample(
             interval_generator.generate_interval()
         )
 
-    def play_example(self):
+        return example
+
+    def get_example_answer(self) -> dict:
+        """
+        Get correct answer of actual example.
+        Pitches are given in cents away from A4 and intervals in cents.
+
+        :returns: Dictionary of correct values.
+        """
         if self._actual_example is None:
             raise RuntimeError(
-                '[IntervalsExercise::play_example()] No example to play!'
+                '[IntervalsExercise::get_example_answer()] No example generated!'
             )
+        return {
+            'interval': self._actual_example.interval.get_cents(),
+            'lower_pitch': self._actual_example.lower_pitch.get_cents_from_a(),
+            'higher_pitch': self._actual_example.higher_pitch.get_cents_from_a()
+        }
+
+    def _create_example(self, answer:dict):
+        example = IntervalExample((
+            Interval.from_cents(answer['interval']),
+            Pitch.from_cents_from_a(answer['lower_pitch']),
+            Pitch.from_cents_from_a(answer['higher_pitch'])
+        ))
+        return example
+
+    def _get_timeline(self, example:IntervalExample) -> Timeline:
         if self._play_type is None:
             raise RuntimeError(
-                '[IntervalsExercise::play_example()] No play type chosen!'
+                '[IntervalsExercise::get_example_timeline()] No play type chosen!'
             )
-        elif self._play_type == 'Upwards':
-            self._player.play(
-                self._synthesizer.generate_interval_up(
-                    self._actual_example.lower_pitch,
-                    self._actual_example.higher_pitch
-                )
+        if self._play_type == 'Upwards':
+            return Timeline.interval_up(
+                example.lower_pitch,
+                example.higher_pitch
             )
         elif self._play_type == 'Downwards':
-            self._player.play(
-                self._synthesizer.generate_interval_down(
-                    self._actual_example.lower_pitch,
-                    self._actual_example.higher_pitch
-                )
+            return Timeline.interval_down(
+                example.lower_pitch,
+                example.higher_pitch
             )
         elif self._play_type == 'Upwards with hold':
-            self._player.play(
-                self._synthesizer.generate_interval_up_hold(
-                    self._actual_example.lower_pitch,
-                    self._actual_example.higher_pitch
-                )
+            return Timeline.interval_up_hold(
+                example.lower_pitch,
+                example.higher_pitch
             )
         elif self._play_type == 'Downwards with hold':
-            self._player.play(
-                self._synthesizer.generate_interval_down_hold(
-                    self._actual_example.lower_pitch,
-                    self._actual_example.higher_pitch
-                )
+            return Timeline.interval_down_hold(
+                example.lower_pitch,
+                example.higher_pitch
             )
         elif self._play_type == 'Together':
-            self._player.play(
-                self._synthesizer.generate_interval_together(
-                    self._actual_example.lower_pitch,
-                    self._actual_example.higher_pitch
-                )
+            return Timeline.interval_together(
+                example.lower_pitch,
+                example.higher_pitch
             )
         else:
             raise RuntimeError(
-                '[IntervalsExercise::play_example()] Unknown play type!'
+                '[IntervalsExercise::get_example_timeline()] Unknown play type!'
             )
 
     def answer_example(self, answer:float) -> (bool, float):
@@ -1,39 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import numpy as np
+import random
 
+from exercises.exercise import Exercise
 from notes.pitch import Pitch
 from notes.pitch_generator import PitchGenerator
-from synthesis.player import Player
 from notes.scale import Scale
-from synthesis.synthesizer import Synthesizer
+from synthesis.timeline import Timeline
 
 
-class TenOPitchesExercise:
+class TenOPitchesExercise(Exercise):
+    NAME = 'ten_o_pitches'
+
     def __init__(self, sampling_frequency:int):
+        super().__init__(sampling_frequency)
+
         # exercise settings
-        self._sampling_frequency = sampling_frequency
-        self._volume = None
         self._scale = None
         self._lowest_pitch = None
         self._highest_pitch = None
         self._possible_detune = None
-        self._synthesizer = Synthesizer(sampling_frequency)
-        self._possible_error = None
-
-        # other variables
-        self._actual_example = None
-        self._player = Player(sampling_frequency)
-
-    def set_sampling_frequency(self, sampling_frequency:int):
-        self._sampling_frequency = sampling_frequency
-        self._synthesizer.set_sampling_frequency(sampling_frequency)
-        self._player.set_sampling_frequency(sampling_frequency)
-
-    def set_volume(self, volume:float):
-        self._volume = volume
-        self._synthesizer.set_volume(volume)
 
     def set_scale(self, scale:Scale):
         self._scale = scale
@@ -47,56 +34,46 @@ class TenOPitchesExercise:
     def set_possible_detune(self, possible_detune:float):
         self._possible_detune = possible_detune
 
-    def set_synthesizer(self, synthesizer:type):
-        self._synthesizer = Synthesizer(
-            self._sampling_frequency,
-            synthesizer
-        )
+    def _get_example_settings(self) -> list:
+        return [
+            self._scale,
+            self._lowest_pitch,
+            self._highest_pitch,
+            self._possible_detune
+        ]
 
-    def get_possible_error(self):
-        return self._possible_error
-
-    def set_possible_error(self, possible_error:float):
-        self._possible_error = possible_error
-
-    def generate_new_example(self):
+    def _generate_example(self, rng:random.Random) -> Pitch:
         pitch_generator = PitchGenerator(
             scale=self._scale,
             lowest_pitch=self._lowest_pitch,
             highest_pitch=self._highest_pitch,
-            possible_detune=self._possible_detune
+            possible_detune=self._possible_detune,
+            rng=rng
         )
-        self._actual_example = pitch_generator.generate_pitch()
+        return pitch_generator.generate_pitch()
+
+    def get_example_answer(self) -> dict:
+        """
+        Get correct answer of actual example.
+        Pitches are given in cents away from A4 and intervals in cents.
 
-    def play_example(self, memory_flush=False):
-        # Check exercise state
+        :returns: Dictionary of correct values.
+        """
         if self._actual_example is None:
             raise RuntimeError(
-                '[TenOPitchesExercise::play_example()] No example to play!'
+                '[TenOPitchesExercise::get_example_answer()] No example generated!'
             )
+        return {
+            'pitch': self._actual_example.get_cents_from_a()
+        }
 
-        # Generate memory flush
-        signal = np.zeros(0)
-        if memory_flush:
-            signal = np.concatenate([
-                signal,
-                self._synthesizer.generate_memory_flush(
-                    lowest_pitch=self._lowest_pitch,
-                    highest_pitch=self._highest_pitch
-                ),
-                np.zeros(self._sampling_frequency)
-            ])
-        
-        # Play
-        self._player.play(
-            np.concatenate([
-                signal,
-                self._synthesizer.generate_pitch(
-                    pitch=self._actual_example,
-                    time=1
-                )
-            ])
-        )
+    def _create_example(self, answer:dict) -> Pitch:
+        return Pitch.from_cents_from_a(answer['pitch'])
+
+    def _get_timeline(self, example:Pitch) -> Timeline:
+        timeline = Timeline()
+        timeline.add_pitch(0, 1, example)
+        return timeline
 
     def answer_example(self, answer) -> (bool, float):
         if self._actual_example.get_cents_from_a()\
@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import random
+
 import numpy as np
 
+from exercises.exercise import Exercise
 from notes.chord import Chord
 from notes.chord_generator import ChordGenerator
 from notes.pitch import Pitch
 from notes.interval import Interval
 from notes.scale import Scale
-from synthesis.player import Player
-from synthesis.synthesizer import Synthesizer
+from synthesis.timeline import Timeline
 
 class VoicesExample:
     def __init__(self):
@@ -56,11 +58,12 @@ class VoicesAnswer:
         return self.answers[chord_num][voice_num], self.example.get_chord(chord_num).get_pitch(voice_num)
 
 
-class VoicesExercise:
+class VoicesExercise(Exercise):
+    NAME = 'voices'
+
     def __init__(self, sampling_frequency:int):
-        # exercise settings
-        self._sampling_frequency = sampling_frequency
-        self._volume = None
+        super().__init__(sampling_frequency)
+
         self._play_type = None
         self._scale = None
         self._lowest_pitch = None
@@ -68,25 +71,10 @@ class VoicesExercise:
         self._smallest_interval = None
         self._largest_interval = None
         self._possible_detune = None
-        self._synthesizer = Synthesizer(sampling_frequency)
-        self._possible_error = None
         self._chord_size = None
         self._voice_length = None
         self._if_first_note_provided = None
 
-        # other variables
-        self._actual_example = None
-        self._player = Player(sampling_frequency)
-
-    def set_sampling_frequency(self, sampling_frequency:int):
-        self._sampling_frequency = sampling_frequency
-        self._synthesizer.set_sampling_frequency(sampling_frequency)
-        self._player.set_sampling_frequency(sampling_frequency)
-
-    def set_volume(self, volume:float):
-        self._volume = volume
-        self._synthesizer.set_volume(volume)
-
     def set_play_type(self, play_type:str):
         self._play_type = play_type
 
@@ -108,18 +96,6 @@ class VoicesExercise:
     def set_possible_detune(self, possible_detune:float):
         self._possible_detune = possible_detune
 
-    def set_synthesizer(self, synthesizer:type):
-        self._synthesizer = Synthesizer(
-            self._sampling_frequency,
-            synthesizer
-        )
-
-    def get_possible_error(self) -> float:
-        return self._possible_error
-
-    def set_possible_error(self, possible_error:float):
-        self._possible_error = possible_error
-
     def get_chord_size(self) -> int:
         return self._chord_size
 
@@ -135,7 +111,20 @@ class VoicesExercise:
     def set_if_first_note_provided(self, if_first_note_provided:bool):
         self._if_first_note_provided = if_first_note_provided
 
-    def generate_new_example(self):
+    def _get_example_settings(self) -> list:
+        return [
+            self._play_type,
+            self._scale,
+            self._lowest_pitch,
+            self._highest_pitch,
+            self._smallest_interval,
+            self._largest_interval,
+            self._possible_detune,
+            self._chord_size,
+            self._voice_length
+        ]
+
+    def _generate_example(self, rng:random.Random) -> VoicesExample:
         chord_generator = ChordGenerator(
             scale=self._scale,
             lowest_pitch=self._lowest_pitch,
@@ -143,79 +132,78 @@ class VoicesExercise:
             possible_detune=self._possible_detune,
             smallest_interval=self._smallest_interval,
             largest_interval=self._largest_interval,
-            chord_size=self._chord_size
+            chord_size=self._chord_size,
+            rng=rng
         )
-        self._actual_example = VoicesExample()
+        example = VoicesExample()
         for i in range(self._voice_length):
-            self._actual_example.add_chord(
+            example.add_chord(
                 chord_generator.generate_chord()
             )
 
+        return example
+
     def get_first_note(self):
         if self._if_first_note_provided:
             return self._actual_example.get_pitch(0, 0)
 
-    def play_example(self):
-        # Check exercise state
+    def get_example_answer(self) -> dict:
+        """
+        Get correct answer of actual example.
+        Pitches are given in cents away from A4 and intervals in cents.
+
+        :returns: Dictionary of correct values.
+        """
         if self._actual_example is None:
             raise RuntimeError(
-                '[VoicesExercise::play_example()] No example to play!'
+                '[VoicesExercise::get_example_answer()] No example generated!'
             )
+        return {
+            'pitches': [
+                [
+                    chord.get_pitch(i).get_cents_from_a()
+                    for i in range(chord.get_size())
+                ]
+                for chord in self._actual_example.chords
+            ]
+        }
+
+    def _create_example(self, answer:dict):
+        example = VoicesExample()
+        for pitches in answer['pitches']:
+            example.add_chord(Chord(
+                [Pitch.from_cents_from_a(pitch) for pitch in pitches]
+            ))
+        return example
+
+    def _get_timeline(self, example:VoicesExample) -> Timeline:
         if self._play_type is None:
             raise RuntimeError(
-                '[VoicesExercise::play_example()] No play type chosen!'
+                '[VoicesExercise::get_example_timeline()] No play type chosen!'
             )
-
-        # Play
-        signal = np.zeros(0)
         if self._play_type == 'Upwards':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_up(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_up(
+                example.chords
             )
         elif self._play_type == 'Downwards':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_down(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_down(
+                example.chords
             )
         elif self._play_type == 'Upwards with hold':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_up_hold(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_up_hold(
+                example.chords
             )
         elif self._play_type == 'Downwards with hold':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_down_hold(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_down_hold(
+                example.chords
             )
         elif self._play_type == 'Together':
-            self._player.play(
-                np.concatenate([
-                    signal,
-                    self._synthesizer.generate_chords_together(
-                        self._actual_example.chords
-                    )
-                ])
+            return Timeline.chords_together(
+                example.chords
             )
         else:
             raise RuntimeError(
-                '[VoicesExercise::play_example()] Unknown play type!'
+                '[VoicesExercise::get_example_timeline()] Unknown play type!'
             )
 
     def answer_example(self, user_answers:list) -> VoicesAnswer:
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import concurrent.futures
+import json
+import os
+import random
+
+import numpy as np
+
+from exercises.example_bank import ExampleBankWriter
+from exercises.exercise_settings import ExerciseSettings
+from synthesis.audio_writer import AudioWriter
+
+# Exercises already created in this process, reused by following examples
+_exercises = dict()
+
+def _prepare_exercise(exercise_name:str, settings:dict, index:int, seed:int):
+    """
+    Get exercise of given settings and seed random generators for the example.
+
+    :exercise_name: Name of the exercise.
+    :settings: Exercise settings.
+    :index: Index of the example.
+    :seed: Seed of the whole export.
+
+    :returns: Exercise object.
+    """
+    key = (exercise_name, tuple(sorted(settings.items())), seed)
+    if key not in _exercises:
+        _exercises[key] = ExerciseSettings.create_exercise(exercise_name, settings)
+        _exercises[key].set_seed(seed)
+
+    # Examples are generated with their own generators, but noise synthesizers
+    # use global ones, so seed them for every example
+    random.seed(seed + index)
+    np.random.seed((seed + index) % 2**32)
+    return _exercises[key]
+
+
+def export_example(task:tuple) -> dict:
+    """
+    Generate example and write it to audio file block by block.
+    Called in worker processes.
+
+    :task: Exercise name, exercise settings, example index, seed,
+        output file path, if memory flush should be played, block size.
+
+    :returns: Manifest entry of the example.
+    """
+    exercise_name, settings, index, seed, path, memory_flush, block_size = task
+    exercise = _prepare_exercise(exercise_name, settings, index, seed)
+
+    # Generate example
+    exercise.set_prepared_example(
+        exercise.prepare_example(render=False, index=index)
+    )
+    if memory_flush:
+        timeline = exercise.get_example_timeline(memory_flush=True)
+    else:
+        timeline = exercise.get_example_timeline()
+
+    # Write example
+    with AudioWriter(path, int(settings['sampling_frequency'])) as writer:
+        for block in exercise.get_synthesizer().generate_timeline_blocks(
+            timeline,
+            block_size
+        ):
+            writer.write(block)
+
+    return {
+        'index': index,
+        'id': exercise.get_example_id(),
+        'file': os.path.basename(path),
+        'answer': exercise.get_example_answer()
+    }
+
+
+def render_example(task:tuple) -> (np.array, dict):
+    """
+    Generate example and render it for example bank.
+    Called in worker processes.
+
+    :task: Exercise name, exercise settings, example index, seed.
+
+    :returns: Signal of the example, Answer of the example,
+        Identifier of the example.
+    """
+    exercise_name, settings, index, seed = task
+    exercise = _prepare_exercise(exercise_name, settings, index, seed)
+    exercise.set_prepared_example(
+        exercise.prepare_example(render=False, index=index)
+    )
+    return (
+        exercise.get_synthesizer().generate_timeline(
+            exercise.get_example_timeline()
+        ),
+        exercise.get_example_answer(),
+        exercise.get_example_id()
+    )
+
+
+def build_bank(
+    exercise,
+    exercise_name:str,
+    settings:dict,
+    number:int,
+    directory:str,
+    jobs:int,
+    seed:int
+) -> str:
+    """
+    Render examples in worker processes and store them in example bank.
+
+    :exercise: Exercise object configured with the settings.
+    :exercise_name: Name of the exercise.
+    :settings: Exercise settings.
+    :number: Number of examples.
+    :directory: Directory of bank files.
+    :jobs: Number of worker processes.
+    :seed: Seed of random generators.
+
+    :returns: Key of the bank.
+    """
+    key = exercise.get_example_key()
+    tasks = [
+        (exercise_name, settings, index, seed)
+        for index in range(number)
+    ]
+    with ExampleBankWriter(
+        directory,
+        key,
+        int(settings['sampling_frequency']),
+        exercise.get_synthesizer().get_sample_format()
+    ) as writer:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            for signal, answer, example_id in executor.map(
+                render_example,
+                tasks,
+                chunksize=max(1, number // (4*jobs))
+            ):
+                writer.add_example(signal, answer, example_id)
+    return key
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Render examples of an exercise to audio files '\
+            + 'with answers written to manifest.json, or to example bank.'
+    )
+    parser.add_argument(
+        'exercise',
+        choices=sorted(ExerciseSettings.EXERCISES),
+        help='Exercise to generate examples of.'
+    )
+    parser.add_argument(
+        '-n', '--number',
+        type=int,
+        default=10,
+        help='Number of examples.'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        default=None,
+        help='Output directory. "export" for audio files and directory '\
+            + 'of example banks used by exercises for example bank by default.'
+    )
+    parser.add_argument(
+        '-f', '--format',
+        choices=AudioWriter.FILE_FORMATS,
+        default='wav',
+        help='Audio file format. FLAC requires "soundfile" package.'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count(),
+        help='Number of worker processes.'
+    )
+    parser.add_argument(
+        '-s', '--setting',
+        action='append',
+        default=list(),
+        metavar='NAME=VALUE',
+        help='Exercise setting as shown in settings window, '\
+            + 'e.g. "play_type=Upwards with hold". Can be repeated.'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed of random generators. Random if not given.'
+    )
+    parser.add_argument(
+        '--memory-flush',
+        action='store_true',
+        help='Play random sounds before every example (ten_o_pitches only).'
+    )
+    parser.add_argument(
+        '--block-size',
+        type=int,
+        default=4096,
+        help='Number of samples rendered and written at once.'
+    )
+    parser.add_argument(
+        '--bank',
+        action='store_true',
+        help='Build example bank used by exercises instead of audio files.'
+    )
+    args = parser.parse_args()
+
+    # Read settings
+    settings = dict()
+    try:
+        for setting in args.setting:
+            name, value = ExerciseSettings.parse_setting(setting)
+            settings[name] = value
+    except ValueError as error:
+        parser.error(str(error))
+    if args.format == 'flac':
+        try:
+            import soundfile
+        except ImportError:
+            parser.error('Writing FLAC files requires "soundfile" package!')
+    if args.memory_flush and args.exercise != 'ten_o_pitches':
+        parser.error('Memory flush is available only in ten_o_pitches exercise!')
+    if args.memory_flush and args.bank:
+        parser.error('Examples with memory flush cannot be stored in example bank!')
+    try:
+        settings = ExerciseSettings.get_settings(args.exercise, settings)
+        exercise = ExerciseSettings.create_exercise(args.exercise, settings)
+    except (ValueError, RuntimeError) as error:
+        parser.error(str(error))
+
+    if args.output is None:
+        args.output = ExerciseSettings.EXAMPLE_BANK_DIRECTORY if args.bank else 'export'
+
+    # Generate examples
+    seed = args.seed
+    if seed is None:
+        seed = random.randrange(2**31)
+    if args.bank:
+        key = build_bank(
+            exercise,
+            args.exercise,
+            settings,
+            args.number,
+            args.output,
+            args.jobs,
+            seed
+        )
+        print(
+            'Stored ' + str(args.number) + ' examples in bank "'\
+            + os.path.join(args.output, key) + '".'
+        )
+        return
+    os.makedirs(args.output, exist_ok=True)
+    tasks = [
+        (
+            args.exercise,
+            settings,
+            index,
+            seed,
+            os.path.join(
+                args.output,
+                args.exercise + '_' + '{:05d}'.format(index) + '.' + args.format
+            ),
+            args.memory_flush,
+            args.block_size
+        )
+        for index in range(args.number)
+    ]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        examples = list(executor.map(
+            export_example,
+            tasks,
+            chunksize=max(1, args.number // (4*args.jobs))
+        ))
+
+    # Write answers
+    with open(os.path.join(args.output, 'manifest.json'), 'w') as manifest_file:
+        json.dump(
+            {
+                'exercise': args.exercise,
+                'settings': settings,
+                'seed': seed,
+                'examples': examples
+            },
+            manifest_file,
+            indent=4
+        )
+    print('Exported ' + str(len(examples)) + ' examples to "' + args.output + '".')
+
+
+if __name__ == "__main__":
+    main()
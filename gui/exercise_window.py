@@ -7,6 +7,7 @@ from gui.button import Button
 from gui.page_window import PageWindow
 from gui.state_label import StateLabel
 from gui.style import Style
+from gui.worker import Worker
 
 
 class ExerciseInstructionWindow(PageWindow):
@@ -71,6 +72,9 @@ class ExerciseMainWindow(PageWindow):
         # Add state label
         self.state_label = None
 
+        # Background work
+        self._worker = None
+
     def add_button(self,
         name:str,
         position:int,
@@ -105,6 +109,58 @@ class ExerciseMainWindow(PageWindow):
         for key in self.buttons:
             self.buttons[key].reset_text()
 
+    def run_in_background(self, function, finished_method, busy_text:str):
+        """
+        Run function in thread pool and show busy indicator on state label
+        until it finishes. Previous background work is cancelled.
+
+        :function: Function to run.
+        :finished_method: Method called in GUI thread with function result
+            or None.
+        :busy_text: Text shown on state label while function runs.
+        """
+        self.cancel_background_work()
+        worker = Worker(function)
+        worker.signals.finished.connect(
+            lambda result: self._background_work_finished(
+                worker,
+                finished_method,
+                result
+            )
+        )
+        worker.signals.failed.connect(
+            lambda message: self._background_work_failed(worker, message)
+        )
+        self._worker = worker
+        self.state_label.start_busy(busy_text)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def cancel_background_work(self):
+        """
+        Drop result of actual background work.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+            self.state_label.stop_busy()
+
+    def is_busy(self) -> bool:
+        return self._worker is not None
+
+    def _background_work_finished(self, worker:Worker, finished_method, result):
+        if worker is not self._worker:
+            return
+        self._worker = None
+        self.state_label.stop_busy()
+        if finished_method is not None:
+            finished_method(result)
+
+    def _background_work_failed(self, worker:Worker, message:str):
+        if worker is not self._worker:
+            return
+        self._worker = None
+        self.state_label.change_text(message)
+
 
 class ExerciseSettingsWindow(PageWindow):
     def __init__(self):
@@ -3,12 +3,13 @@
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+from exercises.example_prefetcher import ExamplePrefetcher, PreparedExample
+from exercises.exercise_settings import ExerciseSettings
 from exercises.intervals_exercise import IntervalsExercise
 from gui.exercise_window import ExerciseInstructionWindow, ExerciseMainWindow, ExerciseSettingsWindow
 from gui.picture_label import PictureLabel
 from notes.pitch import Pitch
 from notes.interval import Interval
-from notes.scale import Scale
 from synthesis.noise_synthesizer import NoiseSynthesizer
 from synthesis.saw_synthesizer import SawSynthesizer
 from synthesis.sine_synthesizer import SineSynthesizer
@@ -22,6 +23,10 @@ class IntervalsWindow():
         self.exercise = IntervalsExercise(
             sampling_frequency=44100
         )
+        self.exercise.set_example_bank_directory(
+            ExerciseSettings.EXAMPLE_BANK_DIRECTORY
+        )
+        self.prefetcher = ExamplePrefetcher(self.exercise)
 
         # === INSTRUCTION WINDOW ===
         self.instruction_window = ExerciseInstructionWindow(
@@ -151,6 +156,18 @@ if you failed.\
             setting_method=self.sampling_frequency_changed
         )
 
+        # Add streaming setting
+        self.generator_window.add_setting(
+            name="streaming",
+            text="Streaming Playback:",
+            values=[
+                "Yes",
+                "No"
+            ],
+            default_option_index=1,
+            setting_method=self.streaming_changed
+        )
+
         # Add play type setting
         self.generator_window.add_setting(
             name="play_type",
@@ -180,15 +197,7 @@ if you failed.\
         self.setting_window.add_setting(
             name="scale",
             text="Scale:",
-            values=[
-                "12-TET (A=440Hz)",
-                "24-TET (A=440Hz)",
-                "31-TET (A=440Hz)",
-                "Pythagorean (C-based) (A=440Hz)",
-                "Just (C-based) (A=440Hz)",
-                "Quarter-comma meantone (C-based) (A=440Hz)",
-                "Bach's (Werckmeister III) (A=440Hz)"
-            ],
+            values=ExerciseSettings.get_scale_types(),
             default_option_index=0,
             setting_method=self.scale_changed
         )
@@ -325,6 +334,7 @@ if you failed.\
     def make_handleButton(self, button):
         def handleButton():
             if button == "settings_button":
+                self.main_window.cancel_background_work()
                 self.main_window.goto("intervals_settings_page")
             elif button == "generator_button":
                 self.main_window.goto("intervals_generator_page")
@@ -333,30 +343,54 @@ if you failed.\
             elif button == "forward_from_instruction_button":
                 self.instruction_window.goto("intervals_page")
             elif button == "back_button":
+                self.main_window.cancel_background_work()
+                self.prefetcher.discard()
                 self.label.if_active = False
                 self.main_window.goto("main_page")
             elif button == "back_from_generator":
                 self.generator_window.goto("intervals_page")
             elif button == "back_from_settings":
+                self.prefetcher.discard()
                 self.reset_window()
                 self.setting_window.goto("intervals_page")
             elif button == "action_button":
-                if not self.label.if_active:
-                    # Reset label
-                    self.label.reset()
-                    self.main_window.state_label.change_text(
-                        "Click near correct values on figure above"
+                if self.main_window.is_busy():
+                    pass
+                elif not self.label.if_active:
+                    # Create new example in background
+                    self.main_window.run_in_background(
+                        self.prefetcher.get_next_example,
+                        self.example_prepared,
+                        "Generating example"
                     )
 
-                    # Create new example
-                    self.exercise.generate_new_example()
-                    self.exercise.play_example()
-                    self.main_window.buttons["action_button"].change_text("Listen Again")
-
                 elif self.label.if_active:
-                    self.exercise.play_example()
+                    self.main_window.run_in_background(
+                        self.exercise.play_example,
+                        None,
+                        "Rendering example"
+                    )
         return handleButton
 
+    def example_prepared(self, prepared_example:PreparedExample):
+        # Reset label
+        self.label.reset()
+        self.main_window.state_label.change_text(
+            "Click near correct values on figure above"
+        )
+
+        # Set new example
+        self.exercise.set_prepared_example(prepared_example)
+        self.prefetcher.prefetch()
+        self.main_window.buttons["action_button"].change_text("Listen Again")
+
+        # Play example in background
+        self.main_window.run_in_background(
+            self.exercise.play_example,
+            None,
+            "Rendering example"
+        )
+
     def move_event(self, x, y):
         self.label.mark_max_error(x, self.exercise.get_possible_error()/2)
 
@@ -427,6 +461,11 @@ if you failed.\
             int(self.generator_window.get_setting("sampling_frequency"))
         )
 
+    def streaming_changed(self):
+        self.exercise.set_streaming(
+            self.generator_window.get_setting("streaming") == "Yes"
+        )
+
     def play_type_changed(self):
         self.exercise.set_play_type(
             self.generator_window.get_setting("play_type")
@@ -435,7 +474,7 @@ if you failed.\
     # === EXERCISE SETTINGS METHODS ===
     def scale_changed(self):
         self.exercise.set_scale(
-            Scale(self.setting_window.get_setting("scale"))
+            ExerciseSettings.get_scale(self.setting_window.get_setting("scale"))
         )
 
     def lowest_pitch_changed(self):
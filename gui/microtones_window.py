@@ -3,6 +3,8 @@
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+from exercises.example_prefetcher import ExamplePrefetcher, PreparedExample
+from exercises.exercise_settings import ExerciseSettings
 from exercises.microtones_exercise import MicrotonesExercise
 from gui.exercise_window import ExerciseInstructionWindow, ExerciseMainWindow, ExerciseSettingsWindow
 from gui.picture_label import PictureLabel
@@ -22,6 +24,10 @@ class MicrotonesWindow():
         self.exercise = MicrotonesExercise(
             sampling_frequency=44100
         )
+        self.exercise.set_example_bank_directory(
+            ExerciseSettings.EXAMPLE_BANK_DIRECTORY
+        )
+        self.prefetcher = ExamplePrefetcher(self.exercise)
 
         # === INSTRUCTION WINDOW ===
         self.instruction_window = ExerciseInstructionWindow(
@@ -151,6 +157,18 @@ if you failed.\
             setting_method=self.sampling_frequency_changed
         )
 
+        # Add streaming setting
+        self.generator_window.add_setting(
+            name="streaming",
+            text="Streaming Playback:",
+            values=[
+                "Yes",
+                "No"
+            ],
+            default_option_index=1,
+            setting_method=self.streaming_changed
+        )
+
         # Add play type setting
         self.generator_window.add_setting(
             name="play_type",
@@ -273,6 +291,7 @@ if you failed.\
     def make_handleButton(self, button):
         def handleButton():
             if button == "settings_button":
+                self.main_window.cancel_background_work()
                 self.main_window.goto("microtones_settings_page")
             elif button == "generator_button":
                 self.main_window.goto("microtones_generator_page")
@@ -281,30 +300,54 @@ if you failed.\
             elif button == "forward_from_instruction_button":
                 self.instruction_window.goto("microtones_page")
             elif button == "back_button":
+                self.main_window.cancel_background_work()
+                self.prefetcher.discard()
                 self.label.if_active = False
                 self.main_window.goto("main_page")
             elif button == "back_from_generator":
                 self.generator_window.goto("microtones_page")
             elif button == "back_from_settings":
+                self.prefetcher.discard()
                 self.reset_window()
                 self.setting_window.goto("microtones_page")
             elif button == "action_button":
-                if not self.label.if_active:
-                    # Reset label
-                    self.label.reset()
-                    self.main_window.state_label.change_text(
-                        "Click near correct values on figure above"
+                if self.main_window.is_busy():
+                    pass
+                elif not self.label.if_active:
+                    # Create new example in background
+                    self.main_window.run_in_background(
+                        self.prefetcher.get_next_example,
+                        self.example_prepared,
+                        "Generating example"
                     )
 
-                    # Create new example
-                    self.exercise.generate_new_example()
-                    self.exercise.play_example()
-                    self.main_window.buttons["action_button"].change_text("Listen Again")
-                
                 elif self.label.if_active:
-                    self.exercise.play_example()
+                    self.main_window.run_in_background(
+                        self.exercise.play_example,
+                        None,
+                        "Rendering example"
+                    )
         return handleButton
 
+    def example_prepared(self, prepared_example:PreparedExample):
+        # Reset label
+        self.label.reset()
+        self.main_window.state_label.change_text(
+            "Click near correct values on figure above"
+        )
+
+        # Set new example
+        self.exercise.set_prepared_example(prepared_example)
+        self.prefetcher.prefetch()
+        self.main_window.buttons["action_button"].change_text("Listen Again")
+
+        # Play example in background
+        self.main_window.run_in_background(
+            self.exercise.play_example,
+            None,
+            "Rendering example"
+        )
+
     def move_event(self, x, y):
         self.label.mark_max_error(x, self.exercise.get_possible_error()/2*3)
 
@@ -375,6 +418,11 @@ if you failed.\
             int(self.generator_window.get_setting("sampling_frequency"))
         )
 
+    def streaming_changed(self):
+        self.exercise.set_streaming(
+            self.generator_window.get_setting("streaming") == "Yes"
+        )
+
     def play_type_changed(self):
         self.exercise.set_play_type(
             self.generator_window.get_setting("play_type")
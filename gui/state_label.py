@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
 
 class StateLabel(QtWidgets.QLabel):
@@ -10,8 +10,46 @@ class StateLabel(QtWidgets.QLabel):
         self.text = text
         self.setText(self.text)
 
+        # Busy indicator
+        self._busy_text = ''
+        self._busy_step = 0
+        self._text_before_busy = self.text
+        self._busy_timer = QtCore.QTimer(self)
+        self._busy_timer.timeout.connect(self._update_busy_text)
+
     def change_text(self, text:str):
+        self._busy_timer.stop()
         self.setText(text)
 
     def reset_text(self):
+        self._busy_timer.stop()
         self.setText(self.text)
+
+    def start_busy(self, text:str):
+        """
+        Show text with animated dots until text is changed
+        or busy state is stopped.
+
+        :text: Text describing actual work.
+        """
+        if not self.is_busy():
+            self._text_before_busy = super().text()
+        self._busy_text = text
+        self._busy_step = 0
+        self._update_busy_text()
+        self._busy_timer.start(300)
+
+    def stop_busy(self):
+        """
+        Restore text shown before busy state.
+        """
+        if self.is_busy():
+            self._busy_timer.stop()
+            self.setText(self._text_before_busy)
+
+    def is_busy(self) -> bool:
+        return self._busy_timer.isActive()
+
+    def _update_busy_text(self):
+        self.setText(self._busy_text + '.'*(self._busy_step % 4))
+        self._busy_step += 1
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5 import QtCore
+
+
+class WorkerSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+
+class Worker(QtCore.QRunnable):
+    def __init__(self, function, *args, **kwargs):
+        """
+        Task run in QThreadPool. Result is delivered to GUI thread
+        by 'finished' signal and error message by 'failed' signal.
+        Cancelled worker does not deliver anything.
+
+        :function: Function to run.
+        :args: Positional arguments of the function.
+        :kwargs: Keyword arguments of the function.
+        """
+        super().__init__()
+        self.signals = WorkerSignals()
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        if self._cancelled:
+            return
+        try:
+            result = self._function(*self._args, **self._kwargs)
+        except Exception as error:
+            if not self._cancelled:
+                self.signals.failed.emit(str(error))
+            return
+        if not self._cancelled:
+            self.signals.finished.emit(result)
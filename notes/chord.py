@@ -1,26 +1,63 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import functools
+
 from notes.pitch import Pitch
 
+@functools.total_ordering
 class Chord:
-    def __init__(self, pitches=list()):
+    __slots__ = ('_pitches',)
+
+    def __init__(self, pitches=()):
         """
         Set of pitches used as a whole.
+        Pitches are stored sorted from the lowest. Chord cannot be changed
+        and can be used as dictionary key.
+
+        :pitches: Pitch objects of the chord.
         """
-        self._pitches = pitches
-        self._pitches.sort(
-            key=lambda x: x.get_cents_from_a()
+        object.__setattr__(self, '_pitches', tuple(sorted(pitches)))
+
+    def __setattr__(self, name:str, value):
+        raise AttributeError(
+            '[Chord::__setattr__(' + name + ')] Chord cannot be changed!'
         )
 
+    def __reduce__(self):
+        return (Chord, (self._pitches,))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Chord):
+            return NotImplemented
+        return self._pitches == other._pitches
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Chord):
+            return NotImplemented
+        return self._pitches < other._pitches
+
+    def __hash__(self) -> int:
+        return hash(self._pitches)
+
+    def __repr__(self) -> str:
+        return 'Chord(' + repr(self._pitches) + ')'
+
     def get_size(self) -> int:
         return len(self._pitches)
 
-    def add_pitch(self, pitch:Pitch):
-        self._pitches.append(pitch)
-        self._pitches.sort(
-            key=lambda x: x.get_cents_from_a()
-        )
+    def with_pitch(self, pitch:Pitch) -> 'Chord':
+        """
+        Create chord with one more pitch.
+
+        :pitch: Pitch to add.
+
+        :returns: New Chord object.
+        """
+        return Chord(self._pitches + (pitch,))
+
+    def get_pitches(self) -> tuple:
+        return self._pitches
 
     def get_pitch(self, voice_num:int) -> Pitch:
         if voice_num < 0:
@@ -3,20 +3,27 @@
 
 import random
 
+import numpy as np
+
 from notes.chord import Chord
 from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
 from notes.interval import Interval
 from notes.scale import Scale
 
 class ChordGenerator:
+    # Maximal number of chords generated at once by generate_chords
+    BATCH_SIZE = 2**16
+
     def __init__(self,
-        scale=Scale('12-TET (A=440Hz)'),
+        scale=Scale.get_shared('12-TET (A=440Hz)'),
         lowest_pitch=Pitch.from_name('C2'),
         highest_pitch=Pitch.from_name('C6'),
         possible_detune=1.0,
         smallest_interval=Interval.from_name('unison'),
         largest_interval=Interval.from_name('octave'),
-        chord_size=3
+        chord_size=3,
+        rng=None
     ):
         self._scale = scale
         self._lowest_pitch = lowest_pitch
@@ -25,6 +32,7 @@ class ChordGenerator:
         self._smallest_interval = smallest_interval
         self._largest_interval = largest_interval
         self._chord_size = chord_size
+        self._rng = rng if rng is not None else random
 
     def set_scale(self, scale:Scale):
         self._scale = scale
@@ -47,9 +55,17 @@ class ChordGenerator:
     def set_chord_size(self, chord_size:int):
         self._chord_size = chord_size
 
+    def set_rng(self, rng:random.Random):
+        """
+        Set random generator of generated notes.
+
+        :rng: Random generator or 'random' module for global one.
+        """
+        self._rng = rng
+
     def generate_chord(self) -> Chord:
         # Get all available pitches
-        available_pitches = self._scale.get_pitches(
+        available_pitches = self._scale.get_cents(
             from_pitch=self._lowest_pitch,
             to_pitch=self._highest_pitch
         )
@@ -57,20 +73,88 @@ class ChordGenerator:
         chosen_pitches = list()
         for i in range(self._chord_size):
             # Choose random pitch
-            new_pitch = random.choice(available_pitches)
-            chosen_pitches.append(new_pitch)
+            new_pitch = float(self._rng.choice(available_pitches))
+            chosen_pitches.append(Pitch(new_pitch))
 
             # Remove unavailable pitches from list
-            new_available_pitches = list()
-            for pitch in available_pitches:
-                if self._smallest_interval.get_cents()\
-                        <= abs(Interval.from_pitches(
-                            pitch,
-                            new_pitch
-                        ).get_cents())\
-                        <= self._largest_interval.get_cents():
-                    new_available_pitches.append(pitch)
-            available_pitches = new_available_pitches
+            distances = np.abs(available_pitches - new_pitch)
+            available_pitches = available_pitches[
+                (self._smallest_interval.get_cents() <= distances)
+                & (distances <= self._largest_interval.get_cents())
+            ]
 
         # Return chord
         return Chord(chosen_pitches)
+
+    def generate_chords(self, number:int, rng=None) -> PitchArray:
+        """
+        Generate many chords at once.
+
+        :number: Number of chords.
+        :rng: NumPy random generator. Generator seeded from the one
+            of this object is used if None.
+
+        :returns: Pitches of shape (number, chord_size). Pitches of every chord
+            are sorted from the lowest, like in Chord.
+        """
+        if rng is None:
+            rng = np.random.default_rng(self._rng.getrandbits(64))
+        cents = self._scale.get_cents(
+            from_pitch=self._lowest_pitch,
+            to_pitch=self._highest_pitch
+        )
+
+        smallest = self._smallest_interval.get_cents()
+        largest = self._largest_interval.get_cents()
+        output = np.empty((number, self._chord_size))
+        for start in range(0, number, self.BATCH_SIZE):
+            batch_size = min(self.BATCH_SIZE, number - start)
+            lows = np.zeros(batch_size, dtype=int)
+            highs = np.full(batch_size, len(cents))
+            for i in range(self._chord_size):
+                chosen = np.sort(output[start:start + batch_size, :i], axis=1)
+
+                # Available pitches form one run of sorted pitches
+                # not further than the largest interval from chosen ones
+                if i > 0:
+                    lows = np.searchsorted(cents, chosen[:, -1] - largest, side='left')
+                    highs = np.searchsorted(cents, chosen[:, 0] + largest, side='right')
+
+                # without disjoint gaps of pitches closer than the smallest
+                # interval to chosen ones
+                gap_starts = np.clip(
+                    np.searchsorted(cents, chosen - smallest, side='right'),
+                    lows[:, np.newaxis],
+                    highs[:, np.newaxis]
+                )
+                gap_ends = np.clip(
+                    np.searchsorted(cents, chosen + smallest, side='left'),
+                    lows[:, np.newaxis],
+                    highs[:, np.newaxis]
+                )
+                gap_starts = np.maximum(
+                    gap_starts,
+                    np.concatenate((
+                        lows[:, np.newaxis],
+                        np.maximum.accumulate(gap_ends, axis=1)[:, :-1]
+                    ), axis=1)
+                )
+                gap_ends = np.maximum(gap_ends, gap_starts)
+
+                # Choose random available pitch
+                counts = highs - lows - np.sum(gap_ends - gap_starts, axis=1)
+                if np.any(counts <= 0):
+                    raise RuntimeError(
+                        '[ChordGenerator::generate_chords()] '\
+                        + 'No pitch available for chord!'
+                    )
+                choices = lows + (rng.random(batch_size)*counts).astype(int)
+                for j in range(i):
+                    choices += np.where(
+                        choices >= gap_starts[:, j],
+                        gap_ends[:, j] - gap_starts[:, j],
+                        0
+                    )
+                output[start:start + batch_size, i] = cents[choices]
+        output.sort(axis=1)
+        return PitchArray(output)
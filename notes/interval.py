@@ -1,14 +1,46 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import functools
+import math
+
+@functools.total_ordering
 class Interval:
+    __slots__ = ('_cents',)
+
     def __init__(self, cents:float):
         """
         Musical interval (distance between pitches).
+        Interval cannot be changed, is ordered from the smallest
+        and can be used as dictionary key.
 
         :cents: Distance between pitches in cents.
         """
-        self._cents = cents
+        object.__setattr__(self, '_cents', cents)
+
+    def __setattr__(self, name:str, value):
+        raise AttributeError(
+            '[Interval::__setattr__(' + name + ')] Interval cannot be changed!'
+        )
+
+    def __reduce__(self):
+        return (Interval, (self._cents,))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return self._cents == other._cents
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return self._cents < other._cents
+
+    def __hash__(self) -> int:
+        return hash(self._cents)
+
+    def __repr__(self) -> str:
+        return 'Interval(' + repr(self._cents) + ')'
 
     @staticmethod
     def from_cents(cents:float) -> 'Interval':
@@ -51,12 +83,5 @@ class Interval:
 
         :returns: Number of halfsteps, Detune in cents in range <-50, 50).
         """
-        halfsteps = int(self._cents/100)
-        detune = self._cents - 100*halfsteps
-        while detune >= 50:
-            halfsteps += 1
-            detune -= 100
-        while detune < -50:
-            halfsteps -= 1
-            detune += 100
-        return halfsteps, detune
+        halfsteps = math.floor((self._cents + 50)/100)
+        return halfsteps, self._cents - 100*halfsteps
@@ -3,19 +3,23 @@
 
 import random
 
+import numpy as np
+
 from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
 from notes.pitch_generator import PitchGenerator
 from notes.interval import Interval
 from notes.scale import Scale
 
 class IntervalGenerator:
     def __init__(self,
-        scale=Scale('12-TET (A=440Hz)'),
+        scale=Scale.get_shared('12-TET (A=440Hz)'),
         lowest_pitch=Pitch.from_midi(21),
         highest_pitch=Pitch.from_midi(108),
         possible_detune=1.0,
         smallest_interval=Interval.from_name('unison'),
-        largest_interval=Interval.from_name('octave')
+        largest_interval=Interval.from_name('octave'),
+        rng=None
     ):
         self._scale = scale
         self._lowest_pitch = lowest_pitch
@@ -23,6 +27,7 @@ class IntervalGenerator:
         self._possible_detune = possible_detune
         self._smallest_interval = smallest_interval
         self._largest_interval = largest_interval
+        self._rng = rng if rng is not None else random
 
     def set_scale(self, scale:Scale):
         self._scale = scale
@@ -42,43 +47,48 @@ class IntervalGenerator:
     def set_largest_interval(self, largest_interval:Interval):
         self._largest_interval = largest_interval
 
+    def set_rng(self, rng:random.Random):
+        """
+        Set random generator of generated notes.
+
+        :rng: Random generator or 'random' module for global one.
+        """
+        self._rng = rng
+
     def generate_interval(self) -> (Interval, Pitch, Pitch):
         # Generate first random pitch
         pitch_generator = PitchGenerator(
             scale=self._scale,
             lowest_pitch=self._lowest_pitch,
             highest_pitch=self._highest_pitch,
-            possible_detune=0
+            possible_detune=0,
+            rng=self._rng
         )
         pitch1 = pitch_generator.generate_pitch()
 
         # Generate second random pitch
-        possible_pitches = list()
-        for pitch in self._scale.get_pitches(
+        cents = self._scale.get_cents(
             from_pitch=self._lowest_pitch,
             to_pitch=self._highest_pitch
-        ):
-            interval = Interval.from_pitches(
-                from_pitch=Pitch.lower(pitch1, pitch),
-                to_pitch=Pitch.higher(pitch1, pitch)
-            )
-            if self._largest_interval.get_cents()\
-                    >= interval.get_cents()\
-                    >= self._smallest_interval.get_cents():
-                possible_pitches.append(pitch)
-        pitch2 = random.choice(possible_pitches)
+        )
+        distances = np.abs(cents - pitch1.get_cents_from_a())
+        possible_pitches = cents[
+            (self._smallest_interval.get_cents() <= distances)
+            & (distances <= self._largest_interval.get_cents())
+        ]
+        pitch2 = Pitch(float(self._rng.choice(possible_pitches)))
 
         # Return interval and pitches
         output_pitch1 = Pitch.from_pitch(
             pitch=Pitch.lower(pitch1, pitch2),
-            detune=random.uniform(
+            detune=self._rng.uniform(
                 -self._possible_detune/2,
                 self._possible_detune/2
             )
         )
         output_pitch2 = Pitch.from_pitch(
             pitch=Pitch.higher(pitch1, pitch2),
-            detune=random.uniform(
+            detune=self._rng.uniform(
                 -self._possible_detune/2,
                 self._possible_detune/2
             )
@@ -88,3 +98,69 @@ class IntervalGenerator:
             to_pitch=output_pitch2
         )
         return output_interval, output_pitch1, output_pitch2
+
+    def generate_intervals(
+        self,
+        number:int,
+        rng=None
+    ) -> (np.array, PitchArray, PitchArray):
+        """
+        Generate many intervals at once.
+
+        :number: Number of intervals.
+        :rng: NumPy random generator. Generator seeded from the one
+            of this object is used if None.
+
+        :returns: Array of intervals in cents, Lower pitches, Higher pitches.
+        """
+        if rng is None:
+            rng = np.random.default_rng(self._rng.getrandbits(64))
+        cents = self._scale.get_cents(
+            from_pitch=self._lowest_pitch,
+            to_pitch=self._highest_pitch
+        )
+
+        # Possible second pitches of every first pitch form two runs
+        # of sorted pitches: below and above the first pitch
+        smallest = self._smallest_interval.get_cents()
+        largest = self._largest_interval.get_cents()
+        lower_starts = np.searchsorted(cents, cents - largest, side='left')
+        lower_ends = np.searchsorted(cents, cents - smallest, side='right')
+        higher_starts = np.maximum(
+            np.searchsorted(cents, cents + smallest, side='left'),
+            lower_ends
+        )
+        higher_ends = np.searchsorted(cents, cents + largest, side='right')
+        lower_counts = np.maximum(lower_ends - lower_starts, 0)
+        counts = lower_counts + np.maximum(higher_ends - higher_starts, 0)
+
+        # Choose pitches
+        first = rng.integers(len(cents), size=number)
+        if np.any(counts[first] == 0):
+            raise RuntimeError(
+                '[IntervalGenerator::generate_intervals()] '\
+                + 'No second pitch in interval range!'
+            )
+        offsets = (rng.random(number)*counts[first]).astype(int)
+        second = np.where(
+            offsets < lower_counts[first],
+            lower_starts[first] + offsets,
+            higher_starts[first] + offsets - lower_counts[first]
+        )
+        pitch1 = cents[first]
+        pitch2 = cents[second]
+
+        # Detune
+        lower_pitches = np.minimum(pitch1, pitch2) + rng.uniform(
+            -self._possible_detune/2,
+            self._possible_detune/2,
+            size=number
+        )
+        higher_pitches = np.maximum(pitch1, pitch2) + rng.uniform(
+            -self._possible_detune/2,
+            self._possible_detune/2,
+            size=number
+        )
+        return higher_pitches - lower_pitches,\
+            PitchArray(lower_pitches),\
+            PitchArray(higher_pitches)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import numpy as np
+
 from notes.interval import Interval
 
 class IntervalScale:
@@ -69,5 +71,16 @@ class IntervalScale:
         """
         self._detune = abs(self._detune + detune)
 
+    def get_detune(self) -> float:
+        return self._detune
+
     def get_intervals(self, detune=0.0) -> list:
         return self._intervals
+
+    def get_cents(self) -> np.array:
+        """
+        Get intervals of the scale as array of cents.
+
+        :returns: Array of cents.
+        """
+        return np.array([interval.get_cents() for interval in self._intervals])
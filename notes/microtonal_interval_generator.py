@@ -3,7 +3,10 @@
 
 import random
 
+import numpy as np
+
 from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
 from notes.interval import Interval
 from notes.interval_scale import IntervalScale
 
@@ -12,12 +15,14 @@ class MicrotonalIntervalGenerator:
         scale=IntervalScale('Whole Tone Fractions'),
         lowest_pitch=Pitch.from_name('C3'),
         highest_pitch=Pitch.from_name('C5'),
-        possible_detune=0.5
+        possible_detune=0.5,
+        rng=None
     ):
         self._scale = scale
         self._lowest_pitch = lowest_pitch
         self._highest_pitch = highest_pitch
         self._possible_detune = possible_detune
+        self._rng = rng if rng is not None else random
 
     def set_scale(self, scale:IntervalScale):
         self._scale = scale
@@ -31,33 +36,35 @@ class MicrotonalIntervalGenerator:
     def set_possible_detune(self, possible_detune:float):
         self._possible_detune = possible_detune
 
+    def set_rng(self, rng:random.Random):
+        """
+        Set random generator of generated notes.
+
+        :rng: Random generator or 'random' module for global one.
+        """
+        self._rng = rng
+
     def generate_interval(self) -> (Interval, Pitch, Pitch):
         # Generate first random pitch
         pitch1 = Pitch.from_frequency(
-            random.uniform(
+            self._rng.uniform(
                 self._lowest_pitch.get_frequency(),
                 self._highest_pitch.get_frequency()
             )
         )
 
         # Generate second random pitch
-        output_interval = random.choice(
+        output_interval = self._rng.choice(
             self._scale.get_intervals()
         )
         pitch2 = pitch1.add_interval(
             output_interval
         )
-        if pitch2 == Pitch.higher(
-            self._highest_pitch,
-            pitch2
-        ):
+        if pitch2 > self._highest_pitch:
             pitch2 = pitch1.copy(
                 detune=-output_interval.get_cents()
             )
-        if pitch2 == Pitch.lower(
-            self._lowest_pitch,
-            pitch2
-        ):
+        if pitch2 < self._lowest_pitch:
             raise RuntimeError(
                 '[MicrotonalIntervalGenerator:generate_interval()] ' +
                 'Could not generate interval! ' +
@@ -67,16 +74,70 @@ class MicrotonalIntervalGenerator:
         # Return interval and pitches
         output_pitch1 = Pitch.from_pitch(
             pitch=Pitch.lower(pitch1, pitch2),
-            detune=random.uniform(
+            detune=self._rng.uniform(
                 -self._possible_detune/2,
                 self._possible_detune/2
             )
         )
         output_pitch2 = Pitch.from_pitch(
             pitch=Pitch.higher(pitch1, pitch2),
-            detune=random.uniform(
+            detune=self._rng.uniform(
                 -self._possible_detune/2,
                 self._possible_detune/2
             )
         )
         return output_interval, output_pitch1, output_pitch2
+
+    def generate_intervals(
+        self,
+        number:int,
+        rng=None
+    ) -> (np.array, PitchArray, PitchArray):
+        """
+        Generate many intervals at once.
+
+        :number: Number of intervals.
+        :rng: NumPy random generator. Generator seeded from the one
+            of this object is used if None.
+
+        :returns: Array of intervals in cents, Lower pitches, Higher pitches.
+        """
+        if rng is None:
+            rng = np.random.default_rng(self._rng.getrandbits(64))
+
+        # Generate first random pitches
+        pitch1 = 1200*np.log2(rng.uniform(
+            self._lowest_pitch.get_frequency(),
+            self._highest_pitch.get_frequency(),
+            size=number
+        )/440)
+
+        # Generate second random pitches
+        intervals = self._scale.get_cents()[
+            rng.integers(len(self._scale.get_intervals()), size=number)
+        ]
+        pitch2 = pitch1 + intervals
+        pitch2 = np.where(
+            pitch2 > self._highest_pitch.get_cents_from_a(),
+            pitch1 - intervals,
+            pitch2
+        )
+        if np.any(pitch2 < self._lowest_pitch.get_cents_from_a()):
+            raise RuntimeError(
+                '[MicrotonalIntervalGenerator:generate_intervals()] ' +
+                'Could not generate interval! ' +
+                'Make sure that lowest_pitch is sufficiently lower than highest_pitch!'
+            )
+
+        # Detune
+        lower_pitches = np.minimum(pitch1, pitch2) + rng.uniform(
+            -self._possible_detune/2,
+            self._possible_detune/2,
+            size=number
+        )
+        higher_pitches = np.maximum(pitch1, pitch2) + rng.uniform(
+            -self._possible_detune/2,
+            self._possible_detune/2,
+            size=number
+        )
+        return intervals, PitchArray(lower_pitches), PitchArray(higher_pitches)
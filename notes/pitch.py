@@ -1,16 +1,88 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import numpy as np
+import functools
+import math
 
+@functools.total_ordering
 class Pitch:
+    __slots__ = ('_cents',)
+
+    # Halfsteps from C of note names in midi notation
+    NAME_OFFSETS = {
+        'C': 0,
+        'C#': 1,
+        'ces': -1,
+        'c': 0,
+        'cis': 1,
+        'D': 2,
+        'D#': 3,
+        'des': 1,
+        'd': 2,
+        'dis': 3,
+        'E': 4,
+        'E#': 5,
+        'es': 3,
+        'e': 4,
+        'eis': 5,
+        'F': 5,
+        'F#': 6,
+        'fes': 4,
+        'f': 5,
+        'fis': 6,
+        'G': 7,
+        'G#': 8,
+        'ges': 6,
+        'g': 7,
+        'gis': 8,
+        'A': 9,
+        'A#': 10,
+        'as': 8,
+        'a': 9,
+        'ais': 10,
+        'B': 11,
+        'H': 11,
+        'B#': 12,
+        'H#': 12,
+        'b': 10,
+        'h': 11,
+        'his': 12
+    }
+
     def __init__(self, cents:float):
         """
         Musical pitch.
 
+        Pitch cannot be changed, is ordered from the lowest
+        and can be used as dictionary key.
+
         :cents: Number of cents away from A4 (midi 69, 440Hz).
         """
-        self._cents = cents
+        object.__setattr__(self, '_cents', cents)
+
+    def __setattr__(self, name:str, value):
+        raise AttributeError(
+            '[Pitch::__setattr__(' + name + ')] Pitch cannot be changed!'
+        )
+
+    def __reduce__(self):
+        return (Pitch, (self._cents,))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Pitch):
+            return NotImplemented
+        return self._cents == other._cents
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Pitch):
+            return NotImplemented
+        return self._cents < other._cents
+
+    def __hash__(self) -> int:
+        return hash(self._cents)
+
+    def __repr__(self) -> str:
+        return 'Pitch(' + repr(self._cents) + ')'
 
     @staticmethod
     def from_frequency(frequency:float, detune=0) -> 'Pitch':
@@ -20,7 +92,7 @@ class Pitch:
         :frequency: Frequency in hertz.
         :detune: Number of cents away from given frequency.
         """
-        return Pitch(1200*np.log2(frequency/440) + detune)
+        return Pitch(1200*math.log2(frequency/440) + detune)
 
     @staticmethod
     def from_midi(midi_pitch_id:int, detune=0) -> 'Pitch':
@@ -41,46 +113,7 @@ class Pitch:
         :detune: Number of cents away from normal frequency.
         """
         octave = int(pitch_name[-1])
-        possible_names = {
-           'C': 0,
-           'C#': 1,
-           'ces': -1,
-           'c': 0,
-           'cis': 1,
-           'D': 2,
-           'D#': 3,
-           'des': 1,
-           'd': 2,
-           'dis': 3,
-           'E': 4,
-           'E#': 5,
-           'es': 3,
-           'e': 4,
-           'eis': 5,
-           'F': 5,
-           'F#': 6,
-           'fes': 4,
-           'f': 5,
-           'fis': 6,
-           'G': 7,
-           'G#': 8,
-           'ges': 6,
-           'g': 7,
-           'gis': 8,
-           'A': 9,
-           'A#': 10,
-           'as': 8,
-           'a': 9,
-           'ais': 10,
-           'B': 11,
-           'H': 11,
-           'B#': 12,
-           'H#': 12,
-           'b': 10,
-           'h': 11,
-           'his': 12
-        }
-        midi_id = 12*(1 + octave) + possible_names[pitch_name[:-1]]
+        midi_id = 12*(1 + octave) + Pitch.NAME_OFFSETS[pitch_name[:-1]]
         return Pitch.from_midi(midi_id, detune)
 
     @staticmethod
@@ -116,15 +149,8 @@ class Pitch:
 
         :returns: Midi value, Detune in cents in range <-50, 50).
         """
-        pitch_id = 69 + int(self._cents/100)
-        detune = self._cents - 100*(pitch_id - 69)
-        while detune >= 50:
-            pitch_id += 1
-            detune -= 100
-        while detune < -50:
-            pitch_id -= 1
-            detune += 100
-        return (pitch_id, detune)
+        pitch_id = 69 + math.floor((self._cents + 50)/100)
+        return (pitch_id, self._cents - 100*(pitch_id - 69))
 
     def get_frequency(self, detune=0) -> float:
         """
@@ -134,7 +160,7 @@ class Pitch:
         
         :returns: Frequency in hertz.
         """
-        return np.power(2, (self._cents + detune)/1200) * 440
+        return 2**((self._cents + detune)/1200) * 440
 
     def copy(self, detune=0) -> 'Pitch':
         return Pitch(self._cents + detune)
@@ -143,15 +169,15 @@ class Pitch:
         return Pitch(self._cents + interval.get_cents() + detune)
 
     @staticmethod
-    def lower(pitch1:'Pitch', pitch2:'Pitch'):
-        if pitch1._cents <= pitch2._cents:
+    def lower(pitch1:'Pitch', pitch2:'Pitch') -> 'Pitch':
+        if pitch1 <= pitch2:
             return pitch1
         else:
             return pitch2
 
     @staticmethod
-    def higher(pitch1:'Pitch', pitch2:'Pitch'):
-        if pitch1._cents >= pitch2._cents:
+    def higher(pitch1:'Pitch', pitch2:'Pitch') -> 'Pitch':
+        if pitch1 >= pitch2:
             return pitch1
         else:
             return pitch2
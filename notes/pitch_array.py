@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from notes.pitch import Pitch
+
+class PitchArray:
+    def __init__(self, cents):
+        """
+        Array of musical pitches of any shape stored as cents,
+        so that all conversions are single array operations.
+
+        :cents: Array of numbers of cents away from A4 (midi 69, 440Hz).
+        """
+        self._cents = np.array(cents, dtype=float)
+        self._cents.setflags(write=False)
+
+    @staticmethod
+    def from_frequencies(frequencies, detune=0) -> 'PitchArray':
+        """
+        Create new PitchArray object.
+
+        :frequencies: Array of frequencies in hertz.
+        :detune: Number of cents away from given frequencies.
+        """
+        return PitchArray(
+            1200*np.log2(np.asarray(frequencies, dtype=float)/440) + detune
+        )
+
+    @staticmethod
+    def from_midi(midi_pitch_ids, detune=0) -> 'PitchArray':
+        """
+        Create new PitchArray object.
+
+        :midi_pitch_ids: Array of midi note pitch values.
+        :detune: Number of cents away from normal frequency.
+        """
+        return PitchArray(
+            (np.asarray(midi_pitch_ids, dtype=float) - 69)*100 + detune
+        )
+
+    @staticmethod
+    def from_names(pitch_names:list, detune=0) -> 'PitchArray':
+        """
+        Create new PitchArray object.
+
+        :pitch_names: List of note names in midi notation.
+        :detune: Number of cents away from normal frequency.
+        """
+        octaves = np.array([int(name[-1]) for name in pitch_names], dtype=float)
+        offsets = np.array(
+            [Pitch.NAME_OFFSETS[name[:-1]] for name in pitch_names],
+            dtype=float
+        )
+        return PitchArray.from_midi(12*(1 + octaves) + offsets, detune)
+
+    @staticmethod
+    def from_pitches(pitches:list, detune=0) -> 'PitchArray':
+        """
+        Create new PitchArray object.
+
+        :pitches: List of Pitch objects.
+        :detune: Number of cents away from normal frequency.
+        """
+        return PitchArray(
+            np.array(
+                [pitch.get_cents_from_a() for pitch in pitches],
+                dtype=float
+            ) + detune
+        )
+
+    def __len__(self) -> int:
+        return len(self._cents)
+
+    def __getitem__(self, key):
+        """
+        Get pitch or part of the array.
+
+        :key: Numpy index.
+
+        :returns: Pitch object for single element, PitchArray object otherwise.
+        """
+        cents = self._cents[key]
+        if np.ndim(cents) == 0:
+            return Pitch(float(cents))
+        return PitchArray(cents)
+
+    def get_shape(self) -> tuple:
+        return self._cents.shape
+
+    def get_cents_from_a(self) -> np.array:
+        """
+        Get distances from A4 (midi 69, 440Hz) in cents.
+
+        :returns: Read-only array of distances from A4 in cents.
+        """
+        return self._cents
+
+    def get_midi_pitches(self) -> (np.array, np.array):
+        """
+        Get midi values + detunes.
+
+        :returns: Array of midi values,
+            Array of detunes in cents in range <-50, 50).
+        """
+        pitch_ids = 69 + np.floor((self._cents + 50)/100).astype(int)
+        return pitch_ids, self._cents - 100*(pitch_ids - 69)
+
+    def get_frequencies(self, detune=0) -> np.array:
+        """
+        Get frequencies in hertz of the pitches.
+
+        :detune: Number of cents away from original frequencies.
+
+        :returns: Array of frequencies in hertz.
+        """
+        return np.power(2, (self._cents + detune)/1200) * 440
+
+    def copy(self, detune=0) -> 'PitchArray':
+        return PitchArray(self._cents + detune)
+
+    def get_pitches(self) -> list:
+        """
+        Convert flattened array to list of Pitch objects.
+
+        :returns: List of Pitch objects.
+        """
+        return [Pitch(cents) for cents in self._cents.ravel().tolist()]
@@ -1,23 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import numpy as np
 import random
 
+import numpy as np
+
 from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
 from notes.scale import Scale
 
 class PitchGenerator:
     def __init__(self,
-        scale=Scale('12-TET (A=440Hz)'),
+        scale=Scale.get_shared('12-TET (A=440Hz)'),
         lowest_pitch=Pitch(21),
         highest_pitch=Pitch(108),
-        possible_detune=1.0
+        possible_detune=1.0,
+        rng=None
     ):
         self._scale = scale
         self._lowest_pitch = lowest_pitch
         self._highest_pitch = highest_pitch
         self._possible_detune = possible_detune
+        self._rng = rng if rng is not None else random
 
     def set_scale(self, scale:Scale):
         self._scale = scale
@@ -31,16 +35,50 @@ class PitchGenerator:
     def set_possible_detune(self, possible_detune:float):
         self._possible_detune = possible_detune
 
+    def set_rng(self, rng:random.Random):
+        """
+        Set random generator of generated notes.
+
+        :rng: Random generator or 'random' module for global one.
+        """
+        self._rng = rng
+
     def generate_pitch(self) -> Pitch:
         # Choose one randomly
-        choice = random.choice(self._scale.get_pitches(
+        choice = Pitch(float(self._rng.choice(self._scale.get_cents(
             from_pitch=self._lowest_pitch,
             to_pitch=self._highest_pitch,
-        ))
+        ))))
 
         # Detune
-        choice = choice.copy(detune=random.randint(
+        choice = choice.copy(detune=self._rng.randint(
             -self._possible_detune,
             self._possible_detune
         ))
         return choice
+
+    def generate_pitches(self, number:int, rng=None) -> PitchArray:
+        """
+        Generate many pitches at once.
+
+        :number: Number of pitches.
+        :rng: NumPy random generator. Generator seeded from the one
+            of this object is used if None.
+
+        :returns: Generated pitches.
+        """
+        if rng is None:
+            rng = np.random.default_rng(self._rng.getrandbits(64))
+        cents = self._scale.get_cents(
+            from_pitch=self._lowest_pitch,
+            to_pitch=self._highest_pitch
+        )
+        return PitchArray(
+            cents[rng.integers(len(cents), size=number)]
+            + rng.integers(
+                -self._possible_detune,
+                self._possible_detune,
+                size=number,
+                endpoint=True
+            )
+        )
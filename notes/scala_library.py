@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+
+from notes.scale import Scale
+
+class ScalaLibrary:
+    # Version of index file format
+    INDEX_VERSION = 1
+
+    # Name of cache directory of index files, in user cache directory
+    CACHE_DIRECTORY_NAME = 'project-euterpe'
+
+    # Prefix of scale types of library scales
+    SCALE_TYPE_PREFIX = 'Scala: '
+
+    # Pitch of scale degree 0 if there is no keyboard mapping (C4)
+    MIDDLE_C_CENTS = -900.0
+
+    # Shared libraries of every directory
+    _shared_libraries = dict()
+    _shared_libraries_lock = threading.Lock()
+
+    def __init__(self, directory:str, index_path=None):
+        """
+        Archive of Scala tuning files ('.scl').
+        Names, note counts and periods of all scales are kept in index
+        cached on disk, so only new and changed files are read on startup.
+        Scale files are parsed only when the scale is used.
+        Keyboard mapping ('.kbm') with the same name as scale file
+        is applied to the scale.
+
+        :directory: Directory searched for scale files recursively.
+        :index_path: Path of index file. File of the directory
+            in user cache directory is used if None.
+        """
+        self._directory = directory
+        if index_path is None:
+            index_path = ScalaLibrary.get_index_path(directory)
+        self._index_path = index_path
+        self._entries = None
+        self._scales = dict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_shared(directory:str) -> 'ScalaLibrary':
+        """
+        Get library of given directory shared by all users.
+
+        :directory: Directory of scale files.
+
+        :returns: ScalaLibrary object.
+        """
+        directory = os.path.abspath(directory)
+        with ScalaLibrary._shared_libraries_lock:
+            if directory not in ScalaLibrary._shared_libraries:
+                ScalaLibrary._shared_libraries[directory] = ScalaLibrary(directory)
+            return ScalaLibrary._shared_libraries[directory]
+
+    @staticmethod
+    def get_index_path(directory:str) -> str:
+        """
+        Get default path of index file, so that library directory
+        is never written to.
+
+        :directory: Directory of scale files.
+
+        :returns: Path of index file in user cache directory.
+        """
+        cache_directory = os.environ.get('XDG_CACHE_HOME')\
+            or os.environ.get('LOCALAPPDATA')\
+            or os.path.join(os.path.expanduser('~'), '.cache')
+        directory_hash = hashlib.sha1(
+            os.path.abspath(directory).encode('utf-8')
+        ).hexdigest()[:16]
+        return os.path.join(
+            cache_directory,
+            ScalaLibrary.CACHE_DIRECTORY_NAME,
+            'scala_index_' + directory_hash + '.json'
+        )
+
+    def get_names(self) -> list:
+        """
+        Get names of valid scales. Name is path of scale file relative
+        to library directory, without extension.
+
+        :returns: Sorted list of names.
+        """
+        return sorted(
+            name
+            for name, entry in self._get_entries().items()
+            if 'error' not in entry
+        )
+
+    def get_scale_types(self) -> list:
+        """
+        Get scale types of library scales, as used in settings.
+
+        :returns: Sorted list of scale types.
+        """
+        return [self.SCALE_TYPE_PREFIX + name for name in self.get_names()]
+
+    def get_description(self, name:str) -> dict:
+        """
+        Get indexed information about the scale.
+
+        :name: Name of the scale.
+
+        :returns: Dictionary with 'description', number of 'notes'
+            and 'period' in cents.
+        """
+        entry = self._get_entry(name)
+        return {
+            'description': entry['description'],
+            'notes': entry['notes'],
+            'period': entry['period']
+        }
+
+    def get_scale(self, name:str) -> Scale:
+        """
+        Get scale of given name. Scale file is parsed on first use
+        and the scale is shared afterwards.
+
+        :name: Name of the scale.
+
+        :returns: Frozen Scale object.
+        """
+        with self._lock:
+            if name in self._scales:
+                return self._scales[name]
+        entry = self._get_entry(name)
+        description, degrees = ScalaLibrary.read_scale_file(
+            os.path.join(self._directory, entry['path'])
+        )
+        mapping = None
+        if entry['mapping'] is not None:
+            mapping = ScalaLibrary.read_keyboard_mapping_file(
+                os.path.join(self._directory, entry['mapping'])
+            )
+        scale = ScalaLibrary.create_scale(degrees, mapping)
+        scale.freeze()
+        with self._lock:
+            return self._scales.setdefault(name, scale)
+
+    def get_scale_by_type(self, scale_type:str) -> Scale:
+        """
+        Get scale of given scale type.
+
+        :scale_type: Scale type with library prefix.
+
+        :returns: Frozen Scale object.
+        """
+        if not scale_type.startswith(self.SCALE_TYPE_PREFIX):
+            raise ValueError(
+                '[ScalaLibrary::get_scale_by_type()] "'\
+                + scale_type\
+                + '" is not a library scale type!'
+            )
+        return self.get_scale(scale_type[len(self.SCALE_TYPE_PREFIX):])
+
+    def update_index(self):
+        """
+        Scan library directory and update index of changed files.
+        Index file is written if anything changed.
+        """
+        with self._lock:
+            self._entries = self._scan(self._read_index())
+
+    def _get_entries(self) -> dict:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._scan(self._read_index())
+            return self._entries
+
+    def _get_entry(self, name:str) -> dict:
+        entry = self._get_entries().get(name)
+        if entry is None:
+            raise ValueError(
+                '[ScalaLibrary::_get_entry()] Unknown scale "' + name + '"!'
+            )
+        if 'error' in entry:
+            raise ValueError(
+                '[ScalaLibrary::_get_entry()] Invalid scale "' + name + '": '\
+                + entry['error']
+            )
+        return entry
+
+    def _read_index(self) -> dict:
+        """
+        Read index cached on disk.
+
+        :returns: Dictionary of entries by scale name. Empty if there is
+            no valid index.
+        """
+        try:
+            with open(self._index_path, 'r') as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return dict()
+        if not isinstance(index, dict) or index.get('version') != self.INDEX_VERSION:
+            return dict()
+        return index.get('entries', dict())
+
+    def _scan(self, cached_entries:dict) -> dict:
+        """
+        Find scale files and index them. Entries of unchanged files
+        are taken from cached index.
+
+        :cached_entries: Entries read from index file.
+
+        :returns: Dictionary of entries by scale name.
+        """
+        entries = dict()
+        changed = False
+        for root, directories, files in os.walk(self._directory):
+            directories.sort()
+            names = set(files)
+            for file_name in sorted(files):
+                if not file_name.lower().endswith('.scl'):
+                    continue
+                path = os.path.join(root, file_name)
+                relative_path = os.path.relpath(path, self._directory)
+                name = os.path.splitext(relative_path)[0].replace(os.sep, '/')
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                mapping = None
+                for mapping_name in (
+                    file_name[:-4] + '.kbm',
+                    file_name[:-4] + '.KBM'
+                ):
+                    if mapping_name in names:
+                        mapping = os.path.relpath(
+                            os.path.join(root, mapping_name),
+                            self._directory
+                        )
+                        break
+
+                # Reuse entry of unchanged file
+                entry = cached_entries.get(name)
+                if entry is not None\
+                        and entry['path'] == relative_path\
+                        and entry['mtime'] == stat.st_mtime\
+                        and entry['size'] == stat.st_size\
+                        and entry['mapping'] == mapping:
+                    entries[name] = entry
+                    continue
+
+                # Index new or changed file
+                changed = True
+                entry = {
+                    'path': relative_path,
+                    'mtime': stat.st_mtime,
+                    'size': stat.st_size,
+                    'mapping': mapping
+                }
+                try:
+                    description, degrees = ScalaLibrary.read_scale_file(path)
+                    entry['description'] = description
+                    entry['notes'] = len(degrees)
+                    entry['period'] = degrees[-1]
+                except (OSError, ValueError) as error:
+                    entry['error'] = str(error)
+                entries[name] = entry
+        if changed or len(entries) != len(cached_entries):
+            self._write_index(entries)
+        return entries
+
+    def _write_index(self, entries:dict):
+        """
+        Write index file. Failure is not fatal, library is only
+        indexed again on the next start.
+
+        :entries: Dictionary of entries by scale name.
+        """
+        temporary_path = self._index_path + '.' + str(os.getpid()) + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+            with open(temporary_path, 'w') as index_file:
+                json.dump(
+                    {'version': self.INDEX_VERSION, 'entries': entries},
+                    index_file
+                )
+
+            # Replace index at once, so that it is never read half written
+            os.replace(temporary_path, self._index_path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def read_scale_file(path:str) -> (str, list):
+        """
+        Read Scala scale file.
+
+        :path: Path of '.scl' file.
+
+        :returns: Description of the scale, List of degrees 1 to N in cents
+            (degree 0 is 0 cents, degree N is the period).
+        """
+        with open(path, 'r', encoding='latin-1') as scale_file:
+            lines = [
+                line.rstrip('\r\n')
+                for line in scale_file
+                if not line.startswith('!')
+            ]
+        if len(lines) < 2:
+            raise ValueError(
+                '[ScalaLibrary::read_scale_file(' + path + ')] Missing header!'
+            )
+        description = lines[0].strip()
+        try:
+            notes = int(lines[1].split()[0])
+        except (IndexError, ValueError):
+            raise ValueError(
+                '[ScalaLibrary::read_scale_file(' + path + ')] '\
+                + 'Invalid number of notes!'
+            )
+        values = [line.split()[0] for line in lines[2:] if line.strip()]
+        if notes < 1 or len(values) < notes:
+            raise ValueError(
+                '[ScalaLibrary::read_scale_file(' + path + ')] '\
+                + 'Expected ' + str(notes) + ' pitches, found '\
+                + str(len(values)) + '!'
+            )
+        degrees = [
+            ScalaLibrary._parse_pitch(value, path)
+            for value in values[:notes]
+        ]
+        if degrees[-1] <= 0:
+            raise ValueError(
+                '[ScalaLibrary::read_scale_file(' + path + ')] '\
+                + 'Period must be positive!'
+            )
+        return description, degrees
+
+    @staticmethod
+    def _parse_pitch(value:str, path:str) -> float:
+        """
+        Convert pitch of scale file to cents.
+
+        :value: Cents (with a period) or ratio ('3/2' or '2').
+        :path: Path of the file for error messages.
+
+        :returns: Pitch in cents.
+        """
+        try:
+            if '.' in value:
+                return float(value)
+            numerator, _, denominator = value.partition('/')
+            ratio = int(numerator)/int(denominator or 1)
+        except (ValueError, ZeroDivisionError):
+            ratio = 0
+        if ratio <= 0:
+            raise ValueError(
+                '[ScalaLibrary::_parse_pitch(' + path + ')] '\
+                + 'Invalid pitch "' + value + '"!'
+            )
+        return float(1200*np.log2(ratio))
+
+    @staticmethod
+    def read_keyboard_mapping_file(path:str) -> dict:
+        """
+        Read Scala keyboard mapping file.
+
+        :path: Path of '.kbm' file.
+
+        :returns: Dictionary with map 'size', 'first_note', 'last_note',
+            'middle_note', 'reference_note', 'reference_frequency',
+            'octave_degree' and 'map' of scale degrees (None for unmapped keys).
+        """
+        with open(path, 'r', encoding='latin-1') as mapping_file:
+            values = [
+                line.split()[0]
+                for line in mapping_file
+                if not line.startswith('!') and line.strip()
+            ]
+        try:
+            mapping = {
+                'size': int(values[0]),
+                'first_note': int(values[1]),
+                'last_note': int(values[2]),
+                'middle_note': int(values[3]),
+                'reference_note': int(values[4]),
+                'reference_frequency': float(values[5]),
+                'octave_degree': int(values[6])
+            }
+            mapping['map'] = [
+                None if value.lower() == 'x' else int(value)
+                for value in values[7:7 + mapping['size']]
+            ]
+        except (IndexError, ValueError):
+            raise ValueError(
+                '[ScalaLibrary::read_keyboard_mapping_file(' + path + ')] '\
+                + 'Invalid keyboard mapping!'
+            )
+        if mapping['size'] < 0 or mapping['reference_frequency'] <= 0:
+            raise ValueError(
+                '[ScalaLibrary::read_keyboard_mapping_file(' + path + ')] '\
+                + 'Invalid keyboard mapping!'
+            )
+        mapping['map'] += [None]*(mapping['size'] - len(mapping['map']))
+        return mapping
+
+    @staticmethod
+    def create_scale(degrees:list, mapping=None) -> Scale:
+        """
+        Create scale from Scala scale degrees.
+        Key range of keyboard mapping is not used, because range of pitches
+        is chosen in exercise settings.
+
+        :degrees: Degrees 1 to N in cents, as returned by read_scale_file().
+        :mapping: Keyboard mapping, as returned by read_keyboard_mapping_file().
+            Degree 0 is played at middle C if None.
+
+        :returns: Scale object.
+        """
+        notes = len(degrees)
+        steps = [0.0] + list(degrees[:-1])
+
+        def get_degree_cents(degree:int) -> float:
+            return (degree // notes)*degrees[-1] + steps[degree % notes]
+
+        if mapping is None:
+            return Scale.from_cents(
+                [ScalaLibrary.MIDDLE_C_CENTS + cents for cents in steps],
+                degrees[-1]
+            )
+
+        # Linear mapping uses every degree
+        size = mapping['size']
+        keys = mapping['map']
+        octave_degree = mapping['octave_degree']
+        if size == 0:
+            size = notes
+            keys = list(range(notes))
+        if octave_degree == 0:
+            octave_degree = notes
+        period = get_degree_cents(octave_degree)
+
+        # Tune reference note to reference frequency
+        offset = mapping['reference_note'] - mapping['middle_note']
+        reference_degree = keys[offset % size]
+        if reference_degree is None:
+            raise ValueError(
+                '[ScalaLibrary::create_scale()] Reference note is not mapped!'
+            )
+        base = 1200*np.log2(mapping['reference_frequency']/440)\
+            - get_degree_cents(reference_degree)\
+            - (offset // size)*period
+        return Scale.from_cents(
+            [
+                float(base + get_degree_cents(degree))
+                for degree in keys
+                if degree is not None
+            ],
+            period
+        )
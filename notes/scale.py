@@ -1,15 +1,46 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import threading
+
+import numpy as np
+
 from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
+from notes.tuning_generator import TuningGenerator
 
 class Scale:
+    # Built-in scale types
+    SCALE_TYPES = (
+        '12-TET (A=440Hz)',
+        '24-TET (A=440Hz)',
+        '31-TET (A=440Hz)',
+        'Pythagorean (C-based) (A=440Hz)',
+        'Just (C-based) (A=440Hz)',
+        'Quarter-comma meantone (C-based) (A=440Hz)',
+        'Bach\'s (Werckmeister III) (A=440Hz)'
+    )
+
+    # Range of pitches in scale index in cents away from A4 (midi 0 - 127)
+    LOWEST_CENTS = -6900
+    HIGHEST_CENTS = 5800
+
+    # Shared scales of every scale type
+    _shared_scales = dict()
+    _shared_scales_lock = threading.Lock()
+
     def __init__(self, scale_type=None):
         """
-        Musical scale interpreted as the list of musical pitches.
+        Musical scale interpreted as the list of musical pitches
+        repeated every period (octave by default).
+        Pitches of the scale in all periods are stored in sorted array
+        of cents, built on first use and then used by range queries.
         """
         self._pitches = list()
         self._detune = 0.0
+        self._period = 1200.0
+        self._cents = None
+        self._frozen = False
 
         if scale_type == None:
             pass
@@ -53,37 +84,8 @@ class Scale:
             self._pitches.append(Pitch.from_midi(71))
             self._pitches.append(Pitch.from_midi(71, 50))
         elif scale_type == '31-TET (A=440Hz)':
-            self._pitches.append(Pitch.from_midi(57))
-            self._pitches.append(Pitch.from_midi(57, 1*38.71))
-            self._pitches.append(Pitch.from_midi(57, 2*38.71))
-            self._pitches.append(Pitch.from_midi(57, 3*38.71))
-            self._pitches.append(Pitch.from_midi(57, 4*38.71))
-            self._pitches.append(Pitch.from_midi(57, 5*38.71))
-            self._pitches.append(Pitch.from_midi(57, 6*38.71))
-            self._pitches.append(Pitch.from_midi(57, 7*38.71))
-            self._pitches.append(Pitch.from_midi(57, 8*38.71))
-            self._pitches.append(Pitch.from_midi(57, 9*38.71))
-            self._pitches.append(Pitch.from_midi(57, 10*38.71))
-            self._pitches.append(Pitch.from_midi(57, 11*38.71))
-            self._pitches.append(Pitch.from_midi(57, 12*38.71))
-            self._pitches.append(Pitch.from_midi(57, 13*38.71))
-            self._pitches.append(Pitch.from_midi(57, 14*38.71))
-            self._pitches.append(Pitch.from_midi(57, 15*38.71))
-            self._pitches.append(Pitch.from_midi(57, 16*38.71))
-            self._pitches.append(Pitch.from_midi(57, 17*38.71))
-            self._pitches.append(Pitch.from_midi(57, 18*38.71))
-            self._pitches.append(Pitch.from_midi(57, 19*38.71))
-            self._pitches.append(Pitch.from_midi(57, 20*38.71))
-            self._pitches.append(Pitch.from_midi(57, 21*38.71))
-            self._pitches.append(Pitch.from_midi(57, 22*38.71))
-            self._pitches.append(Pitch.from_midi(57, 23*38.71))
-            self._pitches.append(Pitch.from_midi(57, 24*38.71))
-            self._pitches.append(Pitch.from_midi(57, 25*38.71))
-            self._pitches.append(Pitch.from_midi(57, 26*38.71))
-            self._pitches.append(Pitch.from_midi(57, 27*38.71))
-            self._pitches.append(Pitch.from_midi(57, 28*38.71))
-            self._pitches.append(Pitch.from_midi(57, 29*38.71))
-            self._pitches.append(Pitch.from_midi(57, 30*38.71))
+            for cents in TuningGenerator.edo(31).tolist():
+                self._pitches.append(Pitch.from_midi(57, cents))
         elif scale_type == 'Pythagorean (C-based) (A=440Hz)':
             self._pitches.append(Pitch.from_midi(60, -5.87))
             self._pitches.append(Pitch.from_midi(61, 7.82))
@@ -145,14 +147,97 @@ class Scale:
                 + '"!'
             )
 
+    @staticmethod
+    def from_cents(cents:list, period=1200.0) -> 'Scale':
+        """
+        Create new Scale object.
+
+        :cents: Pitches of one period in cents away from A4.
+        :period: Interval the pitches are repeated every in cents.
+        """
+        if period <= 0:
+            raise ValueError(
+                '[Scale::from_cents(' + str(period) + ')] Period must be positive!'
+            )
+        scale = Scale()
+        scale._pitches = [Pitch(value) for value in cents]
+        scale._pitches.sort(key=lambda x: x.get_cents_from_a())
+        scale._period = period
+        return scale
+
+    @staticmethod
+    def from_pitch_array(pitches:PitchArray, period=1200.0) -> 'Scale':
+        """
+        Create new Scale object.
+
+        :pitches: Pitches of one period.
+        :period: Interval the pitches are repeated every in cents.
+        """
+        return Scale.from_cents(pitches.get_cents_from_a().ravel().tolist(), period)
+
+    @staticmethod
+    def get_shared(scale_type:str) -> 'Scale':
+        """
+        Get scale of given type shared by all users.
+        Shared scale is created once and cannot be changed.
+
+        :scale_type: Name of built-in scale type or of scale type
+            of TuningGenerator.
+
+        :returns: Scale object.
+        """
+        with Scale._shared_scales_lock:
+            if scale_type not in Scale._shared_scales:
+                if scale_type in Scale.SCALE_TYPES:
+                    scale = Scale(scale_type)
+                else:
+                    scale = Scale.from_cents(*TuningGenerator.get_tuning(scale_type))
+                scale.freeze()
+                Scale._shared_scales[scale_type] = scale
+            return Scale._shared_scales[scale_type]
+
+    def freeze(self):
+        """
+        Forbid changing the scale, so that it can be shared.
+        """
+        self._get_index()
+        self._frozen = True
+
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+    def get_period(self) -> float:
+        return self._period
+
+    def get_size(self) -> int:
+        """
+        Get number of pitches in one period.
+
+        :returns: Number of pitches.
+        """
+        return len(self._pitches)
+
+    def get_base_pitches(self) -> list:
+        """
+        Get pitches the scale is built from, one for every step of the period.
+
+        :returns: List of Pitch objects from the lowest.
+        """
+        return list(self._pitches)
+
+    def get_detune(self) -> float:
+        return self._detune
+
     def add_pitch(self, pitch:Pitch) -> None:
         """
         Add new pitch to scale.
 
         :pitch: Pitch to add to scale.
         """
-        self._pitches.append(heaight)
-        self._pitches.sort(key=lambda x: x.cents, reverse=True)
+        self._check_not_frozen('add_pitch')
+        self._pitches.append(pitch)
+        self._pitches.sort(key=lambda x: x.get_cents_from_a())
+        self._cents = None
 
     def set_detune(self, detune:float) -> None:
         """
@@ -160,7 +245,9 @@ class Scale:
 
         :detune: Detune from 440Hz.
         """
+        self._check_not_frozen('set_detune')
         self._detune = abs(detune)
+        self._cents = None
 
     def add_detune(self, detune:float) -> None:
         """
@@ -168,7 +255,15 @@ class Scale:
 
         :detune: Detune from previous value.
         """
+        self._check_not_frozen('add_detune')
         self._detune = abs(self._detune + detune)
+        self._cents = None
+
+    def _check_not_frozen(self, method:str):
+        if self._frozen:
+            raise RuntimeError(
+                '[Scale::' + method + '()] Shared scale cannot be changed!'
+            )
 
     def get_pitches(
         self,
@@ -176,30 +271,91 @@ class Scale:
         to_pitch:Pitch,
         detune=0.0
     ) -> list:
-        octave_shift = 0
-        while self._pitches[-1].get_cents_from_a()\
-                + 1200*octave_shift\
-                + self._detune\
-                + detune\
-                > from_pitch.get_cents_from_a():
-            octave_shift -= 1
-        possible_pitches = list()
-        while self._pitches[0].get_cents_from_a()\
-                + 1200*octave_shift\
-                + self._detune\
-                + detune\
-                < to_pitch.get_cents_from_a():
-            for pitch in self._pitches:
-                if from_pitch.get_cents_from_a()\
-                        <= pitch.get_cents_from_a()\
-                        + 1200*octave_shift\
-                        + self._detune\
-                        + detune\
-                        <= to_pitch.get_cents_from_a():
-                    possible_pitches.append(
-                        pitch.copy(
-                            detune=1200*octave_shift + self._detune + detune
-                        )
-                    )
-            octave_shift += 1
-        return possible_pitches
+        """
+        Get pitches of the scale in given range.
+
+        :from_pitch: The lowest pitch.
+        :to_pitch: The highest pitch.
+        :detune: Number of cents all pitches are moved by.
+
+        :returns: List of Pitch objects from the lowest.
+        """
+        return [
+            Pitch(cents)
+            for cents in self.get_cents(from_pitch, to_pitch, detune).tolist()
+        ]
+
+    def get_pitch_array(
+        self,
+        from_pitch:Pitch,
+        to_pitch:Pitch,
+        detune=0.0
+    ) -> PitchArray:
+        """
+        Get pitches of the scale in given range.
+
+        :from_pitch: The lowest pitch.
+        :to_pitch: The highest pitch.
+        :detune: Number of cents all pitches are moved by.
+
+        :returns: Sorted pitches.
+        """
+        return PitchArray(self.get_cents(from_pitch, to_pitch, detune))
+
+    def get_cents(
+        self,
+        from_pitch:Pitch,
+        to_pitch:Pitch,
+        detune=0.0
+    ) -> np.array:
+        """
+        Get pitches of the scale in given range as cents away from A4.
+        Range is limited to midi pitches.
+
+        :from_pitch: The lowest pitch.
+        :to_pitch: The highest pitch.
+        :detune: Number of cents all pitches are moved by.
+
+        :returns: Sorted read-only array of cents.
+            It is a view of scale index if detune is 0.
+        """
+        index = self._get_index()
+        start = np.searchsorted(
+            index,
+            from_pitch.get_cents_from_a() - detune,
+            side='left'
+        )
+        end = np.searchsorted(
+            index,
+            to_pitch.get_cents_from_a() - detune,
+            side='right'
+        )
+        if detune == 0:
+            return index[start:end]
+        return index[start:end] + detune
+
+    def _get_index(self) -> np.array:
+        """
+        Get pitches of the scale in all periods within midi range.
+
+        :returns: Sorted read-only array of cents away from A4.
+        """
+        if self._cents is None:
+            cents = np.array(
+                [pitch.get_cents_from_a() for pitch in self._pitches],
+                dtype=float
+            ) + self._detune
+            if len(cents) == 0:
+                index = cents
+            else:
+                period_shifts = self._period*np.arange(
+                    int(np.floor((self.LOWEST_CENTS - np.max(cents))/self._period)),
+                    int(np.ceil((self.HIGHEST_CENTS - np.min(cents))/self._period)) + 1
+                )
+                index = np.unique(cents[np.newaxis, :] + period_shifts[:, np.newaxis])
+                index = index[
+                    (self.LOWEST_CENTS <= index) & (index <= self.HIGHEST_CENTS)
+                ]
+            index.setflags(write=False)
+            self._cents = index
+        return self._cents
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import functools
+import re
+
+import numpy as np
+
+class TuningGenerator:
+    # Named rank-2 temperaments: generator in cents, period in cents,
+    # number of pitches, number of generators taken downwards
+    TEMPERAMENTS = {
+        'Pythagorean[12]': (701.955, 1200.0, 12, 5),
+        'Meantone[12]': (696.578, 1200.0, 12, 3),
+        'Meantone[19]': (696.578, 1200.0, 19, 9),
+        'Third-comma meantone[19]': (694.786, 1200.0, 19, 9),
+        'Mavila[7]': (678.0, 1200.0, 7, 3),
+        'Mavila[9]': (678.0, 1200.0, 9, 4),
+        'Superpyth[12]': (709.5, 1200.0, 12, 5),
+        'Porcupine[7]': (163.2, 1200.0, 7, 0),
+        'Porcupine[8]': (163.2, 1200.0, 8, 0),
+        'Magic[10]': (380.0, 1200.0, 10, 0),
+        'Hanson[11]': (317.1, 1200.0, 11, 0),
+        'Orwell[9]': (271.5, 1200.0, 9, 0),
+        'Miracle[10]': (116.7, 1200.0, 10, 0),
+        'Diaschismic[12]': (103.8, 600.0, 12, 0),
+        'Pajara[10]': (106.6, 600.0, 10, 0),
+        'Augmented[12]': (93.2, 400.0, 12, 0),
+        'Diminished[8]': (94.1, 300.0, 8, 0),
+        'Bohlen-Pierce[13]': (439.5, 1901.955, 13, 0)
+    }
+
+    # Reference frequency of A4 in offered scale types
+    REFERENCE_FREQUENCIES = (440.0,)
+
+    # Numbers of steps of offered equal divisions of the octave
+    EDO_STEPS = tuple(range(5, 101)) + (118, 171, 270, 311, 612, 665, 1200)
+
+    # Odd limits of offered just intonation lattices
+    ODD_LIMITS = (3, 5, 7, 9, 11, 13, 15, 17, 19, 21, 23)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def edo(steps:int, period=1200.0, reference_frequency=440.0) -> np.array:
+        """
+        Equal division of the period.
+
+        :steps: Number of steps in the period.
+        :period: Divided interval in cents.
+        :reference_frequency: Frequency of degree 0 (A4) in hertz.
+
+        :returns: Read-only array of pitches of one period in cents away from A4
+            at 440Hz.
+        """
+        if steps < 1:
+            raise ValueError(
+                '[TuningGenerator::edo(' + str(steps) + ')] '\
+                + 'Number of steps must be positive!'
+            )
+        return TuningGenerator._finish(
+            period*np.arange(steps)/steps,
+            reference_frequency
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def rank2(
+        generator:float,
+        period:float,
+        size:int,
+        down=0,
+        reference_frequency=440.0
+    ) -> np.array:
+        """
+        Rank-2 temperament: chain of generators reduced to the period.
+
+        :generator: Generator in cents.
+        :period: Period in cents.
+        :size: Number of pitches in the period.
+        :down: Number of generators taken downwards from degree 0.
+        :reference_frequency: Frequency of degree 0 (A4) in hertz.
+
+        :returns: Read-only sorted array of pitches of one period in cents
+            away from A4 at 440Hz.
+        """
+        if period <= 0 or size < 1:
+            raise ValueError(
+                '[TuningGenerator::rank2(' + str(period) + ', ' + str(size) + ')] '\
+                + 'Period and size must be positive!'
+            )
+        return TuningGenerator._finish(
+            np.sort(np.mod(generator*np.arange(-down, size - down), period)),
+            reference_frequency
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def just_intonation(odd_limit:int, reference_frequency=440.0) -> np.array:
+        """
+        Just intonation lattice: all ratios of odd numbers up to the limit,
+        reduced to one octave.
+
+        :odd_limit: The largest odd number in ratios.
+        :reference_frequency: Frequency of degree 0 (A4) in hertz.
+
+        :returns: Read-only sorted array of pitches of one octave in cents
+            away from A4 at 440Hz.
+        """
+        if odd_limit < 1:
+            raise ValueError(
+                '[TuningGenerator::just_intonation(' + str(odd_limit) + ')] '\
+                + 'Odd limit must be positive!'
+            )
+        odd_numbers = np.arange(1, odd_limit + 1, 2)
+        return TuningGenerator._finish(
+            np.unique(np.round(np.mod(
+                1200*np.log2(odd_numbers[:, np.newaxis]/odd_numbers),
+                1200
+            ), 9)),
+            reference_frequency
+        )
+
+    @staticmethod
+    def _finish(cents:np.array, reference_frequency:float) -> np.array:
+        cents = cents + 1200*np.log2(reference_frequency/440)
+        cents.setflags(write=False)
+        return cents
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_scale_types() -> tuple:
+        """
+        Get names of offered generated scales.
+
+        :returns: Tuple of scale types.
+        """
+        scale_types = list()
+        for reference_frequency in TuningGenerator.REFERENCE_FREQUENCIES:
+            reference = ' (A=' + '%g' % reference_frequency + 'Hz)'
+            scale_types += [
+                str(steps) + '-EDO' + reference
+                for steps in TuningGenerator.EDO_STEPS
+            ]
+            scale_types += [
+                name + reference
+                for name in TuningGenerator.TEMPERAMENTS
+            ]
+            scale_types += [
+                str(odd_limit) + '-limit JI' + reference
+                for odd_limit in TuningGenerator.ODD_LIMITS
+            ]
+        return tuple(scale_types)
+
+    @staticmethod
+    def get_tuning(scale_type:str) -> (np.array, float):
+        """
+        Generate pitches of scale type. Any number of EDO steps,
+        odd limit and reference frequency is accepted, e.g. '1000-EDO (A=432Hz)'.
+
+        :scale_type: Name of the scale type.
+
+        :returns: Pitches of one period in cents away from A4, Period in cents.
+        """
+        match = re.fullmatch(r'(.+?)(?: \(A=([0-9.]+)Hz\))?', scale_type)
+        name = match.group(1)
+        reference_frequency = float(match.group(2) or 440.0)
+        if reference_frequency > 0:
+            edo_match = re.fullmatch(r'([0-9]+)-EDO', name)
+            if edo_match:
+                return TuningGenerator.edo(
+                    int(edo_match.group(1)),
+                    reference_frequency=reference_frequency
+                ), 1200.0
+            limit_match = re.fullmatch(r'([0-9]+)-limit JI', name)
+            if limit_match:
+                return TuningGenerator.just_intonation(
+                    int(limit_match.group(1)),
+                    reference_frequency
+                ), 1200.0
+            if name in TuningGenerator.TEMPERAMENTS:
+                generator, period, size, down = TuningGenerator.TEMPERAMENTS[name]
+                return TuningGenerator.rank2(
+                    generator,
+                    period,
+                    size,
+                    down,
+                    reference_frequency
+                ), period
+        raise RuntimeError(
+            '[TuningGenerator::get_tuning()] Unknown scale type "'\
+            + scale_type\
+            + '"!'
+        )
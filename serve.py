@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+
+from server.exercise_server import ExerciseServer
+from synthesis.render_cache import RenderCache
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve exercises to many users over HTTP.'
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address to listen on.'
+    )
+    parser.add_argument(
+        '-p', '--port',
+        type=int,
+        default=8080,
+        help='Port to listen on.'
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=None,
+        help='Number of threads generating examples.'
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=256,
+        help='Size of render cache shared by sessions in megabytes.'
+    )
+    args = parser.parse_args()
+
+    server = ExerciseServer(
+        args.host,
+        args.port,
+        args.workers,
+        RenderCache(args.cache_size*1024*1024)
+    )
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(server.start())
+    print('Serving on http://' + args.host + ':' + str(server.get_port()) + '/')
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.stop())
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
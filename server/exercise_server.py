@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import concurrent.futures
+import json
+import struct
+import sys
+import time
+import traceback
+import uuid
+
+from exercises.exercise_engine import ExerciseEngine
+from exercises.exercise_settings import ExerciseSettings
+from synthesis.render_cache import RenderCache
+from synthesis.sample_format import SampleFormat
+
+class RequestError(Exception):
+    def __init__(self, status:int, message:str):
+        """
+        Request that cannot be read. Error response is sent
+        and connection is closed, as the rest of the request is not read.
+
+        :status: HTTP status code of the response.
+        :message: Error message.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class ExerciseSession:
+    def __init__(self, session_id:str, engine:ExerciseEngine):
+        """
+        State of one user of the server.
+
+        :session_id: Identifier of the session.
+        :engine: Exercise engine of the session.
+        """
+        self.session_id = session_id
+        self.engine = engine
+        self.lock = asyncio.Lock()
+        self.audio = None
+        self.examples = 0
+        self.last_access = time.monotonic()
+
+
+class ExerciseServer:
+    # Seconds after which idle sessions are removed
+    SESSION_TIMEOUT = 3600
+
+    # Number of samples sent in one chunk of audio stream
+    CHUNK_SIZE = 8192
+
+    # Maximal size of request body in bytes
+    MAX_BODY_SIZE = 64*1024
+
+    # Reasons of used HTTP status codes
+    REASONS = {
+        200: 'OK',
+        201: 'Created',
+        400: 'Bad Request',
+        404: 'Not Found',
+        405: 'Method Not Allowed',
+        409: 'Conflict',
+        413: 'Payload Too Large',
+        500: 'Internal Server Error'
+    }
+
+    def __init__(
+        self,
+        host='127.0.0.1',
+        port=8080,
+        workers=None,
+        render_cache=None
+    ):
+        """
+        HTTP server of exercises for many users at once.
+        Every user has a session with its own exercise.
+        Examples are generated and rendered in worker threads
+        with render cache shared by all sessions.
+        Whole example is rendered before its audio is requested,
+        so that rendered sounds are cached, and then sent as chunked WAV.
+
+        API (JSON bodies and responses):
+        - POST /sessions {"exercise": name, "settings": {name: value}}
+          creates session,
+        - POST /sessions/<id>/examples generates new example,
+        - GET /sessions/<id>/audio sends WAV of actual example,
+        - POST /sessions/<id>/answers {"answer": value} grades answer,
+        - DELETE /sessions/<id> removes session,
+        - GET / serves simple browser client.
+
+        :host: Address to listen on.
+        :port: Port to listen on. Free port is chosen if 0.
+        :workers: Number of worker threads. Chosen by executor if None.
+        :render_cache: RenderCache object shared by sessions.
+            New cache is created if not given.
+        """
+        self._host = host
+        self._port = port
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        if render_cache is None:
+            render_cache = RenderCache(256*1024*1024)
+        self._render_cache = render_cache
+        self._sessions = dict()
+        self._connections = dict()
+        self._server = None
+
+    def get_render_cache(self) -> RenderCache:
+        return self._render_cache
+
+    def get_port(self) -> int:
+        """
+        Get port the server listens on.
+
+        :returns: Port number.
+        """
+        if self._server is None:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self._host,
+            self._port
+        )
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            closed = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            for event in closed:
+                await event.wait()
+            await self._server.wait_closed()
+            self._server = None
+        self._pool.shutdown(wait=False)
+
+    async def _handle_connection(self, reader, writer):
+        """
+        Serve requests of one connection until it is closed.
+        """
+        closed = asyncio.Event()
+        self._connections[writer] = closed
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except RequestError as error:
+                    await self._send_json(
+                        writer,
+                        error.status,
+                        {'error': str(error)},
+                        False
+                    )
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self._handle_request(method, path, body, writer, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[writer]
+            writer.close()
+            closed.set()
+
+    async def _read_request(self, reader) -> tuple:
+        """
+        Read HTTP request.
+
+        :returns: Method, Path, Dictionary of headers with lowercase names,
+            Body or None if connection was closed.
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise RequestError(
+                400,
+                '[ExerciseServer::_read_request()] Invalid request line!'
+            )
+        headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise RequestError(
+                400,
+                '[ExerciseServer::_read_request()] Invalid Content-Length "'\
+                + headers['content-length']\
+                + '"!'
+            )
+        if length > self.MAX_BODY_SIZE:
+            raise RequestError(
+                413,
+                '[ExerciseServer::_read_request(' + str(length) + ')] '\
+                + 'Body is larger than ' + str(self.MAX_BODY_SIZE) + ' bytes!'
+            )
+        body = await reader.readexactly(length) if length > 0 else b''
+        return parts[0], parts[1], headers, body
+
+    async def _handle_request(
+        self,
+        method:str,
+        path:str,
+        body:bytes,
+        writer,
+        keep_alive:bool
+    ):
+        """
+        Route request to its handler and send response.
+        """
+        parts = [part for part in path.split('?')[0].split('/') if part]
+        try:
+            data = json.loads(body.decode('utf-8')) if body else dict()
+            if parts == [] and method == 'GET':
+                await self._send(
+                    writer,
+                    200,
+                    _CLIENT_PAGE.encode('utf-8'),
+                    'text/html; charset=utf-8',
+                    keep_alive
+                )
+                return
+            if parts == ['sessions'] and method == 'POST':
+                response = await self._create_session(data)
+                await self._send_json(writer, 201, response, keep_alive)
+                return
+            if len(parts) < 2 or parts[0] != 'sessions':
+                await self._send_json(writer, 404, {'error': 'Unknown path!'}, keep_alive)
+                return
+            session = self._sessions.get(parts[1])
+            if session is None:
+                await self._send_json(writer, 404, {'error': 'Unknown session!'}, keep_alive)
+                return
+            session.last_access = time.monotonic()
+            action = parts[2] if len(parts) > 2 else None
+            if action is None and method == 'DELETE':
+                del self._sessions[session.session_id]
+                await self._send_json(writer, 200, dict(), keep_alive)
+            elif action == 'examples' and method == 'POST':
+                response = await self._generate_example(session)
+                await self._send_json(writer, 200, response, keep_alive)
+            elif action == 'audio' and method == 'GET':
+                await self._stream_audio(session, writer, keep_alive)
+            elif action == 'answers' and method == 'POST':
+                response = await self._grade_answer(session, data)
+                await self._send_json(writer, 200, response, keep_alive)
+            else:
+                await self._send_json(writer, 405, {'error': 'Unknown action!'}, keep_alive)
+        except ConnectionError:
+            raise
+        except (ValueError, RuntimeError, KeyError, TypeError, IndexError) as error:
+            await self._send_json(writer, 400, {'error': str(error)}, keep_alive)
+        except Exception as error:
+            traceback.print_exc(file=sys.stderr)
+            await self._send_json(writer, 500, {'error': str(error)}, keep_alive)
+
+    async def _create_session(self, data:dict) -> dict:
+        self._remove_idle_sessions()
+        exercise_name = data.get('exercise')
+        settings = data.get('settings', dict())
+        if exercise_name not in ExerciseSettings.EXERCISES:
+            raise ValueError(
+                '[ExerciseServer::_create_session()] Unknown exercise "'\
+                + str(exercise_name)\
+                + '"!'
+            )
+        engine = await asyncio.get_event_loop().run_in_executor(
+            self._pool,
+            ExerciseEngine,
+            exercise_name,
+            settings
+        )
+        engine.get_exercise().get_synthesizer().set_render_cache(
+            self._render_cache
+        )
+        session = ExerciseSession(uuid.uuid4().hex, engine)
+        self._sessions[session.session_id] = session
+        return {
+            'session': session.session_id,
+            'exercise': exercise_name,
+            'settings': engine.get_settings()
+        }
+
+    async def _generate_example(self, session:ExerciseSession) -> dict:
+        async with session.lock:
+            session.audio = await asyncio.get_event_loop().run_in_executor(
+                self._pool,
+                self._render_new_example,
+                session.engine
+            )
+            session.examples += 1
+            sampling_frequency = int(session.engine.get_settings()['sampling_frequency'])
+            return {
+                'example': session.examples,
+                'id': session.engine.get_example_id(),
+                'duration': len(session.audio)/2/sampling_frequency
+            }
+
+    @staticmethod
+    def _render_new_example(engine:ExerciseEngine) -> bytes:
+        """
+        Generate new example and render it. Called in worker thread.
+
+        :engine: Exercise engine of the session.
+
+        :returns: Little-endian 16-bit samples of the example.
+        """
+        engine.generate_example()
+        return SampleFormat.convert(
+            engine.render_example(),
+            'int16'
+        ).astype('<i2', copy=False).tobytes()
+
+    async def _stream_audio(self, session:ExerciseSession, writer, keep_alive:bool):
+        audio = session.audio
+        if audio is None:
+            await self._send_json(writer, 409, {'error': 'No example generated!'}, keep_alive)
+            return
+        sampling_frequency = int(session.engine.get_settings()['sampling_frequency'])
+        writer.write(self._get_headers(
+            200,
+            'audio/wav',
+            keep_alive,
+            {'Transfer-Encoding': 'chunked'}
+        ))
+        self._write_chunk(writer, _get_wav_header(len(audio), sampling_frequency))
+        chunk_bytes = 2*self.CHUNK_SIZE
+        for start in range(0, len(audio), chunk_bytes):
+            self._write_chunk(writer, audio[start:start + chunk_bytes])
+            await writer.drain()
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    async def _grade_answer(self, session:ExerciseSession, data:dict) -> dict:
+        async with session.lock:
+            if session.examples == 0:
+                raise RuntimeError(
+                    '[ExerciseServer::_grade_answer()] No example generated!'
+                )
+            return session.engine.grade(data['answer'])
+
+    def _remove_idle_sessions(self):
+        now = time.monotonic()
+        for session_id in [
+            session_id
+            for session_id, session in self._sessions.items()
+            if now - session.last_access > self.SESSION_TIMEOUT
+        ]:
+            del self._sessions[session_id]
+
+    async def _send_json(self, writer, status:int, data:dict, keep_alive:bool):
+        await self._send(
+            writer,
+            status,
+            json.dumps(data).encode('utf-8'),
+            'application/json',
+            keep_alive
+        )
+
+    async def _send(
+        self,
+        writer,
+        status:int,
+        body:bytes,
+        content_type:str,
+        keep_alive:bool
+    ):
+        writer.write(self._get_headers(
+            status,
+            content_type,
+            keep_alive,
+            {'Content-Length': str(len(body))}
+        ) + body)
+        await writer.drain()
+
+    def _get_headers(
+        self,
+        status:int,
+        content_type:str,
+        keep_alive:bool,
+        extra_headers:dict
+    ) -> bytes:
+        lines = [
+            'HTTP/1.1 ' + str(status) + ' ' + self.REASONS[status],
+            'Content-Type: ' + content_type,
+            'Connection: ' + ('keep-alive' if keep_alive else 'close')
+        ]
+        for name, value in extra_headers.items():
+            lines.append(name + ': ' + value)
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    @staticmethod
+    def _write_chunk(writer, data:bytes):
+        writer.write(('%x' % len(data)).encode('latin-1') + b'\r\n' + data + b'\r\n')
+
+
+def _get_wav_header(data_size:int, sampling_frequency:int) -> bytes:
+    """
+    Get header of mono 16-bit WAV file.
+
+    :data_size: Size of samples in bytes.
+    :sampling_frequency: Sampling rate in hertz.
+
+    :returns: WAV header.
+    """
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF',
+        36 + data_size,
+        b'WAVE',
+        b'fmt ',
+        16,
+        1,
+        1,
+        sampling_frequency,
+        2*sampling_frequency,
+        2,
+        16,
+        b'data',
+        data_size
+    )
+
+
+# Browser client served at the root path
+_CLIENT_PAGE = '''<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Euterpe</title></head>
+<body>
+<h1>Euterpe</h1>
+<p>
+  <select id="exercise">
+    <option value="intervals">Intervals</option>
+    <option value="microtones">Microtones</option>
+    <option value="detuning">Detuning</option>
+    <option value="ten_o_pitches">Ten-O-Pitches</option>
+    <option value="voices">Voices</option>
+  </select>
+  <button id="start">Start</button>
+</p>
+<p>
+  <button id="generate" disabled>Generate New Example</button>
+  <audio id="audio" controls></audio>
+</p>
+<p>
+  <span id="answer_label">Answer in cents:</span> <input id="answer" type="text">
+  <button id="send" disabled>Answer</button>
+</p>
+<p id="result"></p>
+<script>
+let session = null;
+let exercise = null;
+async function post(path, data) {
+  const response = await fetch(path, {method: 'POST', body: JSON.stringify(data || {})});
+  return response.json();
+}
+document.getElementById('start').onclick = async () => {
+  exercise = document.getElementById('exercise').value;
+  session = (await post('/sessions', {exercise: exercise})).session;
+  document.getElementById('answer_label').textContent = exercise === 'voices'
+    ? 'Pitches in cents (chords separated by ";", pitches by ","):'
+    : 'Answer in cents:';
+  document.getElementById('generate').disabled = false;
+};
+document.getElementById('generate').onclick = async () => {
+  const example = await post('/sessions/' + session + '/examples');
+  const audio = document.getElementById('audio');
+  audio.src = '/sessions/' + session + '/audio?example=' + example.example;
+  audio.play();
+  document.getElementById('send').disabled = false;
+  document.getElementById('result').textContent = '';
+};
+document.getElementById('send').onclick = async () => {
+  const text = document.getElementById('answer').value;
+  const answer = exercise === 'voices'
+    ? text.split(';').map(chord => chord.split(',')
+        .filter(pitch => pitch.trim() !== '').map(parseFloat))
+    : parseFloat(text);
+  const result = await post('/sessions/' + session + '/answers', {answer: answer});
+  document.getElementById('result').textContent =
+    (result.correct ? 'Correct! ' : 'Wrong! ') + 'Correct value: '
+    + JSON.stringify(result.value);
+};
+</script>
+</body>
+</html>
+'''
@@ -20,3 +20,8 @@ setup(
    description='A synthesis module',
    packages=['synthesis']
 )
+setup(
+   name='server',
+   description='A server module',
+   packages=['server']
+)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import wave
+
+import numpy as np
+
+from synthesis.sample_format import SampleFormat
+
+class AudioWriter:
+    # Supported file formats
+    FILE_FORMATS = ('wav', 'flac')
+
+    def __init__(self, path:str, sampling_frequency:int):
+        """
+        Mono 16-bit audio file written block by block.
+        File format is chosen by extension: '.wav' or '.flac'.
+        FLAC files require 'soundfile' package.
+
+        :path: Path of the output file.
+        :sampling_frequency: Sampling rate in hertz.
+        """
+        self._file_format = os.path.splitext(path)[1][1:].lower()
+        if self._file_format == 'wav':
+            self._file = wave.open(path, 'wb')
+            self._file.setnchannels(1)
+            self._file.setsampwidth(2)
+            self._file.setframerate(sampling_frequency)
+        elif self._file_format == 'flac':
+            try:
+                import soundfile
+            except ImportError:
+                raise RuntimeError(
+                    '[AudioWriter::__init__(' + path + ')] '\
+                    + 'Writing FLAC files requires "soundfile" package!'
+                )
+            self._file = soundfile.SoundFile(
+                path,
+                'w',
+                samplerate=sampling_frequency,
+                channels=1,
+                subtype='PCM_16'
+            )
+        else:
+            raise ValueError(
+                '[AudioWriter::__init__(' + path + ')] '\
+                + 'Unknown file format "' + self._file_format + '"!'
+            )
+
+    def write(self, signal:np.array):
+        """
+        Append samples to the file.
+
+        :signal: Float signal in range <-1, 1> or int16 signal.
+        """
+        signal = SampleFormat.convert(signal, 'int16')
+        if self._file_format == 'wav':
+            self._file.writeframes(signal.astype('<i2', copy=False).tobytes())
+        else:
+            self._file.write(signal)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> 'AudioWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,15 +1,181 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import threading
+
 import numpy as np
-import sounddevice as sd
+
+from synthesis.ring_buffer import RingBuffer
+from synthesis.sample_format import SampleFormat
+
+# 'sounddevice' module, imported on first playback,
+# so that exercises can be used without audio device
+sd = None
+
+def _import_sounddevice():
+    global sd
+    if sd is None:
+        import sounddevice
+        sd = sounddevice
+    return sd
 
 class Player:
-    def __init__(self, sampling_frequency:int):
+    # Sample formats supported by audio device
+    SAMPLE_FORMATS = ('float32', 'int16')
+
+    def __init__(
+        self,
+        sampling_frequency:int,
+        streaming=False,
+        block_size=1024,
+        buffer_size=32768,
+        sample_format='float32'
+    ):
+        """
+        Class for signal playback.
+
+        :sampling_frequency: Sampling rate in hertz.
+        :streaming: If signals should be played by persistent output stream
+            fed block by block instead of being played at once.
+        :block_size: Number of samples requested by output stream at once.
+        :buffer_size: Number of samples buffered ahead of output stream.
+            Must be a power of 2.
+        :sample_format: Format of samples sent to audio device: 'float32' or 'int16'.
+            Signals in other formats are converted.
+        """
+        if sample_format not in self.SAMPLE_FORMATS:
+            raise ValueError(
+                '[Player::__init__('\
+                + str(sample_format)\
+                + ')] Unsupported sample format!'
+            )
         self._sampling_frequency = sampling_frequency
+        self._streaming = streaming
+        self._block_size = block_size
+        self._sample_format = sample_format
+        self._ring_buffer = RingBuffer(
+            buffer_size,
+            SampleFormat.get_dtype(sample_format)
+        )
+        self._stream = None
+        self._producer = None
+        self._stop_event = threading.Event()
+        self._flush_requested = False
+
+    def get_sampling_frequency(self) -> int:
+        return self._sampling_frequency
 
     def set_sampling_frequency(self, sampling_frequency:int):
         self._sampling_frequency = sampling_frequency
+        self.close()
+
+    def set_streaming(self, streaming:bool):
+        self._streaming = streaming
+
+    def is_streaming(self) -> bool:
+        return self._streaming
+
+    def get_sample_format(self) -> str:
+        return self._sample_format
 
     def play(self, signal:np.array):
-        sd.play(signal, self._sampling_frequency)
+        if self._streaming:
+            self.play_blocks(
+                signal[start:start + self._block_size]
+                for start in range(0, len(signal), self._block_size)
+            )
+        else:
+            self.stop()
+            _import_sounddevice().play(
+                SampleFormat.convert(signal, self._sample_format),
+                self._sampling_frequency
+            )
+
+    def play_blocks(self, blocks):
+        """
+        Play signal given block by block on persistent output stream.
+        Blocks are pulled by background thread only when there is free space
+        in the buffer, so they can be rendered while previous ones are played.
+
+        :blocks: Iterable of signal blocks of any length.
+        """
+        self.stop()
+        self._start_stream()
+        self._producer = threading.Thread(
+            target=self._produce,
+            args=(iter(blocks),),
+            daemon=True
+        )
+        self._producer.start()
+
+    def stop(self):
+        """
+        Stop actual playback.
+        """
+        if sd is not None:
+            sd.stop()
+        if self._producer is not None:
+            self._stop_event.set()
+            self._producer.join()
+            self._producer = None
+            self._stop_event.clear()
+        if self._stream is not None and self._stream.active:
+            self._flush_requested = True
+        else:
+            self._ring_buffer.clear()
+
+    def close(self):
+        """
+        Stop playback and close output stream.
+        """
+        self.stop()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self._flush_requested = False
+            self._ring_buffer.clear()
+
+    def _start_stream(self):
+        if self._stream is None:
+            self._stream = _import_sounddevice().OutputStream(
+                samplerate=self._sampling_frequency,
+                blocksize=self._block_size,
+                channels=1,
+                dtype=self._sample_format,
+                callback=self._callback
+            )
+        if not self._stream.active:
+            self._stream.start()
+
+    def _callback(self, outdata:np.array, frames:int, time, status):
+        """
+        Output stream callback. Fills output with buffered samples
+        and with silence if there are not enough of them.
+        """
+        if self._flush_requested:
+            self._ring_buffer.clear()
+            self._flush_requested = False
+        length = self._ring_buffer.read(outdata[:, 0])
+        outdata[length:] = 0
+
+    def _produce(self, blocks):
+        """
+        Move blocks to the buffer until all are written or playback is stopped.
+
+        :blocks: Iterator of signal blocks.
+        """
+        # Wait for samples of previous playback to be dropped
+        block_time = self._block_size / self._sampling_frequency
+        while self._flush_requested:
+            if self._stop_event.wait(block_time):
+                return
+
+        for block in blocks:
+            block = SampleFormat.convert(block, self._sample_format)
+            written = 0
+            while written < len(block):
+                written += self._ring_buffer.write(block[written:])
+                if written < len(block) and self._stop_event.wait(block_time):
+                    return
+            if self._stop_event.is_set():
+                return
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+class RenderCache:
+    def __init__(self, max_bytes=64*1024*1024):
+        """
+        Memory-bounded cache of rendered signals.
+        The least recently used signals are removed first.
+        Can be shared between threads.
+
+        :max_bytes: Maximal summed size of cached signals in bytes.
+        """
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._signals = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def set_max_bytes(self, max_bytes:int):
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._shrink()
+
+    def get_max_bytes(self) -> int:
+        return self._max_bytes
+
+    def get_bytes(self) -> int:
+        return self._bytes
+
+    def get_hits(self) -> int:
+        return self._hits
+
+    def get_misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._signals)
+
+    def get(self, key:tuple) -> np.array:
+        """
+        Get cached signal.
+
+        :key: Hashable description of the signal.
+
+        :returns: Read-only signal or None if signal is not cached.
+        """
+        with self._lock:
+            signal = self._signals.get(key)
+            if signal is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._signals.move_to_end(key)
+            return signal
+
+    def put(self, key:tuple, signal:np.array) -> np.array:
+        """
+        Add signal to the cache. Signal becomes read-only.
+
+        :key: Hashable description of the signal.
+        :signal: Signal to cache.
+
+        :returns: Cached signal.
+        """
+        signal.flags.writeable = False
+        with self._lock:
+            if signal.nbytes > self._max_bytes:
+                return signal
+            if key in self._signals:
+                self._bytes -= self._signals.pop(key).nbytes
+            self._signals[key] = signal
+            self._bytes += signal.nbytes
+            self._shrink()
+            return signal
+
+    def clear(self):
+        """
+        Remove all cached signals.
+        """
+        with self._lock:
+            self._signals.clear()
+            self._bytes = 0
+
+    def _shrink(self):
+        """
+        Remove the least recently used signals until cache fits its limit.
+        """
+        while self._bytes > self._max_bytes:
+            _, signal = self._signals.popitem(last=False)
+            self._bytes -= signal.nbytes
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+class RingBuffer:
+    def __init__(self, capacity:int, dtype=float):
+        """
+        Single-producer single-consumer queue of samples.
+        Producer only moves the write index and consumer only moves the read index,
+        so both sides can work from different threads without locks.
+
+        :capacity: Maximal number of stored samples. Must be a power of 2.
+        :dtype: Type of stored samples.
+        """
+        if capacity <= 0 or capacity & (capacity - 1) != 0:
+            raise ValueError(
+                '[RingBuffer::__init__('\
+                + str(capacity)\
+                + ')] Capacity must be a power of 2!'
+            )
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._mask = capacity - 1
+
+        # Total numbers of written and read samples
+        self._write_index = 0
+        self._read_index = 0
+
+    def get_capacity(self) -> int:
+        return len(self._buffer)
+
+    def get_available(self) -> int:
+        """
+        :returns: Number of samples that can be read.
+        """
+        return self._write_index - self._read_index
+
+    def get_free(self) -> int:
+        """
+        :returns: Number of samples that can be written.
+        """
+        return len(self._buffer) - (self._write_index - self._read_index)
+
+    def write(self, signal:np.array) -> int:
+        """
+        Write samples. Called by the producer only.
+
+        :signal: Samples to write. Only samples that fit in free space are written.
+
+        :returns: Number of written samples.
+        """
+        length = min(len(signal), self.get_free())
+        start = self._write_index & self._mask
+        first = min(length, len(self._buffer) - start)
+        self._buffer[start:start + first] = signal[:first]
+        self._buffer[:length - first] = signal[first:length]
+        self._write_index += length
+        return length
+
+    def read(self, output:np.array) -> int:
+        """
+        Read samples. Called by the consumer only.
+
+        :output: Array to fill with samples. Only available samples are read.
+
+        :returns: Number of read samples.
+        """
+        length = min(len(output), self.get_available())
+        start = self._read_index & self._mask
+        first = min(length, len(self._buffer) - start)
+        output[:first] = self._buffer[start:start + first]
+        output[first:length] = self._buffer[:length - first]
+        self._read_index += length
+        return length
+
+    def clear(self):
+        """
+        Drop all available samples. Called by the consumer only.
+        """
+        self._read_index = self._write_index
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+class SampleFormat:
+    # Supported sample formats and their types
+    FORMATS = {
+        'float32': np.float32,
+        'float64': np.float64,
+        'int16': np.int16
+    }
+
+    # Value of int16 sample corresponding to 1.0
+    INT16_SCALE = 32767
+
+    @staticmethod
+    def get_dtype(sample_format:str) -> np.dtype:
+        """
+        Get type of samples in given format.
+
+        :sample_format: Name of sample format: 'float32', 'float64' or 'int16'.
+
+        :returns: Type of samples.
+        """
+        if sample_format not in SampleFormat.FORMATS:
+            raise ValueError(
+                '[SampleFormat::get_dtype('\
+                + str(sample_format)\
+                + ')] Unknown sample format!'
+            )
+        return np.dtype(SampleFormat.FORMATS[sample_format])
+
+    @staticmethod
+    def get_render_dtype(sample_format:str) -> np.dtype:
+        """
+        Get type of samples used while generating signal in given format.
+        Integer signals are generated as float32 and converted at the end.
+
+        :sample_format: Name of sample format: 'float32', 'float64' or 'int16'.
+
+        :returns: Type of samples.
+        """
+        dtype = SampleFormat.get_dtype(sample_format)
+        if dtype.kind != 'f':
+            return np.dtype(np.float32)
+        return dtype
+
+    @staticmethod
+    def get_gain(dtype:np.dtype) -> np.floating:
+        """
+        Get gain converting samples of given type to range <-1, 1>.
+
+        :dtype: Type of samples.
+
+        :returns: Gain of the same floating point type as rendered samples.
+        """
+        if np.dtype(dtype) == np.int16:
+            return np.float32(1/SampleFormat.INT16_SCALE)
+        return np.dtype(dtype).type(1)
+
+    @staticmethod
+    def convert(signal:np.array, sample_format:str, copy=False) -> np.array:
+        """
+        Convert signal to given format.
+        Float signals are expected in range <-1, 1> and clipped when converted to int16.
+
+        :signal: Float or int16 signal.
+        :sample_format: Name of sample format: 'float32', 'float64' or 'int16'.
+        :copy: If new array should be returned even if signal already has given format.
+
+        :returns: Converted signal.
+        """
+        dtype = SampleFormat.get_dtype(sample_format)
+        if signal.dtype == dtype:
+            return signal.copy() if copy else signal
+        if dtype == np.int16:
+            result = np.clip(signal, -1, 1)
+            result *= SampleFormat.INT16_SCALE
+            return np.round(result, out=result).astype(np.int16)
+        result = signal.astype(dtype)
+        if signal.dtype == np.int16:
+            result *= dtype.type(1/SampleFormat.INT16_SCALE)
+        return result
@@ -1,37 +1,143 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import concurrent.futures
 import random
+import warnings
 
 import numpy as np
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python older than 3.8, timelines are always rendered serially
+    shared_memory = None
 
 from notes.chord import Chord
 from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
 from notes.interval import Interval
+from synthesis.render_cache import RenderCache
+from synthesis.sample_format import SampleFormat
 from synthesis.sine_synthesizer import SineSynthesizer
+from synthesis.timeline import Timeline
 
 class Synthesizer:
+    # Resolution of frequencies of cached sounds in cents
+    CACHE_RESOLUTION = 0.01
+
+    # Maximal number of sounds of equal length generated at once
+    BATCH_SIZE = 32
+
+    # Minimal summed length of timeline sounds in samples rendered by processes
+    PARALLEL_MIN_SAMPLES = 2**20
+
     def __init__(
         self,
         sampling_frequency:int,
-        base_synthesizer=SineSynthesizer
+        base_synthesizer=SineSynthesizer,
+        render_cache=None,
+        sample_format='float32',
+        processes=0
     ):
         """
         Class for signal generation from hights and intervals.
 
         :sampling_frequency: Sampling rate in hertz.
         :base_synthesizer: Any other 'synthesizer' class.
+        :render_cache: RenderCache object for generated sounds.
+            New cache is created if not given.
+        :sample_format: Format of generated and cached signals:
+            'float32', 'float64' or 'int16'.
+        :processes: Number of processes rendering long timelines.
+            Timelines are rendered serially if 0 or 1.
         """
         self._sampling_frequency = sampling_frequency
-        self._base_synthesizer = base_synthesizer(sampling_frequency)
+        self._sample_format = sample_format
+        self._render_dtype = SampleFormat.get_render_dtype(sample_format)
+        self._base_synthesizer = base_synthesizer(
+            sampling_frequency,
+            self._render_dtype
+        )
         self._volume = 1.0
+        if render_cache is None:
+            render_cache = RenderCache()
+        self._render_cache = render_cache
+        self._processes = processes
+        self._process_pool = None
+
+        # Own generator, so that rendering does not change global random state
+        self._rng = random.Random()
+
+    def copy(self) -> 'Synthesizer':
+        """
+        Create synthesizer of the same settings sharing the render cache.
+        Settings of the copy can be changed while this one is rendering.
+
+        :returns: New Synthesizer object.
+        """
+        synthesizer = Synthesizer(
+            self._sampling_frequency,
+            self._base_synthesizer.__class__,
+            self._render_cache,
+            self._sample_format,
+            self._processes
+        )
+        synthesizer._volume = self._volume
+        return synthesizer
+
+    def set_render_cache(self, render_cache:RenderCache):
+        """
+        Set cache of generated sounds. Cache can be shared by synthesizers,
+        because its keys describe synthesizer settings.
+
+        :render_cache: RenderCache object.
+        """
+        self._render_cache = render_cache
+
+    def get_render_cache(self) -> RenderCache:
+        return self._render_cache
+
+    def get_base_synthesizer(self) -> type:
+        return self._base_synthesizer.__class__
+
+    def get_sampling_frequency(self) -> int:
+        return self._sampling_frequency
 
     def set_sampling_frequency(self, sampling_frequency:int):
         self._sampling_frequency = sampling_frequency
         self._base_synthesizer = self._base_synthesizer.__class__(
-            sampling_frequency
+            sampling_frequency,
+            self._render_dtype
         )
 
+    def set_sample_format(self, sample_format:str):
+        self._render_dtype = SampleFormat.get_render_dtype(sample_format)
+        self._sample_format = sample_format
+        self._base_synthesizer = self._base_synthesizer.__class__(
+            self._sampling_frequency,
+            self._render_dtype
+        )
+
+    def get_sample_format(self) -> str:
+        return self._sample_format
+
+    def set_processes(self, processes:int):
+        """
+        Set number of processes rendering long timelines.
+
+        :processes: Number of processes. Timelines are rendered serially if 0 or 1.
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        self._processes = processes
+
+    def get_processes(self) -> int:
+        return self._processes
+
+    def get_volume(self) -> float:
+        return self._volume
+
     def set_volume(self, volume:float):
         if 0.0 <= volume <= 1.0:
             self._volume = volume
@@ -49,6 +155,386 @@ class Synthesizer:
     ) -> np.array:
         """
         Generate signal of given frequency and length.
+        Generated signals are cached, so the returned signal is read-only.
+
+        :frequency: Output signal frequency.
+        :time: Length of signal in seconds.
+
+        :returns: Output signal.
+        """
+        # Quantize frequency, so that close frequencies share cached signal
+        steps, frequency = self._quantize_frequencies(frequency)
+
+        # Use cached signal if possible
+        key = self._get_cache_key(int(steps), time)
+        result = self._render_cache.get(key)
+        if result is None:
+            result = self._render_cache.put(
+                key,
+                SampleFormat.convert(
+                    self._render_frequency(float(frequency), time),
+                    self._sample_format
+                )
+            )
+        return result
+
+    def generate_frequencies(
+        self,
+        frequencies:np.array,
+        time:float
+    ) -> np.array:
+        """
+        Generate signal of given frequencies played together.
+        All voices are generated at once and mixed.
+        Generated signals are cached, so the returned signal is read-only.
+
+        :frequencies: Frequencies of all voices.
+        :time: Length of signal in seconds.
+
+        :returns: Output signal.
+        """
+        # Quantize frequencies, so that close frequencies share cached signal
+        steps, frequencies = self._quantize_frequencies(frequencies)
+
+        # Use cached signal if possible
+        key = self._get_cache_key(tuple(steps), time)
+        result = self._render_cache.get(key)
+        if result is None:
+            result = self._render_cache.put(
+                key,
+                SampleFormat.convert(
+                    self._render_frequencies(
+                        frequencies,
+                        [time]*len(frequencies)
+                    ).sum(axis=0),
+                    self._sample_format
+                )
+            )
+        return result
+
+    def generate_timeline(self, timeline:Timeline) -> np.array:
+        """
+        Generate signal of given timeline.
+        Output is allocated once and every sound is added at its offset.
+        Identical sounds are generated only once
+        and sounds of equal length are generated together.
+        Long timelines are split between processes, if they are set.
+
+        :timeline: Timeline to generate.
+
+        :returns: Output signal.
+        """
+        length = int(round(self._sampling_frequency*timeline.get_duration()))
+        events = timeline.get_events()
+        if self._processes > 1 and shared_memory is not None\
+                and sum(event.get_duration() for event in events)\
+                * self._sampling_frequency >= self.PARALLEL_MIN_SAMPLES:
+            output = self._mix_events_parallel(events, length)
+        else:
+            output = np.zeros(length, dtype=self._render_dtype)
+            self._mix_events(events, output)
+        return SampleFormat.convert(output, self._sample_format)
+
+    def _mix_events(self, events:list, output:np.array):
+        """
+        Add sounds of events to output.
+
+        :events: List of NoteEvent objects.
+        :output: Signal of render type the sounds are added to.
+        """
+        if len(events) == 0:
+            return
+
+        # Quantize frequencies, so that close frequencies share cached signal
+        steps, frequencies = self._quantize_frequencies(
+            PitchArray([event.get_cents() for event in events]).get_frequencies()
+        )
+
+        # Find sounds missing in cache
+        keys = list()
+        sounds = dict()
+        missing = dict()
+        uncached = set()
+        for index, (event, step, frequency) in enumerate(zip(events, steps, frequencies)):
+            if event.is_cacheable():
+                key = self._get_cache_key(int(step), event.get_duration())
+            else:
+                # Sound is used only once, so it must not evict cached sounds
+                key = (None, index)
+                uncached.add(key)
+            keys.append(key)
+            if key not in sounds:
+                sounds[key] = None if key in uncached else self._render_cache.get(key)
+                if sounds[key] is None:
+                    missing.setdefault(event.get_duration(), dict())[key] = frequency
+
+        # Generate missing sounds, sounds of equal length together
+        for time, group in missing.items():
+            group_keys = list(group.keys())
+            for start in range(0, len(group_keys), self.BATCH_SIZE):
+                batch_keys = group_keys[start:start + self.BATCH_SIZE]
+                signals = self._render_frequencies(
+                    np.array([group[key] for key in batch_keys]),
+                    [time]*len(batch_keys)
+                )
+                for key, signal in zip(batch_keys, signals):
+                    sounds[key] = SampleFormat.convert(
+                        signal,
+                        self._sample_format,
+                        copy=True
+                    )
+                    if key not in uncached:
+                        sounds[key] = self._render_cache.put(key, sounds[key])
+
+        # Add sounds to output
+        for event, key in zip(events, keys):
+            sound = sounds[key]
+            offset = int(round(self._sampling_frequency*event.get_onset()))
+            length = min(len(sound), len(output) - offset)
+            gain = SampleFormat.get_gain(sound.dtype)*event.get_gain()
+            if gain == 1:
+                output[offset:offset + length] += sound[:length]
+            else:
+                output[offset:offset + length] += gain*sound[:length]
+
+    def _mix_events_parallel(self, events:list, length:int) -> np.array:
+        """
+        Add sounds of events to output in worker processes.
+        Every process mixes its part of events to its own row of shared memory,
+        so rendered signals are not sent between processes.
+
+        :events: List of NoteEvent objects.
+        :length: Length of output in samples.
+
+        :returns: Output signal of render type.
+        """
+        # Split events between processes, the longest first
+        parts = [list() for i in range(self._processes)]
+        part_times = np.zeros(self._processes)
+        for event in sorted(events, key=lambda x: x.get_duration(), reverse=True):
+            part = int(np.argmin(part_times))
+            parts[part].append(event)
+            part_times[part] += event.get_duration()
+        parts = [part for part in parts if len(part) > 0]
+
+        # Mix parts
+        dtype = np.dtype(self._render_dtype)
+        shape = (len(parts), length)
+        memory = shared_memory.SharedMemory(
+            create=True,
+            size=max(1, len(parts)*length*dtype.itemsize)
+        )
+        try:
+            settings = (
+                self._base_synthesizer.__class__,
+                self._sampling_frequency,
+                self._volume,
+                self._sample_format
+            )
+            list(self._get_process_pool().map(
+                _mix_events_part,
+                [
+                    (
+                        memory.name,
+                        shape,
+                        dtype.str,
+                        i,
+                        parts[i],
+                        settings,
+                        self._rng.randrange(2**32)
+                    )
+                    for i in range(len(parts))
+                ]
+            ))
+            rows = np.ndarray(shape, dtype, buffer=memory.buf)
+            output = np.sum(rows, axis=0, dtype=dtype)
+            del rows
+        finally:
+            memory.close()
+            memory.unlink()
+        return output
+
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._processes
+            )
+        return self._process_pool
+
+    def generate_timeline_blocks(self, timeline:Timeline, block_size=1024):
+        """
+        Generate signal of given timeline block by block.
+        Sounds are generated only when they are reached,
+        so memory usage does not depend on the length of the timeline.
+
+        :timeline: Timeline to generate.
+        :block_size: Number of samples in every block. The last block may be shorter.
+
+        :returns: Generator of output signal blocks.
+        """
+        length = int(round(self._sampling_frequency*timeline.get_duration()))
+        events = sorted(timeline.get_events(), key=lambda event: event.get_onset())
+        next_event = 0
+
+        # Sounds being played: [offset, gain, generator of blocks, not yet used samples]
+        voices = list()
+        for start in range(0, length, block_size):
+            stop = min(start + block_size, length)
+            output = np.zeros(stop - start, dtype=self._render_dtype)
+
+            # Start sounds beginning in this block
+            while next_event < len(events)\
+                    and int(round(self._sampling_frequency*events[next_event].get_onset())) < stop:
+                event = events[next_event]
+                voices.append([
+                    int(round(self._sampling_frequency*event.get_onset())),
+                    event.get_gain(),
+                    self._generate_sound_blocks(
+                        event.get_frequency(),
+                        event.get_duration(),
+                        block_size,
+                        event.is_cacheable()
+                    ),
+                    np.zeros(0)
+                ])
+                next_event += 1
+
+            # Add sounds to output
+            for voice in voices:
+                offset, gain, blocks, pending = voice
+                position = max(offset, start)
+                while position < stop:
+                    if len(pending) == 0:
+                        pending = next(blocks, None)
+                        if pending is None:
+                            break
+                    samples = min(stop - position, len(pending))
+                    pending_gain = SampleFormat.get_gain(pending.dtype)*gain
+                    if pending_gain == 1:
+                        output[position - start:position - start + samples] += pending[:samples]
+                    else:
+                        output[position - start:position - start + samples] += pending_gain*pending[:samples]
+                    pending = pending[samples:]
+                    position += samples
+                voice[0] = position
+                voice[3] = pending
+            voices = [voice for voice in voices if voice[3] is not None]
+            yield SampleFormat.convert(output, self._sample_format)
+
+    def _generate_sound_blocks(
+        self,
+        frequency:float,
+        time:float,
+        block_size:int,
+        cacheable=True
+    ):
+        """
+        Generate signal of given frequency and length block by block.
+        Cached signal is used if possible, but new signals are not cached.
+
+        :frequency: Output signal frequency.
+        :time: Length of signal in seconds.
+        :block_size: Number of samples in every block. The last block may be shorter.
+        :cacheable: If cached signal should be looked up.
+
+        :returns: Generator of signal blocks.
+        """
+        # Quantize frequency, so that the signal is the same as the cached one
+        steps, frequency = self._quantize_frequencies(frequency)
+
+        # Use cached signal if possible
+        result = None
+        if cacheable:
+            result = self._render_cache.get(self._get_cache_key(int(steps), time))
+        if result is not None:
+            for start in range(0, len(result), block_size):
+                yield result[start:start + block_size]
+            return
+
+        length = int(self._sampling_frequency*time)
+        fade_signal = self._get_fade_signal()
+        fade_out_start = length - len(fade_signal)
+        clipping = False
+        position = 0
+        for block in self._base_synthesizer.generate_frequency_blocks(
+            frequency=float(frequency),
+            time=time,
+            block_size=block_size
+        ):
+            # Add fades
+            if position < len(fade_signal):
+                samples = min(len(block), len(fade_signal) - position)
+                block[:samples] *= fade_signal[position:position + samples]
+            if position + len(block) > fade_out_start:
+                first = max(fade_out_start - position, 0)
+                block[first:] *= np.flip(fade_signal)[
+                    position + first - fade_out_start:position + len(block) - fade_out_start
+                ]
+            position += len(block)
+
+            # Apply volume
+            block *= self._volume
+
+            # Check for clipping
+            if not clipping and np.max(np.abs(block)) > 1.0:
+                warnings.warn('[Synthesizer] Clipping warning!', RuntimeWarning)
+                clipping = True
+
+            yield block
+
+    def _get_cache_key(self, steps, time:float) -> tuple:
+        """
+        Get description of sound used as render cache key.
+        Sounds of noisy synthesizers get one of several random variants.
+
+        :steps: Number of resolution steps away from 440Hz of every voice.
+        :time: Length of sound in seconds.
+
+        :returns: Cache key.
+        """
+        return (
+            self._base_synthesizer.__class__,
+            self._sampling_frequency,
+            steps,
+            int(self._sampling_frequency*time),
+            self._volume,
+            self._sample_format,
+            self._rng.randrange(self._base_synthesizer.render_variants)
+        )
+
+    def _quantize_frequencies(self, frequencies:np.array) -> (np.array, np.array):
+        """
+        Round frequencies to the resolution of cached sounds.
+
+        :frequencies: Frequency or array of frequencies.
+
+        :returns: Number of resolution steps away from 440Hz, Rounded frequencies.
+        """
+        steps = np.round(
+            1200*np.log2(np.asarray(frequencies, dtype=float)/440)
+            / self.CACHE_RESOLUTION
+        ).astype(int)
+        return steps, 440*np.power(2, steps*self.CACHE_RESOLUTION/1200)
+
+    def _get_fade_signal(self) -> np.array:
+        """
+        Get fade-in applied to the beginning of every sound.
+        Reversed fade is applied to the end of every sound.
+
+        :returns: Fade signal.
+        """
+        return np.concatenate([
+            np.zeros(int(self._sampling_frequency/20), dtype=self._render_dtype),
+            np.arange(0, 1, step=100/self._sampling_frequency, dtype=self._render_dtype)
+        ])
+
+    def _render_frequency(
+        self,
+        frequency:float,
+        time:float
+    ) -> np.array:
+        """
+        Generate signal of given frequency and length without caching.
 
         :frequency: Output signal frequency.
         :time: Length of signal in seconds.
@@ -62,10 +548,7 @@ class Synthesizer:
         )
 
         # Add fades
-        fade_signal = np.concatenate([
-            np.zeros(int(self._sampling_frequency/20)),
-            np.arange(0, 1, step=100/self._sampling_frequency, dtype=float)
-        ])
+        fade_signal = self._get_fade_signal()
         result[:len(fade_signal)] = result[:len(fade_signal)] * fade_signal
         result[-len(fade_signal):] = result[-len(fade_signal):] * np.flip(fade_signal)
 
@@ -74,7 +557,48 @@ class Synthesizer:
 
         # Check for clipping
         if np.max(np.abs(result)) > 1.0:
-            print('[Synthesizer] Clipping warning!')
+            warnings.warn('[Synthesizer] Clipping warning!', RuntimeWarning)
+
+        return result
+
+    def _render_frequencies(
+        self,
+        frequencies:np.array,
+        times:list
+    ) -> np.array:
+        """
+        Generate signals of given frequencies and lengths without caching.
+        All voices are generated at once as rows of one array.
+
+        :frequencies: Frequency of every voice.
+        :times: Length of every voice in seconds.
+
+        :returns: Array of signals (voices x samples).
+            Signals shorter than the longest one are followed by silence.
+        """
+        # Generate base signals
+        result = self._base_synthesizer.generate_frequencies(
+            frequencies=frequencies,
+            time=max(times)
+        )
+
+        # Add fades
+        fade_signal = self._get_fade_signal()
+        lengths = [int(self._sampling_frequency*time) for time in times]
+        result[:, :len(fade_signal)] *= fade_signal
+        if min(lengths) == max(lengths):
+            result[:, -len(fade_signal):] *= np.flip(fade_signal)
+        else:
+            for i in range(len(lengths)):
+                result[i, lengths[i] - len(fade_signal):lengths[i]] *= np.flip(fade_signal)
+                result[i, lengths[i]:] = 0
+
+        # Apply volume
+        result *= self._volume
+
+        # Check for clipping
+        if np.max(np.abs(result)) > 1.0:
+            warnings.warn('[Synthesizer] Clipping warning!', RuntimeWarning)
 
         return result
 
@@ -89,6 +613,19 @@ class Synthesizer:
         """
         return self.generate_frequency(pitch.get_frequency(), time)
 
+    def generate_pitches(self, pitches, time:float) -> np.array:
+        """
+        Generate signal of given length and pitches played together.
+
+        :pitches: PitchArray object or list of Pitch objects of output sound.
+        :time: Length of sound in seconds.
+
+        :returns: Output signal.
+        """
+        if not isinstance(pitches, PitchArray):
+            pitches = PitchArray.from_pitches(pitches)
+        return self.generate_frequencies(pitches.get_frequencies().ravel(), time)
+
     def generate_memory_flush(
         self,
         lowest_pitch:Pitch,
@@ -108,19 +645,13 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        output = np.zeros(0)
-        for i in range(random.randint(min_sounds, max_sounds)):
-            output = np.concatenate([
-                output,
-                self.generate_frequency(
-                    random.uniform(
-                        lowest_pitch.get_frequency(),
-                        highest_pitch.get_frequency()
-                    ),
-                    sound_play_time
-                )
-            ])
-        return output
+        return self.generate_timeline(Timeline.memory_flush(
+            lowest_pitch,
+            highest_pitch,
+            min_sounds,
+            max_sounds,
+            sound_play_time
+        ))
 
     def generate_interval_up(
         self,
@@ -142,11 +673,12 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        return np.concatenate([
-            self.generate_pitch(lower_pitch, play_time),
-            np.zeros(int(self._sampling_frequency*pause_time)),
-            self.generate_pitch(higher_pitch, play_time)
-        ])
+        return self.generate_timeline(Timeline.interval_up(
+            lower_pitch,
+            higher_pitch,
+            play_time,
+            pause_time
+        ))
 
     def generate_interval_down(
         self,
@@ -168,11 +700,12 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        return np.concatenate([
-            self.generate_pitch(higher_pitch, play_time),
-            np.zeros(int(self._sampling_frequency*pause_time)),
-            self.generate_pitch(lower_pitch, play_time)
-        ])
+        return self.generate_timeline(Timeline.interval_down(
+            lower_pitch,
+            higher_pitch,
+            play_time,
+            pause_time
+        ))
 
     def generate_interval_up_hold(
         self,
@@ -194,17 +727,12 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        return np.concatenate([
-            self.generate_pitch(lower_pitch, play_time),
-            np.zeros(int(self._sampling_frequency*pause_time)),
-            self.generate_pitch(
-                lower_pitch,
-                play_time
-            ) + self.generate_pitch(
-                higher_pitch,
-                play_time
-            )
-        ])
+        return self.generate_timeline(Timeline.interval_up_hold(
+            lower_pitch,
+            higher_pitch,
+            play_time,
+            pause_time
+        ))
 
     def generate_interval_down_hold(
         self,
@@ -226,17 +754,12 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        return np.concatenate([
-            self.generate_pitch(higher_pitch, play_time),
-            np.zeros(int(self._sampling_frequency*pause_time)),
-            self.generate_pitch(
-                lower_pitch,
-                play_time
-            ) + self.generate_pitch(
-                higher_pitch,
-                play_time
-            )
-        ])
+        return self.generate_timeline(Timeline.interval_down_hold(
+            lower_pitch,
+            higher_pitch,
+            play_time,
+            pause_time
+        ))
 
     def generate_interval_together(
         self,
@@ -254,13 +777,11 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        return self.generate_pitch(
+        return self.generate_timeline(Timeline.interval_together(
             lower_pitch,
-            play_time
-        ) + self.generate_pitch(
             higher_pitch,
             play_time
-        )
+        ))
 
     def generate_chords_up(
         self,
@@ -282,26 +803,12 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        output = np.zeros(0)
-        for chord in chords:
-            for i in range(chord.get_size()):
-                output = np.concatenate([
-                    output,
-                    self.generate_pitch(
-                        chord.get_pitch(i),
-                        sound_play_time
-                    ),
-                    np.zeros(int(
-                        self._sampling_frequency*sound_pause_time
-                    ))
-                ])
-            output = np.concatenate([
-                output,
-                np.zeros(int(
-                    self._sampling_frequency*chord_pause_time
-                ))
-            ])
-        return output
+        return self.generate_timeline(Timeline.chords_up(
+            chords,
+            sound_play_time,
+            sound_pause_time,
+            chord_pause_time
+        ))
 
     def generate_chords_down(
         self,
@@ -323,26 +830,12 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        output = np.zeros(0)
-        for chord in chords:
-            for i in range(chord.get_size()):
-                output = np.concatenate([
-                    output,
-                    self.generate_pitch(
-                        chord.get_pitch(chord.get_size() - i - 1),
-                        sound_play_time
-                    ),
-                    np.zeros(int(
-                        self._sampling_frequency*sound_pause_time
-                    ))
-                ])
-            output = np.concatenate([
-                output,
-                np.zeros(int(
-                    self._sampling_frequency*chord_pause_time
-                ))
-            ])
-        return output
+        return self.generate_timeline(Timeline.chords_down(
+            chords,
+            sound_play_time,
+            sound_pause_time,
+            chord_pause_time
+        ))
 
     def generate_chords_up_hold(
         self,
@@ -361,29 +854,11 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        output = np.zeros(0)
-        for chord in chords:
-            chord_signal = np.zeros(int(
-                self._sampling_frequency*sound_delay*chord.get_size()
-            ))
-            for i in range(chord.get_size()):
-                chord_signal += np.concatenate([
-                    np.zeros(int(
-                        self._sampling_frequency*sound_delay*i
-                    )),
-                    self.generate_pitch(
-                        chord.get_pitch(i),
-                        sound_delay*(chord.get_size() - i)
-                    )
-                ])
-            output = np.concatenate([
-                output,
-                chord_signal,
-                np.zeros(int(
-                    self._sampling_frequency*chord_pause_time
-                ))
-            ])
-        return output
+        return self.generate_timeline(Timeline.chords_up_hold(
+            chords,
+            sound_delay,
+            chord_pause_time
+        ))
 
     def generate_chords_down_hold(
         self,
@@ -402,29 +877,11 @@ class Synthesizer:
 
         :returns: Output signal.
         """
-        output = np.zeros(0)
-        for chord in chords:
-            chord_signal = np.zeros(int(
-                self._sampling_frequency*sound_delay*chord.get_size()
-            ))
-            for i in range(chord.get_size()):
-                chord_signal += np.concatenate([
-                    np.zeros(int(
-                        self._sampling_frequency*sound_delay*i
-                    )),
-                    self.generate_pitch(
-                        chord.get_pitch(chord.get_size() - i - 1),
-                        sound_delay*(chord.get_size() - i)
-                    )
-                ])
-            output = np.concatenate([
-                output,
-                chord_signal,
-                np.zeros(int(
-                    self._sampling_frequency*chord_pause_time
-                ))
-            ])
-        return output
+        return self.generate_timeline(Timeline.chords_down_hold(
+            chords,
+            sound_delay,
+            chord_pause_time
+        ))
 
     def generate_chords_together(
         self,
@@ -438,24 +895,48 @@ class Synthesizer:
 
         :chords: List of chords to play.
         :play_time_per_sound: Length of chord in seconds divided by the number of sounds in a chord.
+        :chord_pause_time: Length of pause between chords in seconds.
 
         :returns: Output signal.
         """
-        output = np.zeros(0)
-        for chord in chords:
-            chord_signal = np.zeros(int(
-                self._sampling_frequency*play_time_per_sound*chord.get_size()
-            ))
-            for i in range(chord.get_size()):
-                chord_signal += self.generate_pitch(
-                        chord.get_pitch(i),
-                        play_time_per_sound*chord.get_size()
-                    )
-            output = np.concatenate([
-                output,
-                chord_signal,
-                np.zeros(int(
-                    self._sampling_frequency*chord_pause_time
-                ))
-            ])
-        return output
+        return self.generate_timeline(Timeline.chords_together(
+            chords,
+            play_time_per_sound,
+            chord_pause_time
+        ))
+
+
+# Synthesizers of worker processes, by their settings
+_process_synthesizers = dict()
+
+def _mix_events_part(task:tuple):
+    """
+    Add sounds of part of events to row of shared output.
+    Called in worker processes.
+
+    :task: Name of shared memory, shape of rows, type of samples, row index,
+        list of NoteEvent objects, synthesizer settings, seed of random generators.
+    """
+    name, shape, dtype, row, events, settings, seed = task
+    if settings not in _process_synthesizers:
+        base_synthesizer, sampling_frequency, volume, sample_format = settings
+        synthesizer = Synthesizer(
+            sampling_frequency,
+            base_synthesizer,
+            sample_format=sample_format
+        )
+        synthesizer.set_volume(volume)
+        _process_synthesizers[settings] = synthesizer
+
+    # Processes are forked with the same random state, so they are seeded
+    _process_synthesizers[settings]._rng.seed(seed)
+    np.random.seed(seed)
+
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        rows = np.ndarray(shape, np.dtype(dtype), buffer=memory.buf)
+        rows[row] = 0
+        _process_synthesizers[settings]._mix_events(events, rows[row])
+        del rows
+    finally:
+        memory.close()
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+
+import numpy as np
+
+from notes.pitch import Pitch
+
+class NoteEvent:
+    def __init__(
+        self,
+        onset:float,
+        duration:float,
+        cents:float,
+        gain=1.0,
+        cacheable=True
+    ):
+        """
+        Single sound of a timeline.
+
+        :onset: Start of the sound in seconds.
+        :duration: Length of the sound in seconds.
+        :cents: Number of cents away from A4 (midi 69, 440Hz).
+        :gain: Gain of the sound.
+        :cacheable: If the sound may be repeated, so it should be rendered
+            through render cache.
+        """
+        self._onset = onset
+        self._duration = duration
+        self._cents = cents
+        self._gain = gain
+        self._cacheable = cacheable
+
+    def get_onset(self) -> float:
+        return self._onset
+
+    def get_duration(self) -> float:
+        return self._duration
+
+    def get_end(self) -> float:
+        return self._onset + self._duration
+
+    def get_cents(self) -> float:
+        return self._cents
+
+    def get_frequency(self) -> float:
+        return np.power(2, self._cents/1200) * 440
+
+    def get_gain(self) -> float:
+        return self._gain
+
+    def is_cacheable(self) -> bool:
+        return self._cacheable
+
+
+class Timeline:
+    def __init__(self):
+        """
+        Score of sounds rendered by Synthesizer.generate_timeline.
+        """
+        self._events = list()
+        self._duration = 0.0
+
+    def add_note(
+        self,
+        onset:float,
+        duration:float,
+        cents:float,
+        gain=1.0,
+        cacheable=True
+    ):
+        """
+        Add sound to the timeline.
+
+        :onset: Start of the sound in seconds.
+        :duration: Length of the sound in seconds.
+        :cents: Number of cents away from A4 (midi 69, 440Hz).
+        :gain: Gain of the sound.
+        :cacheable: If the sound should be rendered through render cache.
+        """
+        self._events.append(NoteEvent(onset, duration, cents, gain, cacheable))
+        self._duration = max(self._duration, onset + duration)
+
+    def add_pitch(
+        self,
+        onset:float,
+        duration:float,
+        pitch:Pitch,
+        gain=1.0,
+        cacheable=True
+    ):
+        """
+        Add sound of given pitch to the timeline.
+
+        :onset: Start of the sound in seconds.
+        :duration: Length of the sound in seconds.
+        :pitch: Pitch of the sound.
+        :gain: Gain of the sound.
+        :cacheable: If the sound should be rendered through render cache.
+        """
+        self.add_note(onset, duration, pitch.get_cents_from_a(), gain, cacheable)
+
+    def add_timeline(self, timeline:'Timeline', onset:float):
+        """
+        Add all sounds of other timeline.
+
+        :timeline: Timeline to add.
+        :onset: Start of the added timeline in seconds.
+        """
+        for event in timeline.get_events():
+            self.add_note(
+                onset + event.get_onset(),
+                event.get_duration(),
+                event.get_cents(),
+                event.get_gain(),
+                event.is_cacheable()
+            )
+        self.extend(onset + timeline.get_duration())
+
+    def extend(self, duration:float):
+        """
+        Make the timeline at least <duration> seconds long.
+        Added time is silent.
+
+        :duration: Minimal length of the timeline in seconds.
+        """
+        self._duration = max(self._duration, duration)
+
+    def get_events(self) -> list:
+        return self._events
+
+    def get_duration(self) -> float:
+        return self._duration
+
+    @staticmethod
+    def memory_flush(
+        lowest_pitch:Pitch,
+        highest_pitch:Pitch,
+        min_sounds=8,
+        max_sounds=12,
+        sound_play_time=0.2,
+        rng=random
+    ) -> 'Timeline':
+        """
+        Series of random frequencies and random length.
+        Random sounds are almost never repeated, so they are not cached.
+
+        :lowest_pitch: The lowest pitch
+        :highest_pitch: The highest pitch
+        :min_sounds: Minimal number of sounds in a series.
+        :max_sounds: Maximal number of sounds in a series.
+        :sound_play_time: Length of every sound in seconds.
+        :rng: Random generator of the sounds.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        for i in range(rng.randint(min_sounds, max_sounds)):
+            timeline.add_pitch(
+                i*sound_play_time,
+                sound_play_time,
+                Pitch.from_frequency(rng.uniform(
+                    lowest_pitch.get_frequency(),
+                    highest_pitch.get_frequency()
+                )),
+                cacheable=False
+            )
+        return timeline
+
+    @staticmethod
+    def interval_up(
+        lower_pitch:Pitch,
+        higher_pitch:Pitch,
+        play_time=0.4,
+        pause_time=0.2
+    ) -> 'Timeline':
+        """
+        Interval played in order:
+        - lower for <play_time>
+        - pause for <pause_time>
+        - higher for <play_time>
+
+        :lower_pitch: The lower pitch
+        :higher_pitch: The higher pitch
+        :play_time: Length of both sounds in seconds.
+        :pause_time: Length of pause between sounds in seconds.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        timeline.add_pitch(0, play_time, lower_pitch)
+        timeline.add_pitch(play_time + pause_time, play_time, higher_pitch)
+        return timeline
+
+    @staticmethod
+    def interval_down(
+        lower_pitch:Pitch,
+        higher_pitch:Pitch,
+        play_time=0.4,
+        pause_time=0.2
+    ) -> 'Timeline':
+        """
+        Interval played in order:
+        - higher for <play_time>
+        - pause for <pause_time>
+        - lower for <play_time>
+
+        :lower_pitch: The lower pitch
+        :higher_pitch: The higher pitch
+        :play_time: Length of both sounds in seconds.
+        :pause_time: Length of pause between sounds in seconds.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        timeline.add_pitch(0, play_time, higher_pitch)
+        timeline.add_pitch(play_time + pause_time, play_time, lower_pitch)
+        return timeline
+
+    @staticmethod
+    def interval_up_hold(
+        lower_pitch:Pitch,
+        higher_pitch:Pitch,
+        play_time=0.5,
+        pause_time=0
+    ) -> 'Timeline':
+        """
+        Interval played in order:
+        - lower for <play_time>
+        - pause for <pause_time>
+        - lower + higher for <play_time>
+
+        :lower_pitch: The lower pitch
+        :higher_pitch: The higher pitch
+        :play_time: Length of both sounds in seconds.
+        :pause_time: Length of pause between sounds in seconds.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        timeline.add_pitch(0, play_time, lower_pitch)
+        timeline.add_pitch(play_time + pause_time, play_time, lower_pitch)
+        timeline.add_pitch(play_time + pause_time, play_time, higher_pitch)
+        return timeline
+
+    @staticmethod
+    def interval_down_hold(
+        lower_pitch:Pitch,
+        higher_pitch:Pitch,
+        play_time=0.5,
+        pause_time=0
+    ) -> 'Timeline':
+        """
+        Interval played in order:
+        - higher for <play_time>
+        - pause for <pause_time>
+        - lower + higher for <play_time>
+
+        :lower_pitch: The lower pitch
+        :higher_pitch: The higher pitch
+        :play_time: Length of both sounds in seconds.
+        :pause_time: Length of pause between sounds in seconds.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        timeline.add_pitch(0, play_time, higher_pitch)
+        timeline.add_pitch(play_time + pause_time, play_time, lower_pitch)
+        timeline.add_pitch(play_time + pause_time, play_time, higher_pitch)
+        return timeline
+
+    @staticmethod
+    def interval_together(
+        lower_pitch:Pitch,
+        higher_pitch:Pitch,
+        play_time=1
+    ) -> 'Timeline':
+        """
+        Interval played in order:
+        - lower + higher for <play_time>
+
+        :lower_pitch: The lower pitch
+        :higher_pitch: The higher pitch
+        :play_time: Length of both sounds in seconds.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        timeline.add_pitch(0, play_time, lower_pitch)
+        timeline.add_pitch(0, play_time, higher_pitch)
+        return timeline
+
+    @staticmethod
+    def chords_up(
+        chords:list,
+        sound_play_time=0.4,
+        sound_pause_time=0,
+        chord_pause_time=0
+    ) -> 'Timeline':
+        """
+        Chords with pitches played from the lowest to the highest
+        each for <play_time> seconds
+        with <pause_time> seconds of silence between.
+
+        :chords: List of chords to play.
+        :sound_play_time: Length of each sound in seconds.
+        :sound_pause_time: Length of pause between sounds in seconds.
+        :chord_pause_time: Length of pause between chords in seconds.
+
+        :returns: Timeline object.
+        """
+        return Timeline._chords_sequence(
+            chords,
+            sound_play_time,
+            sound_pause_time,
+            chord_pause_time,
+            reverse=False
+        )
+
+    @staticmethod
+    def chords_down(
+        chords:list,
+        sound_play_time=0.4,
+        sound_pause_time=0,
+        chord_pause_time=0
+    ) -> 'Timeline':
+        """
+        Chords with pitches played from the highest to the lowest
+        each for <play_time> seconds
+        with <pause_time> seconds of silence between.
+
+        :chords: List of chords to play.
+        :sound_play_time: Length of each sound in seconds.
+        :sound_pause_time: Length of pause between sounds in seconds.
+        :chord_pause_time: Length of pause between chords in seconds.
+
+        :returns: Timeline object.
+        """
+        return Timeline._chords_sequence(
+            chords,
+            sound_play_time,
+            sound_pause_time,
+            chord_pause_time,
+            reverse=True
+        )
+
+    @staticmethod
+    def chords_up_hold(
+        chords:list,
+        sound_delay=0.4,
+        chord_pause_time=0
+    ) -> 'Timeline':
+        """
+        Chords with pitches played from the lowest to the highest
+        adding new one every <sound_delay> seconds.
+
+        :chords: List of chords to play.
+        :sound_delay: Delay of next pitch.
+        :chord_pause_time: Length of pause between chords in seconds.
+
+        :returns: Timeline object.
+        """
+        return Timeline._chords_hold(
+            chords,
+            sound_delay,
+            chord_pause_time,
+            reverse=False
+        )
+
+    @staticmethod
+    def chords_down_hold(
+        chords:list,
+        sound_delay=0.4,
+        chord_pause_time=0
+    ) -> 'Timeline':
+        """
+        Chords with pitches played from the highest to the lowest
+        adding new one every <sound_delay> seconds.
+
+        :chords: List of chords to play.
+        :sound_delay: Delay of next pitch.
+        :chord_pause_time: Length of pause between chords in seconds.
+
+        :returns: Timeline object.
+        """
+        return Timeline._chords_hold(
+            chords,
+            sound_delay,
+            chord_pause_time,
+            reverse=True
+        )
+
+    @staticmethod
+    def chords_together(
+        chords:list,
+        play_time_per_sound=0.4,
+        chord_pause_time=0
+    ) -> 'Timeline':
+        """
+        Chords with pitches played together for <play_time_per_sound>*<chords.get_size()> seconds.
+
+        :chords: List of chords to play.
+        :play_time_per_sound: Length of chord in seconds divided by the number of sounds in a chord.
+        :chord_pause_time: Length of pause between chords in seconds.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        onset = 0
+        for chord in chords:
+            chord_time = play_time_per_sound*chord.get_size()
+            for i in range(chord.get_size()):
+                timeline.add_pitch(onset, chord_time, chord.get_pitch(i))
+            onset += chord_time + chord_pause_time
+        timeline.extend(onset)
+        return timeline
+
+    @staticmethod
+    def _chords_sequence(
+        chords:list,
+        sound_play_time:float,
+        sound_pause_time:float,
+        chord_pause_time:float,
+        reverse:bool
+    ) -> 'Timeline':
+        """
+        Chords with pitches played one after another.
+
+        :chords: List of chords to play.
+        :sound_play_time: Length of each sound in seconds.
+        :sound_pause_time: Length of pause between sounds in seconds.
+        :chord_pause_time: Length of pause between chords in seconds.
+        :reverse: If pitches should be played from the highest to the lowest.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        onset = 0
+        for chord in chords:
+            for i in range(chord.get_size()):
+                if reverse:
+                    pitch = chord.get_pitch(chord.get_size() - i - 1)
+                else:
+                    pitch = chord.get_pitch(i)
+                timeline.add_pitch(onset, sound_play_time, pitch)
+                onset += sound_play_time + sound_pause_time
+            onset += chord_pause_time
+        timeline.extend(onset)
+        return timeline
+
+    @staticmethod
+    def _chords_hold(
+        chords:list,
+        sound_delay:float,
+        chord_pause_time:float,
+        reverse:bool
+    ) -> 'Timeline':
+        """
+        Chords with pitches added one after another.
+
+        :chords: List of chords to play.
+        :sound_delay: Delay of next pitch.
+        :chord_pause_time: Length of pause between chords in seconds.
+        :reverse: If pitches should be added from the highest to the lowest.
+
+        :returns: Timeline object.
+        """
+        timeline = Timeline()
+        onset = 0
+        for chord in chords:
+            for i in range(chord.get_size()):
+                if reverse:
+                    pitch = chord.get_pitch(chord.get_size() - i - 1)
+                else:
+                    pitch = chord.get_pitch(i)
+                timeline.add_pitch(
+                    onset + sound_delay*i,
+                    sound_delay*(chord.get_size() - i),
+                    pitch
+                )
+            onset += sound_delay*chord.get_size() + chord_pause_time
+        timeline.extend(onset)
+        return timeline
@@ -6,36 +6,24 @@ from scipy import signal
 
 from notes.pitch import Pitch
 from notes.interval import Interval
+from synthesis.wavetable_synthesizer import WavetableSynthesizer
 
-class TriangleSynthesizer:
-    def __init__(self, sampling_frequency:int):
+class TriangleSynthesizer(WavetableSynthesizer):
+    volume = 0.2
+
+    def __init__(self, sampling_frequency:int, dtype=np.float64):
         """
         Class for sine signal generation.
 
         :sampling_frequency: Sampling rate in hertz.
+        :dtype: Type of generated samples.
         """
-        self._sampling_frequency = sampling_frequency
-
-    def generate_frequency(self, frequency:float, time:float, volume=0.2) -> np.array:
-        """
-        Generate triangle signal of given frequency and length.
+        super().__init__(sampling_frequency, dtype)
 
-        :frequency: Output signal frequency.
-        :time: Length of signal in seconds.
-        :volume: Gain of output signal.
+    @staticmethod
+    def waveform(phase:np.array) -> np.array:
+        return signal.sawtooth(2*np.pi*phase, 0.5)
 
-        :returns: Triangle signal.
-        """
-        assert frequency < 2*self._sampling_frequency, \
-                "[TriangleSynthesizer::generate(" \
-                + str(frequency) \
-                + ", " \
-                + str(time) \
-                + ")] Frequency of the fundamental frequency must be lower than half of sampling frequency!"
-        signal_length = int(self._sampling_frequency*time)
-        
-        time = np.arange(
-            int(self._sampling_frequency*time)
-        ) / self._sampling_frequency
-        triangle_signal = signal.sawtooth(2*np.pi*frequency*time, 0.5)
-        return volume*triangle_signal
+    @staticmethod
+    def spectrum(harmonics:np.array) -> np.array:
+        return np.where(harmonics % 2 == 1, -8/(np.pi*harmonics)**2, 0)
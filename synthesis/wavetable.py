@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+class Wavetable:
+    # Tables already built, shared by all synthesizers
+    _tables = dict()
+
+    def __init__(self, cycle:np.array, interpolation='linear'):
+        """
+        Single cycle of a periodic waveform read with interpolation.
+
+        :cycle: Samples of one period of the waveform. Length must be a power of 2.
+        :interpolation: Interpolation used while reading: 'linear' or 'cubic'.
+        """
+        if interpolation not in ('linear', 'cubic'):
+            raise ValueError(
+                '[Wavetable::__init__()] Unknown interpolation "'\
+                + str(interpolation)\
+                + '"!'
+            )
+        if len(cycle) & (len(cycle) - 1) != 0:
+            raise ValueError(
+                '[Wavetable::__init__()] Table size must be a power of 2!'
+            )
+        self._size = len(cycle)
+        self._interpolation = interpolation
+        self._cycle = np.array(cycle)
+
+        # Difference to the next sample used by linear interpolation
+        self._slope = np.roll(self._cycle, -1) - self._cycle
+
+    @staticmethod
+    def from_waveform(
+        name:str,
+        waveform,
+        interpolation='linear',
+        size=4096,
+        dtype=np.float64
+    ) -> 'Wavetable':
+        """
+        Get table of given waveform. Sampled cycle does not depend
+        on sampling frequency, so tables are built only once and then reused.
+
+        :name: Name of the waveform used for caching.
+        :waveform: Function mapping phase in cycles to waveform values.
+        :interpolation: Interpolation used while reading: 'linear' or 'cubic'.
+        :size: Number of samples in one cycle.
+        :dtype: Type of table samples. Read values have the same type.
+
+        :returns: Wavetable object.
+        """
+        key = (name, interpolation, size, np.dtype(dtype).str)
+        if key not in Wavetable._tables:
+            Wavetable._tables[key] = Wavetable(
+                waveform(np.arange(size) / size).astype(dtype),
+                interpolation
+            )
+        return Wavetable._tables[key]
+
+    def get_size(self) -> int:
+        return self._size
+
+    def get_interpolation(self) -> str:
+        return self._interpolation
+
+    def get_cycle(self) -> np.array:
+        return self._cycle
+
+    def get_slope(self) -> np.array:
+        return self._slope
+
+    def get_wavetable(self, frequency:float) -> 'Wavetable':
+        """
+        Get table for given fundamental frequency.
+        Single table is used for all frequencies.
+
+        :frequency: Fundamental frequency.
+
+        :returns: Wavetable object.
+        """
+        return self
+
+    def read(self, position:np.array) -> np.array:
+        """
+        Read waveform values for given positions.
+
+        :position: Non-negative positions in table samples
+            (phase in cycles multiplied by table size).
+            The array is overwritten.
+
+        :returns: Interpolated waveform values.
+        """
+        return Wavetable._interpolate(
+            self._cycle,
+            self._slope,
+            0,
+            self._size,
+            self._interpolation,
+            position
+        )
+
+    @staticmethod
+    def _interpolate(
+        cycle:np.array,
+        slope:np.array,
+        offset,
+        size:int,
+        interpolation:str,
+        position:np.array
+    ) -> np.array:
+        """
+        Read interpolated values from one table or several joined tables.
+
+        :cycle: Samples of joined tables.
+        :slope: Difference to the next sample of joined tables.
+        :offset: Index of the first sample of the table read by every row of positions.
+        :size: Number of samples in every table.
+        :interpolation: Interpolation used while reading: 'linear' or 'cubic'.
+        :position: Non-negative positions in table samples. The array is overwritten.
+
+        :returns: Interpolated values of the same type as table samples.
+        """
+        # Split position into table index and fraction
+        index = position.astype(np.intp)
+        fraction = position
+        fraction -= index
+        if fraction.dtype != cycle.dtype:
+            fraction = fraction.astype(cycle.dtype)
+        mask = size - 1
+        index &= mask
+
+        if interpolation == 'linear':
+            index += offset
+            result = slope.take(index)
+            result *= fraction
+            result += cycle.take(index)
+            return result
+        else:
+            y0 = cycle.take(((index - 1) & mask) + offset)
+            y1 = cycle.take(index + offset)
+            y2 = cycle.take(((index + 1) & mask) + offset)
+            y3 = cycle.take(((index + 2) & mask) + offset)
+            c1 = 0.5*(y2 - y0)
+            c2 = y0 - 2.5*y1 + 2*y2 - 0.5*y3
+            c3 = 0.5*(y3 - y0) + 1.5*(y1 - y2)
+            return ((c3*fraction + c2)*fraction + c1)*fraction + y1
+
+
+class MipmappedWavetable:
+    # Tables already built, shared by all synthesizers
+    _tables = dict()
+
+    def __init__(self, wavetables:list, lowest_frequency:float):
+        """
+        Set of band-limited wavetables, one for every octave of fundamental frequency.
+
+        :wavetables: Wavetables ordered from the richest to the poorest in harmonics.
+            Table number i is used for fundamentals up to <lowest_frequency>*2^i.
+        :lowest_frequency: The highest fundamental frequency of the first table.
+        """
+        self._wavetables = wavetables
+        self._lowest_frequency = lowest_frequency
+
+    @staticmethod
+    def from_spectrum(
+        name:str,
+        spectrum,
+        sampling_frequency:int,
+        interpolation='linear',
+        size=4096,
+        lowest_frequency=20.0,
+        dtype=np.float64
+    ) -> 'MipmappedWavetable':
+        """
+        Get band-limited tables of given waveform. Every table contains
+        only harmonics below half of sampling frequency for all fundamentals
+        it is used for. Tables are built only once for every sampling frequency
+        and then reused.
+
+        :name: Name of the waveform used for caching.
+        :spectrum: Function mapping harmonic numbers to complex Fourier
+            coefficients (cosine amplitude - 1j*sine amplitude).
+        :sampling_frequency: Sampling rate in hertz.
+        :interpolation: Interpolation used while reading: 'linear' or 'cubic'.
+        :size: Number of samples in one cycle.
+        :lowest_frequency: The highest fundamental frequency of the first table.
+        :dtype: Type of table samples. Read values have the same type.
+
+        :returns: MipmappedWavetable object.
+        """
+        key = (
+            name,
+            sampling_frequency,
+            interpolation,
+            size,
+            lowest_frequency,
+            np.dtype(dtype).str
+        )
+        if key not in MipmappedWavetable._tables:
+            wavetables = list()
+            top_frequency = lowest_frequency
+            harmonics_number = size//2 - 1
+            while harmonics_number > 1:
+                harmonics_number = min(
+                    int(sampling_frequency/2/top_frequency),
+                    size//2 - 1
+                )
+                harmonics_number = max(harmonics_number, 1)
+                coefficients = np.zeros(size//2 + 1, dtype=complex)
+                coefficients[1:harmonics_number + 1] = spectrum(
+                    np.arange(1, harmonics_number + 1)
+                )
+                wavetables.append(Wavetable(
+                    np.fft.irfft(coefficients*size/2, size).astype(dtype),
+                    interpolation
+                ))
+                top_frequency *= 2
+            MipmappedWavetable._tables[key] = MipmappedWavetable(
+                wavetables,
+                lowest_frequency
+            )
+        return MipmappedWavetable._tables[key]
+
+    def get_wavetable(self, frequency:float) -> Wavetable:
+        """
+        Get table without harmonics above half of sampling frequency.
+
+        :frequency: Fundamental frequency.
+
+        :returns: Wavetable object.
+        """
+        level = 0
+        if frequency > self._lowest_frequency:
+            level = int(np.ceil(np.log2(frequency/self._lowest_frequency)))
+        return self._wavetables[min(level, len(self._wavetables) - 1)]
+
+
+class WavetableOscillator:
+    def __init__(
+        self,
+        wavetable:Wavetable,
+        frequency:float,
+        sampling_frequency:int,
+        phase=0.0
+    ):
+        """
+        Phase accumulator reading wavetable with constant frequency.
+        Phase is kept between calls, so signal can be generated block by block.
+
+        :wavetable: Wavetable to read.
+        :frequency: Output signal frequency.
+        :sampling_frequency: Sampling rate in hertz.
+        :phase: Starting phase in cycles.
+        """
+        self._wavetable = wavetable
+        self._increment = frequency / sampling_frequency
+        self._phase = phase
+
+    def get_phase(self) -> float:
+        return self._phase
+
+    def generate(self, length:int) -> np.array:
+        """
+        Generate next samples of the signal.
+
+        :length: Number of samples.
+
+        :returns: Signal.
+        """
+        size = self._wavetable.get_size()
+        position = np.arange(length, dtype=float)
+        position *= self._increment*size
+        position += self._phase*size
+        self._phase = (self._phase + self._increment*length) % 1.0
+        return self._wavetable.read(position)
+
+
+class WaveformOscillator:
+    def __init__(
+        self,
+        waveform,
+        frequency:float,
+        sampling_frequency:int,
+        phase=0.0
+    ):
+        """
+        Phase accumulator evaluating waveform function for every sample.
+        Phase is kept between calls, so signal can be generated block by block.
+
+        :waveform: Function mapping phase in cycles to waveform values.
+        :frequency: Output signal frequency.
+        :sampling_frequency: Sampling rate in hertz.
+        :phase: Starting phase in cycles.
+        """
+        self._waveform = waveform
+        self._increment = frequency / sampling_frequency
+        self._phase = phase
+
+    def get_phase(self) -> float:
+        return self._phase
+
+    def generate(self, length:int) -> np.array:
+        """
+        Generate next samples of the signal.
+
+        :length: Number of samples.
+
+        :returns: Signal.
+        """
+        phase = np.arange(length)*self._increment + self._phase
+        self._phase = (self._phase + self._increment*length) % 1.0
+        return self._waveform(phase)
+
+
+class WavetableOscillatorBank:
+    def __init__(
+        self,
+        wavetables:list,
+        frequencies:np.array,
+        sampling_frequency:int,
+        phases=None
+    ):
+        """
+        Set of phase accumulators reading wavetables with constant frequencies.
+        All voices are generated together as rows of one array.
+        All tables must have the same size and interpolation.
+        Phases are kept between calls, so signals can be generated block by block.
+
+        :wavetables: Wavetable for every voice.
+        :frequencies: Output signal frequency for every voice.
+        :sampling_frequency: Sampling rate in hertz.
+        :phases: Starting phase in cycles for every voice. Zero if not given.
+        """
+        self._increments = np.asarray(frequencies, dtype=float) / sampling_frequency
+        if phases is None:
+            self._phases = np.zeros(len(self._increments))
+        else:
+            self._phases = np.array(phases, dtype=float)
+
+        # Join tables, so that all voices are read with a single indexing
+        self._size = wavetables[0].get_size()
+        self._interpolation = wavetables[0].get_interpolation()
+        self._cycle = np.concatenate([w.get_cycle() for w in wavetables])
+        self._slope = np.concatenate([w.get_slope() for w in wavetables])
+        self._offset = self._size*np.arange(len(wavetables))[:, np.newaxis]
+
+    def get_phases(self) -> np.array:
+        return self._phases
+
+    def generate(self, length:int) -> np.array:
+        """
+        Generate next samples of all signals.
+
+        :length: Number of samples.
+
+        :returns: Array of signals (voices x samples).
+        """
+        position = np.outer(self._increments*self._size, np.arange(length))
+        position += (self._phases*self._size)[:, np.newaxis]
+        self._phases = (self._phases + self._increments*length) % 1.0
+        return Wavetable._interpolate(
+            self._cycle,
+            self._slope,
+            self._offset,
+            self._size,
+            self._interpolation,
+            position
+        )
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import abc
+import concurrent.futures
+import threading
+
+import numpy as np
+
+from synthesis.wavetable import MipmappedWavetable, Wavetable, WaveformOscillator, WavetableOscillator, WavetableOscillatorBank
+
+class WavetableSynthesizer(abc.ABC):
+    # Oscillator used for signal generation:
+    # - 'wavetable' reads precomputed single cycle with phase accumulator
+    #   (band-limited tables chosen by frequency if spectrum is defined),
+    # - 'direct' evaluates waveform function for every sample.
+    oscillator = 'wavetable'
+
+    # Wavetable interpolation: 'linear' or 'cubic'
+    interpolation = 'linear'
+
+    # Function mapping harmonic numbers to complex Fourier coefficients
+    # (cosine amplitude - 1j*sine amplitude) of the waveform.
+    # If defined, band-limited tables are used instead of sampled waveform.
+    spectrum = None
+
+    # Gain of generated signals, so that all waveforms sound equally loud
+    volume = 1.0
+
+    # Number of different signals cached for the same sound
+    render_variants = 1
+
+    # Number of samples generated at once, so that temporary arrays fit in CPU cache
+    block_size = 16384
+
+    # Number of threads generating one long signal in sample range chunks.
+    # NumPy releases GIL in array operations, so chunks are generated concurrently.
+    threads = 1
+
+    # Minimal length of signal in samples generated by several threads
+    thread_min_samples = 2**19
+
+    # Thread pools shared by all synthesizers, by number of threads
+    _thread_pools = dict()
+    _thread_pools_lock = threading.Lock()
+
+    def __init__(self, sampling_frequency:int, dtype=np.float64):
+        """
+        Base class for periodic signal generation.
+
+        :sampling_frequency: Sampling rate in hertz.
+        :dtype: Type of generated samples.
+        """
+        self._sampling_frequency = sampling_frequency
+        self._dtype = np.dtype(dtype)
+        self._wavetable = None
+        if self.oscillator == 'wavetable' and self.spectrum is not None:
+            self._wavetable = MipmappedWavetable.from_spectrum(
+                name=self.__class__.__name__,
+                spectrum=self.spectrum,
+                sampling_frequency=sampling_frequency,
+                interpolation=self.interpolation,
+                dtype=self._dtype
+            )
+        elif self.oscillator == 'wavetable':
+            self._wavetable = Wavetable.from_waveform(
+                name=self.__class__.__name__,
+                waveform=self.waveform,
+                interpolation=self.interpolation,
+                dtype=self._dtype
+            )
+        elif self.oscillator != 'direct':
+            raise ValueError(
+                '[WavetableSynthesizer::__init__()] Unknown oscillator "'\
+                + str(self.oscillator)\
+                + '"!'
+            )
+
+    @staticmethod
+    @abc.abstractmethod
+    def waveform(phase:np.array) -> np.array:
+        """
+        Waveform of the synthesizer.
+
+        :phase: Phase in cycles.
+
+        :returns: Waveform values in range <-1, 1>.
+        """
+
+    def generate_frequency(self, frequency:float, time:float, volume=None) -> np.array:
+        """
+        Generate signal of given frequency and length.
+
+        :frequency: Output signal frequency.
+        :time: Length of signal in seconds.
+        :volume: Gain of output signal. Gain of the waveform is used if None.
+
+        :returns: Signal.
+        """
+        self._check_frequencies('generate_frequency', frequency, time)
+        return self._get_volume(volume)*self._generate_waveform(frequency, time)
+
+    def generate_frequencies(
+        self,
+        frequencies:np.array,
+        time:float,
+        volume=None
+    ) -> np.array:
+        """
+        Generate signals of given frequencies and length all at once.
+
+        :frequencies: Output signal frequency for every voice.
+        :time: Length of signals in seconds.
+        :volume: Gain of output signals. Gain of the waveform is used if None.
+
+        :returns: Array of signals (voices x samples).
+        """
+        self._check_frequencies('generate_frequencies', frequencies, time)
+        return self._get_volume(volume)*self._generate_waveforms(frequencies, time)
+
+    def generate_frequency_blocks(
+        self,
+        frequency:float,
+        time:float,
+        block_size=1024,
+        volume=None
+    ):
+        """
+        Generate signal of given frequency and length block by block.
+        Phase is kept between blocks.
+
+        :frequency: Output signal frequency.
+        :time: Length of signal in seconds.
+        :block_size: Number of samples in every block. The last block may be shorter.
+        :volume: Gain of output signal. Gain of the waveform is used if None.
+
+        :returns: Generator of signal blocks.
+        """
+        self._check_frequencies('generate_frequency_blocks', frequency, time)
+        volume = self._get_volume(volume)
+        for block in self._generate_waveform_blocks(frequency, time, block_size):
+            yield volume*block
+
+    def _get_volume(self, volume) -> float:
+        return self.volume if volume is None else volume
+
+    def _check_frequencies(self, method:str, frequencies, time:float):
+        """
+        Check that fundamental frequencies can be represented.
+
+        :method: Name of the checking method used in error message.
+        :frequencies: Frequency or array of frequencies.
+        :time: Length of signals in seconds.
+        """
+        assert np.max(frequencies) < self._sampling_frequency/2, \
+                "[" + self.__class__.__name__ + "::" + method + "(" \
+                + str(frequencies) \
+                + ", " \
+                + str(time) \
+                + ")] Fundamental frequency must be lower than half of sampling frequency!"
+
+    def create_oscillator(self, frequency:float, phase=0.0):
+        """
+        Create phase accumulator for block-wise generation of given frequency.
+
+        :frequency: Output signal frequency.
+        :phase: Starting phase in cycles.
+
+        :returns: WavetableOscillator object or WaveformOscillator object
+            if no wavetable is used.
+        """
+        if self._wavetable is None:
+            return WaveformOscillator(
+                self.waveform,
+                frequency,
+                self._sampling_frequency,
+                phase
+            )
+        return WavetableOscillator(
+            self._wavetable.get_wavetable(frequency),
+            frequency,
+            self._sampling_frequency,
+            phase
+        )
+
+    def create_oscillator_bank(
+        self,
+        frequencies:np.array,
+        phases=None
+    ) -> WavetableOscillatorBank:
+        """
+        Create phase accumulators for block-wise generation of given frequencies.
+
+        :frequencies: Output signal frequency for every voice.
+        :phases: Starting phase in cycles for every voice. Zero if not given.
+
+        :returns: Oscillator bank object.
+        """
+        if self._wavetable is None:
+            raise RuntimeError(
+                '[WavetableSynthesizer::create_oscillator_bank()] '\
+                + 'Oscillator requires wavetable!'
+            )
+        return WavetableOscillatorBank(
+            [self._wavetable.get_wavetable(f) for f in frequencies],
+            frequencies,
+            self._sampling_frequency,
+            phases
+        )
+
+    def _generate_waveform(self, frequency:float, time:float) -> np.array:
+        """
+        Generate waveform of given frequency and length with chosen oscillator.
+        Long signals are split into chunks generated by several threads,
+        if 'threads' is greater than 1.
+
+        :frequency: Output signal frequency.
+        :time: Length of signal in seconds.
+
+        :returns: Signal in range <-1, 1>.
+        """
+        length = int(self._sampling_frequency*time)
+        result = np.empty(length, dtype=self._dtype)
+        self._run_in_threads(
+            self._generate_waveform_range,
+            (frequency, result),
+            length
+        )
+        return result
+
+    def _generate_waveform_range(
+        self,
+        frequency:float,
+        output:np.array,
+        start:int,
+        stop:int
+    ):
+        """
+        Generate range of samples of waveform to output.
+        Phase of the first sample is computed from its index,
+        so ranges can be generated independently.
+
+        :frequency: Output signal frequency.
+        :output: Signal the samples are written to.
+        :start: Index of the first sample.
+        :stop: Index after the last sample.
+        """
+        if self._wavetable is None:
+            time = np.arange(start, stop) / self._sampling_frequency
+            output[start:stop] = self.waveform(frequency*time)
+            return
+        oscillator = self.create_oscillator(
+            frequency,
+            (frequency*start/self._sampling_frequency) % 1.0
+        )
+        for block_start in range(start, stop, self.block_size):
+            block_stop = min(block_start + self.block_size, stop)
+            output[block_start:block_stop] = oscillator.generate(
+                block_stop - block_start
+            )
+
+    def _run_in_threads(self, function, args:tuple, length:int, voices=1):
+        """
+        Call function for sample ranges of signals.
+        Ranges are processed by several threads if signals are long enough.
+
+        :function: Function taking args followed by start and stop of range.
+        :args: Arguments of the function.
+        :length: Length of signals in samples.
+        :voices: Number of signals generated together.
+        """
+        if self.threads <= 1 or length*voices < self.thread_min_samples:
+            function(*args, 0, length)
+            return
+        with WavetableSynthesizer._thread_pools_lock:
+            thread_pool = WavetableSynthesizer._thread_pools.get(self.threads)
+            if thread_pool is None:
+                thread_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.threads
+                )
+                WavetableSynthesizer._thread_pools[self.threads] = thread_pool
+        chunk = -(-length // self.threads)
+        futures = [
+            thread_pool.submit(function, *args, start, min(start + chunk, length))
+            for start in range(0, length, chunk)
+        ]
+        for future in futures:
+            future.result()
+
+    def _generate_waveform_blocks(
+        self,
+        frequency:float,
+        time:float,
+        block_size:int
+    ):
+        """
+        Generate waveform of given frequency and length block by block.
+        Phase is kept between blocks.
+
+        :frequency: Output signal frequency.
+        :time: Length of signal in seconds.
+        :block_size: Number of samples in every block. The last block may be shorter.
+
+        :returns: Generator of signal blocks in range <-1, 1>.
+        """
+        length = int(self._sampling_frequency*time)
+        oscillator = self.create_oscillator(frequency)
+        for start in range(0, length, block_size):
+            yield oscillator.generate(
+                min(block_size, length - start)
+            ).astype(self._dtype, copy=False)
+
+    def _generate_waveforms(self, frequencies:np.array, time:float) -> np.array:
+        """
+        Generate waveforms of given frequencies and length with chosen oscillator.
+        Long signals are split into chunks generated by several threads,
+        if 'threads' is greater than 1.
+
+        :frequencies: Output signal frequency for every voice.
+        :time: Length of signals in seconds.
+
+        :returns: Array of signals in range <-1, 1> (voices x samples).
+        """
+        length = int(self._sampling_frequency*time)
+        result = np.empty((len(frequencies), length), dtype=self._dtype)
+        self._run_in_threads(
+            self._generate_waveforms_range,
+            (np.asarray(frequencies, dtype=float), result),
+            length,
+            len(frequencies)
+        )
+        return result
+
+    def _generate_waveforms_range(
+        self,
+        frequencies:np.array,
+        output:np.array,
+        start:int,
+        stop:int
+    ):
+        """
+        Generate range of samples of waveforms to output.
+        Phases of the first samples are computed from their index,
+        so ranges can be generated independently.
+
+        :frequencies: Output signal frequency for every voice.
+        :output: Array of signals the samples are written to (voices x samples).
+        :start: Index of the first sample.
+        :stop: Index after the last sample.
+        """
+        if self._wavetable is None:
+            time = np.arange(start, stop) / self._sampling_frequency
+            output[:, start:stop] = self.waveform(np.outer(frequencies, time))
+            return
+        oscillator_bank = self.create_oscillator_bank(
+            frequencies,
+            (frequencies*start/self._sampling_frequency) % 1.0
+        )
+        block_length = max(1, self.block_size // len(frequencies))
+        for block_start in range(start, stop, block_length):
+            block_stop = min(block_start + block_length, stop)
+            output[:, block_start:block_stop] = oscillator_bank.generate(
+                block_stop - block_start
+            )
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from notes.chord_generator import ChordGenerator
+from notes.interval import Interval
+from notes.interval_generator import IntervalGenerator
+from notes.pitch import Pitch
+from notes.scale import Scale
+
+SCALE = Scale.get_shared('31-TET (A=440Hz)')
+LOWEST = Pitch.from_name('C3')
+HIGHEST = Pitch.from_name('C5')
+
+
+def get_scale_cents() -> np.array:
+    return SCALE.get_cents(from_pitch=LOWEST, to_pitch=HIGHEST)
+
+
+def test_generate_intervals_in_range():
+    generator = IntervalGenerator(
+        scale=SCALE,
+        lowest_pitch=LOWEST,
+        highest_pitch=HIGHEST,
+        possible_detune=0,
+        smallest_interval=Interval.from_cents(300),
+        largest_interval=Interval.from_cents(700)
+    )
+    intervals, lower_pitches, higher_pitches = generator.generate_intervals(
+        10000,
+        np.random.default_rng(1)
+    )
+    cents = get_scale_cents()
+    assert np.all(np.isin(lower_pitches.get_cents_from_a(), cents))
+    assert np.all(np.isin(higher_pitches.get_cents_from_a(), cents))
+    assert np.all((300 - 1e-9 <= intervals) & (intervals <= 700 + 1e-9))
+
+    # Every interval of the scale in range is generated
+    assert np.allclose(
+        np.unique(np.round(intervals, 6)),
+        1200/31*np.arange(8, 19)
+    )
+
+def test_generate_intervals_without_second_pitch():
+    generator = IntervalGenerator(
+        scale=SCALE,
+        lowest_pitch=LOWEST,
+        highest_pitch=Pitch.from_name('D3'),
+        smallest_interval=Interval.from_cents(1200),
+        largest_interval=Interval.from_cents(2400)
+    )
+    with pytest.raises(RuntimeError):
+        generator.generate_intervals(10)
+
+
+def test_generate_chords_in_range(monkeypatch):
+    # Several batches
+    monkeypatch.setattr(ChordGenerator, 'BATCH_SIZE', 1000)
+    generator = ChordGenerator(
+        scale=SCALE,
+        lowest_pitch=LOWEST,
+        highest_pitch=HIGHEST,
+        possible_detune=0,
+        smallest_interval=Interval.from_cents(100),
+        largest_interval=Interval.from_cents(1200),
+        chord_size=4
+    )
+    chords = generator.generate_chords(2500, np.random.default_rng(1))
+    assert chords.get_shape() == (2500, 4)
+    chords = chords.get_cents_from_a()
+    assert np.all(np.isin(chords, get_scale_cents()))
+    assert np.all(np.diff(chords, axis=1) >= 100 - 1e-9)
+    assert np.all(chords[:, -1] - chords[:, 0] <= 1200 + 1e-9)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pytest
+
+from notes.chord import Chord
+from notes.pitch import Pitch
+
+
+def test_with_pitch_creates_new_sorted_chord():
+    chord = Chord([Pitch(700.0), Pitch(0.0)])
+    new_chord = chord.with_pitch(Pitch(400.0))
+    assert new_chord.get_pitches() == (Pitch(0.0), Pitch(400.0), Pitch(700.0))
+    assert chord.get_size() == 2
+
+
+def test_chord_cannot_be_changed():
+    chord = Chord([Pitch(0.0)])
+    with pytest.raises(AttributeError):
+        chord._pitches = ()
+
+
+def test_chord_is_hashable_value():
+    chord = Chord([Pitch(0.0), Pitch(400.0)])
+    assert chord == Chord([Pitch(400.0), Pitch(0.0)])
+    assert len({chord, Chord([Pitch(400.0), Pitch(0.0)])}) == 1
+    assert pickle.loads(pickle.dumps(chord)) == chord
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import warnings
+
+import engine
+from exercises.exercise_engine import ExerciseEngine
+
+
+def test_generate_writes_only_json_lines(capsys):
+    exercise_engine = ExerciseEngine(
+        'ten_o_pitches',
+        {'synthesizer_type': 'Noise', 'sampling_frequency': '8000'},
+        seed=1
+    )
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter('always')
+        engine.generate(exercise_engine, 40, True)
+    output = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)['index'] for line in output] == list(range(40))
+
+    # Loud noise clips, which is reported as warning instead of printed
+    assert any(
+        issubclass(warning.category, RuntimeWarning)
+        for warning in caught_warnings
+    )
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy as np
+import pytest
+
+from exercises.example_bank import ExampleBank, ExampleBankWriter
+
+
+def write_bank(directory, signals):
+    with ExampleBankWriter(directory, 'key', 8000, 'float32') as writer:
+        for i, signal in enumerate(signals):
+            writer.add_example(signal, {'value': i}, 'id_' + str(i))
+
+
+def test_bank_round_trip(tmp_path):
+    write_bank(str(tmp_path), [np.ones(3), np.zeros(2)])
+    bank = ExampleBank.find(str(tmp_path), 'key')
+    assert bank.get_size() == 2
+    signal, answer = bank.get_example(0)
+    assert signal.tolist() == [1.0, 1.0, 1.0]
+    assert answer == {'value': 0}
+    assert sorted(os.listdir(str(tmp_path))) == ['key.bin', 'key.json']
+
+
+def test_failed_writing_keeps_previous_bank(tmp_path):
+    write_bank(str(tmp_path), [np.ones(3)])
+    bank = ExampleBank.find(str(tmp_path), 'key')
+    with pytest.raises(RuntimeError):
+        with ExampleBankWriter(str(tmp_path), 'key', 8000, 'float32') as writer:
+            writer.add_example(np.zeros(5), {'value': 1})
+            raise RuntimeError('Interrupted')
+    assert sorted(os.listdir(str(tmp_path))) == ['key.bin', 'key.json']
+    assert ExampleBank.find(str(tmp_path), 'key').get_size() == 1
+
+    # Memory-mapped signals of open bank are not changed by new bank
+    write_bank(str(tmp_path), [np.full(3, 2.0)])
+    assert bank.get_example(0)[0].tolist() == [1.0, 1.0, 1.0]
+    assert ExampleBank.find(str(tmp_path), 'key').get_example(0)[0].tolist()\
+        == [2.0, 2.0, 2.0]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+
+import pytest
+
+from server.exercise_server import ExerciseServer
+
+
+async def send_request(request:bytes) -> (int, dict):
+    server = ExerciseServer(port=0, workers=1)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.get_port())
+        writer.write(request)
+        await writer.drain()
+
+        # Connection is closed after the response
+        response = await reader.read()
+        writer.close()
+    finally:
+        await server.stop()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(body.decode('utf-8'))
+
+
+@pytest.mark.parametrize('headers, status', [
+    ('Content-Length: ' + str(ExerciseServer.MAX_BODY_SIZE + 1) + '\r\n', 413),
+    ('Content-Length: many\r\n', 400),
+    ('Content-Length: -1\r\n', 400)
+])
+def test_invalid_request_gets_response(headers, status):
+    request = ('POST /sessions HTTP/1.1\r\n' + headers + '\r\n').encode('latin-1')
+    assert asyncio.run(send_request(request))[0] == status
+
+
+def test_unexpected_error_gets_response(monkeypatch):
+    async def fail(self, data):
+        raise ZeroDivisionError('failure')
+    monkeypatch.setattr(ExerciseServer, '_create_session', fail)
+    body = b'{"exercise": "voices"}'
+    status, response = asyncio.run(send_request(
+        b'POST /sessions HTTP/1.1\r\nConnection: close\r\n'\
+        + b'Content-Length: ' + str(len(body)).encode('latin-1') + b'\r\n\r\n'\
+        + body
+    ))
+    assert status == 500
+    assert response['error'] == 'failure'
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from synthesis.noise_synthesizer import NoiseSynthesizer
+
+
+def test_voices_use_separate_parts_of_noise_pool(monkeypatch):
+    monkeypatch.setattr(NoiseSynthesizer, 'noise_pool_time', 1)
+    synthesizer = NoiseSynthesizer(8000)
+    noise = synthesizer._get_white_noise(1000, 4)
+    assert noise.shape == (4, 1000)
+    assert not noise.flags.writeable
+    assert len(np.unique(noise)) == noise.size
+
+    # Noise longer than the pool is generated
+    assert synthesizer._get_white_noise(4000, 2).flags.writeable
+
+
+def test_voices_generated_together_match_single_voices():
+    synthesizer = NoiseSynthesizer(8000)
+    frequencies = np.array([220.0, 440.0])
+    np.random.seed(1)
+    signals = synthesizer.generate_frequencies(frequencies, 0.5)
+    np.random.seed(1)
+    assert np.allclose(
+        signals,
+        [synthesizer.generate_frequency(frequency, 0.5) for frequency in frequencies]
+    )
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from notes.pitch import Pitch
+from notes.pitch_array import PitchArray
+
+NAMES = ['C0', 'A4', 'C#4', 'B8']
+
+
+def test_conversions_match_pitch():
+    pitches = [Pitch.from_name(name, detune=3.5) for name in NAMES]
+    array = PitchArray.from_names(NAMES, detune=3.5)
+    assert np.allclose(
+        array.get_cents_from_a(),
+        [pitch.get_cents_from_a() for pitch in pitches]
+    )
+    assert np.allclose(
+        array.get_frequencies(),
+        [pitch.get_frequency() for pitch in pitches]
+    )
+    midi_pitches, detunes = array.get_midi_pitches()
+    assert midi_pitches.tolist() == [pitch.get_midi_pitch()[0] for pitch in pitches]
+    assert np.allclose(detunes, [pitch.get_midi_pitch()[1] for pitch in pitches])
+    assert array.get_pitches() == pitches
+
+
+def test_midi_detune_boundaries():
+    # Detune is in range <-50, 50)
+    midi_pitches, detunes = PitchArray([-50.0, 49.999, 50.0]).get_midi_pitches()
+    assert midi_pitches.tolist() == [69, 69, 70]
+    assert np.allclose(detunes, [-50.0, 49.999, -50.0])
+
+
+def test_frequencies_round_trip():
+    frequencies = np.array([27.5, 440.0, 1000.0])
+    array = PitchArray.from_frequencies(frequencies)
+    assert np.allclose(array.get_frequencies(), frequencies)
+    assert np.allclose(PitchArray.from_midi([21, 69]).get_frequencies(), [27.5, 440.0])
+
+
+def test_indexing_and_immutability():
+    array = PitchArray([[0.0, 100.0], [200.0, 300.0]])
+    assert array.get_shape() == (2, 2)
+    assert array[1, 0] == Pitch(200.0)
+    assert array[0].get_cents_from_a().tolist() == [0.0, 100.0]
+    assert len(array) == 2
+    with pytest.raises(ValueError):
+        array.get_cents_from_a()[0, 0] = 1.0
+    assert array.copy(detune=10).get_cents_from_a()[0, 0] == 10.0
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+
+import numpy as np
+import pytest
+
+from synthesis.render_cache import RenderCache
+from synthesis.synthesizer import Synthesizer
+
+
+def signal(length:int) -> np.array:
+    return np.zeros(length, dtype=np.float64)
+
+
+def test_least_recently_used_signal_is_evicted():
+    cache = RenderCache(max_bytes=3*80)
+    for key in 'abc':
+        cache.put(key, signal(10))
+    cache.get('a')
+    cache.put('d', signal(10))
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert len(cache) == 3
+    assert cache.get_bytes() == 3*80
+
+
+def test_signals_larger_than_cache_are_not_cached():
+    cache = RenderCache(max_bytes=80)
+    cache.put('a', signal(10))
+    large = cache.put('b', signal(11))
+    assert not large.flags.writeable
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+
+
+def test_replaced_and_shrunk_signals_are_counted():
+    cache = RenderCache(max_bytes=1000)
+    cache.put('a', signal(10))
+    cache.put('a', signal(20))
+    assert cache.get_bytes() == 160
+    cache.put('b', signal(50))
+    cache.set_max_bytes(400)
+    assert cache.get('a') is None
+    assert cache.get_bytes() == 400
+    assert cache.get_hits() == 0
+    assert cache.get_misses() == 1
+
+
+def test_cached_signals_are_read_only():
+    cache = RenderCache()
+    cached = cache.put('a', signal(10))
+    with pytest.raises(ValueError):
+        cached[0] = 1.0
+
+
+def test_synthesizer_keeps_cache_and_global_random_state():
+    synthesizer = Synthesizer(8000)
+    synthesizer.generate_frequency(440.0, 0.1)
+    state = random.getstate()
+    synthesizer.generate_frequency(440.0, 0.1)
+    assert random.getstate() == state
+    assert synthesizer.get_render_cache().get_hits() == 1
+
+    # Changing settings does not drop cached signals of other settings
+    synthesizer.set_volume(0.5)
+    synthesizer.set_sampling_frequency(16000)
+    assert len(synthesizer.get_render_cache()) == 1
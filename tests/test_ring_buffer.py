@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from synthesis.ring_buffer import RingBuffer
+
+
+@pytest.mark.parametrize('capacity', [0, 3, 12])
+def test_capacity_must_be_power_of_two(capacity):
+    with pytest.raises(ValueError):
+        RingBuffer(capacity)
+
+
+def test_write_is_limited_by_free_space():
+    buffer = RingBuffer(8)
+    assert buffer.write(np.arange(10.0)) == 8
+    assert buffer.get_free() == 0
+    assert buffer.write(np.arange(1.0)) == 0
+
+
+def test_read_is_limited_by_available_samples():
+    buffer = RingBuffer(8)
+    buffer.write(np.arange(3.0))
+    output = np.full(5, -1.0)
+    assert buffer.read(output) == 3
+    assert output.tolist() == [0.0, 1.0, 2.0, -1.0, -1.0]
+    assert buffer.get_available() == 0
+
+
+def test_samples_wrap_around_end_of_buffer():
+    buffer = RingBuffer(8)
+    output = np.zeros(8)
+    written = list()
+    read = list()
+    value = 0.0
+    for length in [5, 6, 7, 3, 8]:
+        signal = value + np.arange(length, dtype=float)
+        value += length
+        written += signal.tolist()
+        assert buffer.write(signal) == length
+        length = buffer.read(output)
+        read += output[:length].tolist()
+    assert read == written
+    assert buffer.get_available() == 0
+
+
+def test_clear_drops_available_samples():
+    buffer = RingBuffer(8, np.int16)
+    buffer.write(np.arange(6, dtype=np.int16))
+    buffer.clear()
+    assert buffer.get_available() == 0
+    assert buffer.get_free() == 8
+    buffer.write(np.array([7, 8, 9], dtype=np.int16))
+    output = np.zeros(3, dtype=np.int16)
+    buffer.read(output)
+    assert output.tolist() == [7, 8, 9]
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy as np
+import pytest
+
+from exercises.exercise_settings import ExerciseSettings
+from notes.scala_library import ScalaLibrary
+
+PENTATONIC_SCALE = '''! pentatonic.scl
+!
+Pentatonic scale
+ 5
+!
+ 9/8
+ 204.0 cents
+ 3/2
+ 1.6875e0
+ 2
+'''
+
+KEYBOARD_MAPPING = '''! pentatonic.kbm
+ 5
+ 0
+ 127
+ 60
+ 69
+ 432.0
+ 5
+! mapping
+ 0
+ x
+ 2
+ 3
+'''
+
+
+def write_file(path, text):
+    with open(path, 'w') as output_file:
+        output_file.write(text)
+
+
+def test_read_scale_file(tmp_path):
+    path = str(tmp_path/'pentatonic.scl')
+    write_file(path, PENTATONIC_SCALE)
+    description, degrees = ScalaLibrary.read_scale_file(path)
+    assert description == 'Pentatonic scale'
+    assert degrees == pytest.approx([203.910, 204.0, 701.955, 1.6875, 1200.0], abs=1e-3)
+
+
+@pytest.mark.parametrize('text', [
+    'Missing notes\n',
+    'Invalid number of notes\nfive\n100.0\n',
+    'Too few pitches\n3\n100.0\n2/1\n',
+    'Invalid ratio\n2\n3/0\n2/1\n',
+    'Negative period\n1\n-1200.0\n'
+])
+def test_read_invalid_scale_file(tmp_path, text):
+    path = str(tmp_path/'invalid.scl')
+    write_file(path, text)
+    with pytest.raises(ValueError):
+        ScalaLibrary.read_scale_file(path)
+
+
+def test_read_keyboard_mapping_file(tmp_path):
+    path = str(tmp_path/'pentatonic.kbm')
+    write_file(path, KEYBOARD_MAPPING)
+    mapping = ScalaLibrary.read_keyboard_mapping_file(path)
+    assert mapping['size'] == 5
+    assert mapping['middle_note'] == 60
+    assert mapping['reference_note'] == 69
+    assert mapping['reference_frequency'] == 432.0
+    assert mapping['octave_degree'] == 5
+
+    # Missing keys are unmapped
+    assert mapping['map'] == [0, None, 2, 3, None]
+
+
+def test_create_scale_without_mapping():
+    scale = ScalaLibrary.create_scale([100.0*i for i in range(1, 13)])
+    cents = [pitch.get_cents_from_a() for pitch in scale.get_base_pitches()]
+    assert cents == pytest.approx([-900.0 + 100*i for i in range(12)])
+    assert scale.get_period() == 1200.0
+
+
+def test_create_scale_with_reference_frequency():
+    mapping = {
+        'size': 12,
+        'first_note': 0,
+        'last_note': 127,
+        'middle_note': 60,
+        'reference_note': 69,
+        'reference_frequency': 432.0,
+        'octave_degree': 12,
+        'map': list(range(12))
+    }
+    scale = ScalaLibrary.create_scale([100.0*i for i in range(1, 13)], mapping)
+    cents = [pitch.get_cents_from_a() for pitch in scale.get_base_pitches()]
+
+    # A4 is tuned to reference frequency
+    assert cents[9] == pytest.approx(1200*np.log2(432/440))
+
+
+def test_index_is_not_written_to_library(tmp_path):
+    library_directory = tmp_path/'scales'
+    library_directory.mkdir()
+    write_file(str(library_directory/'pentatonic.scl'), PENTATONIC_SCALE)
+    index_path = str(tmp_path/'cache'/'index.json')
+
+    library = ScalaLibrary(str(library_directory), index_path)
+    assert library.get_scale_types() == ['Scala: pentatonic']
+    assert library.get_scale('pentatonic').get_size() == 5
+    assert os.listdir(str(library_directory)) == ['pentatonic.scl']
+    assert os.path.isfile(index_path)
+
+    # Index is reused by new library
+    assert ScalaLibrary(str(library_directory), index_path)._read_index().keys()\
+        == {'pentatonic'}
+
+
+def test_index_write_failure_is_not_fatal(tmp_path):
+    library_directory = tmp_path/'scales'
+    library_directory.mkdir()
+    write_file(str(library_directory/'pentatonic.scl'), PENTATONIC_SCALE)
+
+    # Index directory cannot be created inside a file
+    write_file(str(tmp_path/'file'), '')
+    library = ScalaLibrary(
+        str(library_directory),
+        str(tmp_path/'file'/'index.json')
+    )
+    assert library.get_names() == ['pentatonic']
+
+
+def test_default_index_path_is_in_cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    index_path = ScalaLibrary.get_index_path('scales')
+    assert index_path.startswith(
+        os.path.join(str(tmp_path), ScalaLibrary.CACHE_DIRECTORY_NAME)
+    )
+    assert index_path != ScalaLibrary.get_index_path('other_scales')
+
+
+def test_exercise_settings_use_changed_library_directory(tmp_path, monkeypatch):
+    library_directory = tmp_path/'scales'
+    library_directory.mkdir()
+    write_file(str(library_directory/'pentatonic.scl'), PENTATONIC_SCALE)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path/'cache'))
+    monkeypatch.setattr(ExerciseSettings, 'SCALA_DIRECTORY', str(library_directory))
+
+    assert 'Scala: pentatonic' in ExerciseSettings.get_scale_types()
+    assert ExerciseSettings.get_scale('Scala: pentatonic').get_size() == 5
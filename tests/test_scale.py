@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from notes.pitch import Pitch
+from notes.scale import Scale
+
+
+def test_range_includes_both_boundaries():
+    scale = Scale.get_shared('12-TET (A=440Hz)')
+    cents = scale.get_cents(Pitch.from_name('C4'), Pitch.from_name('C5'))
+    assert cents.tolist() == [-900.0 + 100*i for i in range(13)]
+
+
+def test_range_between_pitches_of_the_scale():
+    scale = Scale.get_shared('12-TET (A=440Hz)')
+    cents = scale.get_cents(Pitch(-0.5), Pitch(150.0))
+    assert cents.tolist() == [0.0, 100.0]
+    assert len(scale.get_cents(Pitch(10.0), Pitch(90.0))) == 0
+
+
+def test_range_is_limited_to_midi_pitches():
+    scale = Scale.get_shared('12-TET (A=440Hz)')
+    cents = scale.get_cents(Pitch(-10000.0), Pitch(10000.0))
+    assert cents[0] == Scale.LOWEST_CENTS
+    assert cents[-1] == Scale.HIGHEST_CENTS
+    assert len(cents) == 128
+
+
+def test_detune_moves_range_and_pitches():
+    scale = Scale.get_shared('12-TET (A=440Hz)')
+    cents = scale.get_cents(Pitch(0.0), Pitch(200.0), detune=10.0)
+    assert cents.tolist() == [10.0, 110.0]
+
+
+def test_index_is_read_only_view():
+    scale = Scale.get_shared('12-TET (A=440Hz)')
+    cents = scale.get_cents(Pitch(0.0), Pitch(200.0))
+    with pytest.raises(ValueError):
+        cents[0] = 1.0
+
+
+def test_scale_with_other_period():
+    scale = Scale.from_cents([0.0, 500.0], period=1900.0)
+    cents = scale.get_cents(Pitch(-1900.0), Pitch(1900.0))
+    assert cents.tolist() == [-1900.0, -1400.0, 0.0, 500.0, 1900.0]
+    assert scale.get_size() == 2
+
+
+def test_changed_scale_is_indexed_again():
+    scale = Scale.from_cents([0.0])
+    assert scale.get_cents(Pitch(0.0), Pitch(1000.0)).tolist() == [0.0]
+    scale.add_pitch(Pitch(700.0))
+    assert scale.get_cents(Pitch(0.0), Pitch(1000.0)).tolist() == [0.0, 700.0]
+    scale.set_detune(20.0)
+    assert np.allclose(scale.get_cents(Pitch(0.0), Pitch(1000.0)), [20.0, 720.0])
+
+
+def test_shared_scale_cannot_be_changed():
+    scale = Scale.get_shared('12-TET (A=440Hz)')
+    assert scale is Scale.get_shared('12-TET (A=440Hz)')
+    with pytest.raises(RuntimeError):
+        scale.add_pitch(Pitch(50.0))
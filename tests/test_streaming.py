@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+import synthesis.player
+from exercises.exercise_settings import ExerciseSettings
+
+
+class FakeOutputStream:
+    def __init__(self, samplerate, blocksize, channels, dtype, callback):
+        self.active = False
+
+    def start(self):
+        self.active = True
+
+    def close(self):
+        self.active = False
+
+
+class FakeSoundDevice:
+    OutputStream = FakeOutputStream
+
+    def play(self, signal, sampling_frequency):
+        pass
+
+    def stop(self):
+        pass
+
+
+def test_streaming_setting():
+    assert not ExerciseSettings.create_exercise('intervals').is_streaming()
+    assert ExerciseSettings.create_exercise(
+        'intervals',
+        {'streaming': 'Yes'}
+    ).is_streaming()
+
+    # Playback settings are not stored with examples
+    assert 'streaming' not in ExerciseSettings.get_settings(
+        'intervals',
+        {'streaming': 'Yes'}
+    )
+
+
+def test_streamed_example_matches_rendered_example(monkeypatch):
+    monkeypatch.setattr(synthesis.player, 'sd', FakeSoundDevice())
+    exercise = ExerciseSettings.create_exercise(
+        'ten_o_pitches',
+        {'sampling_frequency': '8000', 'streaming': 'Yes'}
+    )
+    exercise.set_example_answer({'pitch': -900.0})
+    expected = exercise.get_synthesizer().generate_timeline(
+        exercise.get_example_timeline()
+    )
+
+    # Whole example fits in the buffer, so it is written without any reads
+    player = exercise._player
+    exercise.play_example()
+    player._producer.join()
+
+    # Pull samples like output stream does
+    outdata = np.zeros((256, 1), dtype='float32')
+    played = list()
+    while player._ring_buffer.get_available() > 0:
+        length = min(len(outdata), player._ring_buffer.get_available())
+        player._callback(outdata, len(outdata), None, None)
+        played.append(outdata[:length, 0].copy())
+    played = np.concatenate(played)
+
+    assert len(played) == len(expected)
+    assert np.allclose(played, expected, atol=1e-6)
+
+
+def test_playback_applies_settings_changed_during_preparation(monkeypatch):
+    monkeypatch.setattr(synthesis.player, 'sd', FakeSoundDevice())
+    exercise = ExerciseSettings.create_exercise(
+        'ten_o_pitches',
+        {'sampling_frequency': '8000', 'streaming': 'No'}
+    )
+    prepared_example = exercise.prepare_example()
+
+    # Prepared signal keeps settings it was rendered with
+    exercise.set_sampling_frequency(16000)
+    assert len(prepared_example.get_signal()) % 8000 == 0
+    assert exercise._player.get_sampling_frequency() == 8000
+
+    exercise.set_prepared_example(prepared_example)
+    exercise.play_example(memory_flush=not prepared_example.has_memory_flush())
+    assert exercise._player.get_sampling_frequency() == 16000
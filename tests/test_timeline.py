@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+
+import numpy as np
+import pytest
+
+from notes.chord import Chord
+from notes.pitch import Pitch
+from synthesis.synthesizer import Synthesizer
+from synthesis.timeline import Timeline
+
+LOWER = Pitch(-900.0)
+HIGHER = Pitch(-500.0)
+CHORDS = [
+    Chord([Pitch(-900.0), Pitch(-500.0)]),
+    Chord([Pitch(-700.0), Pitch(-200.0)])
+]
+
+
+def get_notes(timeline):
+    return [
+        (event.get_onset(), event.get_duration(), event.get_cents())
+        for event in timeline.get_events()
+    ]
+
+
+@pytest.mark.parametrize('builder, notes, duration', [
+    (Timeline.interval_up, [(0, 0.4, -900.0), (0.6, 0.4, -500.0)], 1.0),
+    (Timeline.interval_down, [(0, 0.4, -500.0), (0.6, 0.4, -900.0)], 1.0),
+    (
+        Timeline.interval_up_hold,
+        [(0, 0.5, -900.0), (0.5, 0.5, -900.0), (0.5, 0.5, -500.0)],
+        1.0
+    ),
+    (
+        Timeline.interval_down_hold,
+        [(0, 0.5, -500.0), (0.5, 0.5, -900.0), (0.5, 0.5, -500.0)],
+        1.0
+    ),
+    (Timeline.interval_together, [(0, 1, -900.0), (0, 1, -500.0)], 1.0)
+])
+def test_interval_builders(builder, notes, duration):
+    timeline = builder(LOWER, HIGHER)
+    assert np.allclose(get_notes(timeline), notes)
+    assert timeline.get_duration() == pytest.approx(duration)
+
+
+@pytest.mark.parametrize('builder, notes, duration', [
+    (
+        Timeline.chords_up,
+        [(0, 0.4, -900.0), (0.4, 0.4, -500.0), (0.8, 0.4, -700.0), (1.2, 0.4, -200.0)],
+        1.6
+    ),
+    (
+        Timeline.chords_down,
+        [(0, 0.4, -500.0), (0.4, 0.4, -900.0), (0.8, 0.4, -200.0), (1.2, 0.4, -700.0)],
+        1.6
+    ),
+    (
+        Timeline.chords_up_hold,
+        [(0, 0.8, -900.0), (0.4, 0.4, -500.0), (0.8, 0.8, -700.0), (1.2, 0.4, -200.0)],
+        1.6
+    ),
+    (
+        Timeline.chords_down_hold,
+        [(0, 0.8, -500.0), (0.4, 0.4, -900.0), (0.8, 0.8, -200.0), (1.2, 0.4, -700.0)],
+        1.6
+    ),
+    (
+        Timeline.chords_together,
+        [(0, 0.8, -900.0), (0, 0.8, -500.0), (0.8, 0.8, -700.0), (0.8, 0.8, -200.0)],
+        1.6
+    )
+])
+def test_chords_builders(builder, notes, duration):
+    timeline = builder(CHORDS)
+    assert np.allclose(get_notes(timeline), notes)
+    assert timeline.get_duration() == pytest.approx(duration)
+
+
+def test_chord_pause_extends_timeline():
+    timeline = Timeline.chords_up(CHORDS, chord_pause_time=0.5)
+    assert timeline.get_events()[2].get_onset() == pytest.approx(1.3)
+    assert timeline.get_duration() == pytest.approx(2.6)
+
+
+def test_memory_flush_is_seeded_and_in_range():
+    lowest = Pitch.from_name('C3')
+    highest = Pitch.from_name('C5')
+    timeline = Timeline.memory_flush(lowest, highest, rng=random.Random(1))
+    assert get_notes(timeline) == get_notes(
+        Timeline.memory_flush(lowest, highest, rng=random.Random(1))
+    )
+    assert 8 <= len(timeline.get_events()) <= 12
+    for i, event in enumerate(timeline.get_events()):
+        assert event.get_onset() == pytest.approx(0.2*i)
+        assert lowest.get_frequency() <= event.get_frequency() <= highest.get_frequency()
+
+
+def test_add_timeline_moves_events():
+    timeline = Timeline()
+    timeline.add_pitch(0, 0.5, LOWER)
+    timeline.add_timeline(Timeline.interval_up(LOWER, HIGHER), 1.5)
+    assert np.allclose(
+        get_notes(timeline)[1:],
+        [(1.5, 0.4, -900.0), (2.1, 0.4, -500.0)]
+    )
+    assert timeline.get_duration() == pytest.approx(2.5)
+
+
+def test_rendered_timeline_has_sounds_in_place():
+    sampling_frequency = 8000
+    synthesizer = Synthesizer(sampling_frequency)
+    signal = synthesizer.generate_timeline(Timeline.interval_up(LOWER, HIGHER))
+    assert len(signal) == sampling_frequency
+
+    # Pause between sounds is silent
+    pause = signal[int(0.45*sampling_frequency):int(0.55*sampling_frequency)]
+    assert np.all(pause == 0)
+    assert np.any(signal[:int(0.4*sampling_frequency)] != 0)
+    assert np.any(signal[int(0.6*sampling_frequency):] != 0)
+
+
+def test_memory_flush_is_not_cached():
+    synthesizer = Synthesizer(8000)
+    timeline = Timeline.memory_flush(Pitch.from_name('C3'), Pitch.from_name('C5'))
+    timeline.add_timeline(Timeline.interval_up(LOWER, HIGHER), timeline.get_duration())
+    signal = synthesizer.generate_timeline(timeline)
+    assert len(synthesizer.get_render_cache()) == 2
+    assert np.allclose(
+        np.concatenate(list(synthesizer.generate_timeline_blocks(timeline))),
+        signal
+    )
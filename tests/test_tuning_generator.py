@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from notes.tuning_generator import TuningGenerator
+
+
+def test_edo_with_reference_frequency():
+    cents, period = TuningGenerator.get_tuning('1000-EDO (A=432Hz)')
+    assert period == 1200.0
+    assert len(cents) == 1000
+    assert cents[0] == pytest.approx(1200*np.log2(432/440))
+    assert cents[1] - cents[0] == pytest.approx(1.2)
+
+
+def test_reference_frequency_is_optional():
+    cents, period = TuningGenerator.get_tuning('19-EDO')
+    assert np.allclose(cents, 1200/19*np.arange(19))
+    cents, period = TuningGenerator.get_tuning('5-limit JI')
+    assert np.allclose(
+        cents,
+        1200*np.log2([1, 6/5, 5/4, 4/3, 3/2, 8/5, 5/3])
+    )
+
+
+def test_temperament_uses_its_period():
+    cents, period = TuningGenerator.get_tuning('Bohlen-Pierce[13] (A=440Hz)')
+    assert period == 1901.955
+    assert len(cents) == 13
+    assert np.all(np.diff(cents) > 0)
+    assert np.all((0 <= cents) & (cents < period))
+
+
+def test_offered_scale_types_are_parsed():
+    for scale_type in TuningGenerator.get_scale_types():
+        cents, period = TuningGenerator.get_tuning(scale_type)
+        assert len(cents) > 0
+        assert not cents.flags.writeable
+
+
+@pytest.mark.parametrize('scale_type', [
+    'EDO',
+    '12-EDO (A=0Hz)',
+    '12-EDO (A=440Hz',
+    'Meantone[13] (A=440Hz)',
+    '12-TET (A=440Hz)'
+])
+def test_unknown_scale_types(scale_type):
+    with pytest.raises(RuntimeError):
+        TuningGenerator.get_tuning(scale_type)
+
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        TuningGenerator.get_tuning('0-EDO')
+    with pytest.raises(ValueError):
+        TuningGenerator.get_tuning('0-limit JI')
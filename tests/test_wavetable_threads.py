@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from synthesis.saw_synthesizer import SawSynthesizer
+from synthesis.sine_synthesizer import SineSynthesizer
+from synthesis.triangle_synthesizer import TriangleSynthesizer
+
+
+@pytest.mark.parametrize('synthesizer_class', [
+    SineSynthesizer,
+    TriangleSynthesizer,
+    SawSynthesizer
+])
+def test_chunks_of_threads_match_one_thread(synthesizer_class):
+    synthesizer = synthesizer_class(8000, np.float64)
+    frequency = synthesizer.generate_frequency(440.0, 1.01)
+    frequencies = synthesizer.generate_frequencies(np.array([110.0, 330.0]), 1.01)
+
+    # Chunks of uneven length are generated by every thread
+    synthesizer.threads = 3
+    synthesizer.thread_min_samples = 0
+    assert np.allclose(synthesizer.generate_frequency(440.0, 1.01), frequency)
+    assert np.allclose(
+        synthesizer.generate_frequencies(np.array([110.0, 330.0]), 1.01),
+        frequencies
+    )
+
+
+@pytest.mark.parametrize('synthesizer_class, volume', [
+    (SineSynthesizer, 0.4),
+    (TriangleSynthesizer, 0.2),
+    (SawSynthesizer, 0.2)
+])
+def test_frequencies_are_generated_with_waveform_volume(synthesizer_class, volume):
+    synthesizer = synthesizer_class(8000, np.float64)
+    signal = synthesizer.generate_frequency(440.0, 0.5)
+    assert np.allclose(synthesizer.generate_frequency(440.0, 0.5, volume=1.0)*volume, signal)
+    assert np.allclose(synthesizer.generate_frequencies(np.array([440.0]), 0.5)[0], signal)
+    assert np.allclose(
+        np.concatenate(list(synthesizer.generate_frequency_blocks(440.0, 0.5))),
+        signal
+    )
+
+    # Frequencies above half of sampling frequency cannot be represented
+    with pytest.raises(AssertionError):
+        synthesizer.generate_frequency(4000.0, 0.5)